@@ -11,71 +11,107 @@ translated through behavioral and motion layers.
 """
 
 from flask import Flask, render_template, request, jsonify, send_from_directory, Response
+from werkzeug.http import parse_accept_header
+from werkzeug.middleware.dispatcher import DispatcherMiddleware
 import threading
 import time
 import json
+import io
+import gzip
+import hmac
+import operator
+import re
+import shutil
+import sys
+import weakref
+import zlib
 from datetime import datetime
-import requests
 from src.config import Config
+from src.json_provider import ORJSON_AVAILABLE, ORJSONProvider, dumps_bytes
 import psutil
 from src.voicemanager import VoiceManager
-from src.stt_manager import MistralSTTManager
+from src.stt_manager import ClientChannel, MistralSTTManager
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
 from flask_httpauth import HTTPBasicAuth
 from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
-from functools import wraps
-from queue import Queue
+from limits.storage import MemoryStorage
+import functools
+from functools import wraps, lru_cache
+from queue import SimpleQueue
+from collections import OrderedDict, deque
+from itertools import count, islice
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
 
 # Import new embodied agent layers
 from src.virtual_body import (
     VirtualWorld, BodyState, WorldState, CognitiveState, BodyCommand,
     analyze_user_message_for_world_cues
 )
-from src.cognitive_layer import CognitiveEngine, extract_memory_from_message
+from src.cognitive_layer import CognitiveEngine, extract_memory_from_message, http_session
 from src.behavioral_layer import BehaviorArbiter, describe_behavior_library
 from src.motion_controller import MotionController, HardwareStateValidator
 from src.vision_system import VisionSystem
+from src.time_awareness import now_iso, now_log_ts
 from src.notification_manager import NotificationManager
 
 # Import autonomous agent components
 from src.sandbox_manager import SandboxManager
 from src.agent_logic import AgentLogic
 import src.agent_ai_helpers as agent_ai_helpers
+from src.email_manager import get_email_manager
+from src.git_manager import get_git_manager
 
 # Import monitoring service
 try:
     from src.monitoring_service import get_monitoring_service
     monitoring = get_monitoring_service()
+    collector = monitoring.get_collector()  # Singleton, bound once for every call site
     MONITORING_ENABLED = True
 except ImportError:
     MONITORING_ENABLED = False
     monitoring = None
+    collector = None
 
 
-app = Flask(__name__, template_folder='src/templates')
-config = Config()
+class _NoopCollector:
+    """Stands in for the metrics collector when monitoring is unavailable"""
 
+    def _noop(self, *args, **kwargs):
+        pass
 
-# ============================================================================
-# MONITORING - Global request tracking
-# ============================================================================
+    queue_api_response = queue_message_pipeline = _noop
+    record_llm_request = record_system_delay = record_error = _noop
+    update_system_status = _noop
 
-@app.before_request
-def before_request_monitoring():
-    """Track request start time for all API endpoints"""
-    if MONITORING_ENABLED and request.path.startswith('/api/'):
-        request._monitoring_start_time = time.time()
 
-@app.after_request
-def after_request_monitoring(response):
-    """Record metrics for all API endpoints"""
-    if MONITORING_ENABLED and request.path.startswith('/api/') and hasattr(request, '_monitoring_start_time'):
-        duration_ms = (time.time() - request._monitoring_start_time) * 1000
-        monitoring.get_collector().record_api_response(request.path, duration_ms, response.status_code)
-    return response
+if collector is None:
+    # Call sites record unconditionally; without monitoring every call is a no-op
+    collector = _NoopCollector()
+
+# Optional CBOR encoder for binary vision endpoints
+try:
+    import cbor2
+    CBOR_AVAILABLE = True
+except ImportError:
+    CBOR_AVAILABLE = False
+
+
+def sse_frame(message) -> bytes:
+    """Encode a message as a ready-to-send SSE data frame"""
+    return b"data: " + dumps_bytes(message) + b"\n\n"
+
+
+app = Flask(__name__, template_folder='src/templates')
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
+config = Config()
 
 
 # ============================================================================
@@ -86,35 +122,345 @@ def after_request_monitoring(response):
 auth = HTTPBasicAuth()
 
 # API credentials (should be in .env in production)
-API_USERNAME = os.getenv("API_USERNAME", "admin")
+API_USERNAME = sys.intern(os.getenv("API_USERNAME", "admin"))
 API_PASSWORD = os.getenv("API_PASSWORD", "assaultron_dev_2026")
+_API_USERNAME_B = API_USERNAME.encode('utf-8')
+_API_PASSWORD_B = API_PASSWORD.encode('utf-8')
+_MAX_INTERNED_USERNAME = 64
 
 @auth.verify_password
 def verify_password(username, password):
-    """Verify API credentials"""
-    if username == API_USERNAME and password == API_PASSWORD:
-        return username
-    return None
+    """Verify API credentials (constant-time compare)"""
+    password_b = (password or '').encode('utf-8')
+
+    # Fast path: an interned match of the (non-secret) username is a pointer
+    # compare; the password is always checked in constant time
+    if username and len(username) <= _MAX_INTERNED_USERNAME:
+        username = sys.intern(username)
+        if username is API_USERNAME:
+            return username if hmac.compare_digest(password_b, _API_PASSWORD_B) else None
+
+    # Bitwise & so both digests are always compared - no short-circuit timing leak
+    ok = hmac.compare_digest((username or '').encode('utf-8'), _API_USERNAME_B) & \
+        hmac.compare_digest(password_b, _API_PASSWORD_B)
+    return username if ok else None
+
+# Constant rejection bodies, serialized once instead of per 401/429
+_UNAUTHORIZED_BODY = json.dumps({"error": "Unauthorized access"}).encode('utf-8')
+_RATE_LIMITED_BODY = json.dumps({"error": "Rate limit exceeded"}).encode('utf-8')
 
 @auth.error_handler
 def auth_error(status):
     """Return JSON error for auth failures"""
-    return jsonify({"error": "Unauthorized access"}), status
+    return Response(_UNAUTHORIZED_BODY, status=status, mimetype='application/json')
 
 # Rate Limiting
+class ShardedMemoryStorage(MemoryStorage):
+    """
+    In-memory limiter storage with window counters split across 16 shards.
+
+    The stock memory:// storage serializes every counter update on a single
+    lock; here each shard has its own lock, so concurrent clients rarely
+    contend. Registered under the sharded-memory:// scheme. Moving-window
+    bookkeeping is inherited unchanged from MemoryStorage.
+    """
+
+    STORAGE_SCHEME = ["sharded-memory"]
+    SHARD_COUNT = 16  # Must be a power of two
+    SWEEP_THRESHOLD = 1024  # Purge expired counters once a shard grows past this
+
+    def __init__(self, uri=None, wrap_exceptions=False, **options):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        self._shards = [({}, threading.Lock()) for _ in range(self.SHARD_COUNT)]
+
+    def _shard(self, key):
+        return self._shards[hash(key) & (self.SHARD_COUNT - 1)]
+
+    def incr(self, key, expiry, elastic_expiry=False, amount=1):
+        counters, lock = self._shard(key)
+        now = time.time()
+        with lock:
+            value, expires_at = counters.get(key, (0, 0.0))
+            if expires_at <= now:
+                value = 0
+            value += amount
+            if elastic_expiry or value == amount:
+                expires_at = now + expiry
+            counters[key] = (value, expires_at)
+
+            if len(counters) > self.SWEEP_THRESHOLD:
+                for stale in [k for k, (_, exp) in counters.items() if exp <= now]:
+                    del counters[stale]
+        return value
+
+    def get(self, key):
+        entry = self._shard(key)[0].get(key)
+        if entry is None or entry[1] <= time.time():
+            return 0
+        return entry[0]
+
+    def get_expiry(self, key):
+        entry = self._shard(key)[0].get(key)
+        return entry[1] if entry is not None else time.time()
+
+    def clear(self, key):
+        counters, lock = self._shard(key)
+        with lock:
+            counters.pop(key, None)
+        super().clear(key)
+
+    def reset(self):
+        cleared = 0
+        for counters, lock in self._shards:
+            with lock:
+                cleared += len(counters)
+                counters.clear()
+        return cleared + (super().reset() or 0)
+
+
 limiter = Limiter(
     app=app,
     key_func=get_remote_address,
     default_limits=["200 per day", "50 per hour"],
-    storage_uri="memory://",
+    # Counters are per process; point this at redis:// when running several workers
+    storage_uri=os.getenv("LIMITER_STORAGE_URI", "sharded-memory://"),
     strategy="fixed-window"
 )
 
+@app.errorhandler(429)
+def rate_limit_error(e):
+    """Return JSON error when a rate limit is exceeded"""
+    return Response(_RATE_LIMITED_BODY, status=429, mimetype='application/json')
+
+# Static and uploaded files, long-lived streams and hot status polls are never
+# rate limited; filtered here before any per-route limit lookup
+_LIMITER_EXEMPT_PREFIXES = (
+    '/static/', '/chat_images/',
+    '/api/voice/events', '/api/vision/stream.mjpg', '/api/stt/status'
+)
+
+@limiter.request_filter
+def limiter_static_filter():
+    """Skip the limiter for exempt paths before any limit parsing or storage access"""
+    return request.environ.get('PATH_INFO', '').startswith(_LIMITER_EXEMPT_PREFIXES)
+
+
+# ============================================================================
+# MONITORING - Global request tracking
+# ============================================================================
+# Registered after the limiter so rate-limited requests are rejected before
+# any timing work, and skipped for requests carrying bad credentials so
+# brute-force 401s don't pollute the latency metrics.
+
+# Monitoring only covers the JSON API; checked with a slice on the raw WSGI
+# PATH_INFO to skip the URL-decoding request.path property on every request.
+_API_PREFIX = '/api/'
+_API_PREFIX_LEN = len(_API_PREFIX)
+
+
+@app.before_request
+def auth_preflight():
+    """Flag requests that present invalid Basic Auth credentials"""
+    authorization = request.authorization
+    if authorization is not None and verify_password(authorization.username, authorization.password) is None:
+        request.environ['assaultron.auth_rejected'] = True
+
+@app.before_request
+def before_request_monitoring():
+    """Track request start time for all API endpoints"""
+    environ = request.environ
+    if not MONITORING_ENABLED or environ.get('assaultron.auth_rejected'):
+        return
+    if environ.get('PATH_INFO', '')[:_API_PREFIX_LEN] == _API_PREFIX:
+        # Monotonic clock: NTP slews cannot produce negative durations
+        environ['assaultron.monitoring_start'] = time.monotonic_ns()
+
+@app.after_request
+def after_request_monitoring(response):
+    """Record metrics for all API endpoints"""
+    if not MONITORING_ENABLED:
+        return response
+    environ = request.environ
+    start_ns = environ.get('assaultron.monitoring_start')
+    if start_ns is not None and response.status_code != 401:
+        duration_ms = (time.monotonic_ns() - start_ns) / 1_000_000
+        collector.queue_api_response(environ['PATH_INFO'], duration_ms, response.status_code)
+    return response
+
+
+# ============================================================================
+# RESPONSE COMPRESSION
+# ============================================================================
+# Level 1 keeps compression latency negligible; JSON and SSE text still
+# shrink several-fold. Small bodies go out as-is.
+
+GZIP_LEVEL = 1
+GZIP_MIN_SIZE = 1024  # bytes
+
+
+@app.after_request
+def gzip_json_response(response):
+    """Gzip JSON bodies for clients that accept it"""
+    if (response.mimetype != 'application/json' or response.direct_passthrough
+            or response.is_streamed or 'Content-Encoding' in response.headers
+            or not request.accept_encodings['gzip']):
+        return response
+    body = response.get_data()
+    if len(body) < GZIP_MIN_SIZE:
+        return response
+    response.set_data(gzip.compress(body, compresslevel=GZIP_LEVEL))
+    response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    return response
+
+
+class PrebuiltJSON:
+    """
+    A static JSON body serialized once, with its gzip copy compressed once.
+
+    Gzipped responses already carry Content-Encoding, so gzip_json_response
+    passes them through instead of recompressing the same bytes per hit.
+    """
+
+    __slots__ = ('body', 'gzipped')
+
+    def __init__(self, obj):
+        self.body = dumps_bytes(obj)
+        # Compressed a single time, so the best ratio costs nothing per request
+        self.gzipped = gzip.compress(self.body, compresslevel=9) if len(self.body) >= GZIP_MIN_SIZE else None
+
+    def response(self) -> Response:
+        if self.gzipped is None:
+            return Response(self.body, mimetype='application/json')
+        if request.accept_encodings['gzip']:
+            response = Response(self.gzipped, mimetype='application/json')
+            response.headers['Content-Encoding'] = 'gzip'
+        else:
+            response = Response(self.body, mimetype='application/json')
+        response.vary.add('Accept-Encoding')
+        return response
+
+
+def gzip_stream(chunks):
+    """Gzip a chunk iterator, flushing after every chunk so each one reaches the client at once"""
+    compressor = zlib.compressobj(GZIP_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    try:
+        for chunk in chunks:
+            yield compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        yield compressor.flush()
+    finally:
+        # Propagate client disconnects so the wrapped stream's cleanup runs
+        close = getattr(chunks, 'close', None)
+        if close is not None:
+            close()
+
+
+# X-Accel-Buffering stops a fronting nginx from holding back SSE frames
+SSE_HEADERS = [
+    ('Content-Type', 'text/event-stream'),
+    ('Cache-Control', 'no-cache'),
+    ('X-Accel-Buffering', 'no')
+]
+SSE_GZIP_HEADERS = SSE_HEADERS + [('Content-Encoding', 'gzip'), ('Vary', 'Accept-Encoding')]
+
+
+def sse_stream(environ, stream):
+    """Response headers and body for an SSE stream, gzipped when the client accepts it"""
+    if parse_accept_header(environ.get('HTTP_ACCEPT_ENCODING'))['gzip']:
+        return SSE_GZIP_HEADERS, gzip_stream(stream)
+    return SSE_HEADERS, stream
+
 
 # ============================================================================
 # LOGGING CONFIGURATION
 # ============================================================================
 
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that writes encoded records into a binary buffer.
+
+    Records are coalesced in a 64 KiB BufferedWriter instead of costing one
+    write() each; a background thread flushes the buffer every 200 ms so the
+    log file stays close to live. The file size is tracked in-process, so the
+    rollover check does no filesystem calls per record.
+    """
+
+    def __init__(self, filename, mode='a', maxBytes=0, backupCount=0, encoding='utf-8',
+                 delay=False, buffer_size=64 * 1024, flush_interval=0.2):
+        self.buffer_size = buffer_size
+        self.flush_interval = flush_interval
+        super().__init__(filename, mode, maxBytes, backupCount, encoding, delay)
+        # The file is binary; records are encoded here rather than by a TextIOWrapper
+        self._codec = encoding or 'utf-8'
+
+        self._closing = threading.Event()
+        self._flush_thread = threading.Thread(target=self._flush_loop, name='log-flush', daemon=True)
+        self._flush_thread.start()
+
+    def _open(self):
+        stream = io.BufferedWriter(open(self.baseFilename, 'ab', buffering=0), buffer_size=self.buffer_size)
+        # Track the size ourselves so rollover checks need no per-record stat()/tell()
+        self._stream_size = stream.tell()
+        return stream
+
+    def _flush_loop(self):
+        while not self._closing.wait(self.flush_interval):
+            self.flush()
+
+    def emit(self, record):
+        try:
+            data = (self.format(record) + self.terminator).encode(self._codec, 'replace')
+            if self.stream is None:
+                self.stream = self._open()
+            if self.maxBytes > 0 and self._stream_size and self._stream_size + len(data) >= self.maxBytes:
+                self.doRollover()
+            self.stream.write(data)
+            self._stream_size += len(data)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self):
+        if self.stream:
+            self.stream.flush()
+        super().doRollover()
+
+    def close(self):
+        self._closing.set()
+        super().close()
+
+
+class SharedRecordFormatter(logging.Formatter):
+    """
+    Formatter that caches its output on the record.
+
+    Handlers sharing one instance (the main and error log files) format
+    each record once instead of once per handler.
+    """
+
+    def format(self, record):
+        cached = record.__dict__.get('_assaultron_formatted')
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        text = super().format(record)
+        record._assaultron_formatted = (self, text)
+        return text
+
+
+class InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler that hands records to the listener untouched.
+
+    The stock prepare() formats the message and strips args/exc_info so the
+    record can be pickled; the queue here never leaves the process, so
+    formatting (and the traceback text) is left to the listener thread too.
+    """
+
+    def prepare(self, record):
+        return record
+
+
 def setup_logging():
     """Configure application-wide logging with rotation and proper formatting"""
     # Get the project root directory (where main.py is located)
@@ -127,6 +473,10 @@ def setup_logging():
     # Remove existing handlers
     logger.handlers.clear()
 
+    # Application loggers emit DEBUG so it actually reaches the debug file log;
+    # third-party libraries stay at the root INFO level
+    logging.getLogger('assaultron').setLevel(logging.DEBUG)
+
     # Console handler with colored output-like formatting
     console_handler = logging.StreamHandler()
     console_handler.setLevel(logging.INFO)
@@ -140,33 +490,46 @@ def setup_logging():
     # Use absolute path to ensure logs go to the correct location
     log_dir = os.path.join(project_root, 'debug', 'logs')
     os.makedirs(log_dir, exist_ok=True)
-    file_handler = RotatingFileHandler(
+    file_handler = BufferedRotatingFileHandler(
         os.path.join(log_dir, 'assaultron.log'),
         maxBytes=10*1024*1024,  # 10MB
-        backupCount=5,
-        encoding='utf-8'
+        backupCount=5
     )
     file_handler.setLevel(logging.DEBUG)
-    file_formatter = logging.Formatter(
-        '[%(asctime)s] %(levelname)s - %(name)s - %(filename)s:%(lineno)d - %(message)s',
+    file_formatter = SharedRecordFormatter(
+        '[%(asctime)s] %(levelname)s - %(name)s - %(message)s',
         datefmt='%Y-%m-%d %H:%M:%S'
     )
     file_handler.setFormatter(file_formatter)
 
     # Error file handler (errors only)
-    error_handler = RotatingFileHandler(
+    error_handler = BufferedRotatingFileHandler(
         os.path.join(log_dir, 'assaultron_errors.log'),
         maxBytes=10*1024*1024,
-        backupCount=3,
-        encoding='utf-8'
+        backupCount=3
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(file_formatter)
 
-    # Add handlers
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
-    logger.addHandler(error_handler)
+    # Request threads only enqueue records; one listener thread formats them
+    # and does the console/file I/O for all three handlers
+    log_queue = SimpleQueue()
+    listener = QueueListener(
+        log_queue, console_handler, file_handler, error_handler,
+        respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)  # Drain whatever is still queued on exit
+    logger.addHandler(InProcessQueueHandler(log_queue))
+
+    # No format uses thread/process fields or the caller's file/line (most
+    # records come through log_event, so they would always point there), so
+    # skip collecting them - _srcfile = None disables the findCaller() stack walk.
+    # Exceptions still carry their full traceback.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging._srcfile = None
 
     return logger
 
@@ -174,6 +537,406 @@ def setup_logging():
 app_logger = setup_logging()
 logger = logging.getLogger('assaultron.main')
 
+# Cached logger lookup: after the first call for a name this skips the logging
+# manager lock. Code on the request path should use get_logger() rather than
+# logging.getLogger().
+get_logger = lru_cache(maxsize=64)(logging.getLogger)
+
+# log_event type -> (logger, level), resolved once per event type
+_LOG_TARGETS = {}
+
+
+def log_target(event_type: str) -> tuple:
+    """Return the (logger, level) pair log_event uses for an event type"""
+    target = _LOG_TARGETS.get(event_type)
+    if target is None:
+        target = _LOG_TARGETS.setdefault(event_type, (
+            get_logger(f'assaultron.{event_type.lower()}'),
+            getattr(logging, event_type, logging.INFO)
+        ))
+    return target
+
+
+def log_enabled(event_type: str) -> bool:
+    """True if a log_event of this type would be emitted (lets callers skip formatting)"""
+    logger, log_level = log_target(event_type)
+    return logger.isEnabledFor(log_level)
+
+# In-memory system log bound, and how many recent entries /api/logs returns
+SYSTEM_LOG_MAXLEN = 1000
+API_LOGS_LIMIT = 50
+
+# avg_response_time is an exponentially weighted moving average in whole ms;
+# each new sample moves it by 1/2**RESPONSE_TIME_EWMA_SHIFT of the difference
+RESPONSE_TIME_EWMA_SHIFT = 3
+
+# SSE frames are UTF-8 bytes, encoded once when published; Werkzeug writes
+# bytes chunks as-is instead of encoding a str per client per event
+SSE_CONNECTED_FRAME = sse_frame({'type': 'connected'})
+SSE_KEEPALIVE_FRAME = b": keepalive\n\n"
+SSE_KEEPALIVE_INTERVAL = 30  # seconds
+
+
+class Broadcaster:
+    """
+    SSE fanout through one shared ring of frames and a Condition.
+
+    Publishing is a single append + notify_all no matter how many clients
+    are connected; each stream remembers the sequence number it last sent
+    and picks up everything newer. A client that falls more than maxlen
+    frames behind silently skips the overwritten ones.
+    """
+
+    def __init__(self, maxlen: int = 64):
+        self._cond = threading.Condition()
+        self._frames = deque(maxlen=maxlen)
+        self._seq = 0  # Sequence number of the newest frame
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    def publish(self, message: dict):
+        """Serialize and encode a message once and wake every waiting stream"""
+        frame = sse_frame(message)
+        with self._cond:
+            self._frames.append(frame)
+            self._seq += 1
+            self._cond.notify_all()
+
+    def wait(self, last_seq: int, timeout: float):
+        """Block until frames newer than last_seq exist; returns (seq, frames)"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._seq != last_seq, timeout):
+                return last_seq, ()
+            frames = self._frames
+            missed = min(self._seq - last_seq, len(frames))
+            return self._seq, tuple(islice(frames, len(frames) - missed, None))
+
+# Worker pool for process_message stages that can overlap with intent detection
+pipeline_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='pipeline')
+
+# Speculative vision capture while the user is still speaking (STT partials)
+STT_PREFETCH_MIN_WORDS = 3
+STT_PREFETCH_MAX_AGE = 2.0  # seconds a prefetched snapshot stays usable
+
+# Recent LLM intent classifications, reused for repeated messages
+INTENT_CACHE_SIZE = 1024
+INTENT_CACHE_TTL = 600  # seconds
+
+# Outermost {...} span in an intent classifier reply
+JSON_SPAN = re.compile(r'\{.*\}', re.DOTALL)
+
+# OS device enumeration results reused across dashboard refreshes
+DEVICE_LIST_TTL = 30  # seconds
+
+
+def ttl_memoize(ttl: float):
+    """
+    Cache a zero-argument function's result for ttl seconds.
+
+    The wrapper gains cache_clear() to drop the result early. Concurrent
+    misses are serialized so the underlying call runs once per expiry.
+    """
+    def decorate(func):
+        lock = threading.Lock()
+        cached = None  # (computed_at, value)
+
+        @functools.wraps(func)
+        def wrapper():
+            nonlocal cached
+            with lock:
+                if cached is None or time.monotonic() - cached[0] >= ttl:
+                    cached = (time.monotonic(), func())
+                return cached[1]
+
+        def cache_clear():
+            nonlocal cached
+            with lock:
+                cached = None
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorate
+
+
+# Agent task records kept for the status/list endpoints
+AGENT_TASKS_MAX = 1024
+AGENT_TASKS_TTL = 3600  # seconds since the record was last written
+
+
+class AgentTaskRegistry:
+    """
+    Agent task records shared by API routes and background task threads.
+
+    Bounded LRU with a TTL behind one lock. Records are replaced whole
+    (never mutated in place), so readers never see a half-written task;
+    the least recently written record is evicted past maxsize and records
+    untouched for ttl seconds expire.
+    """
+
+    def __init__(self, maxsize: int = AGENT_TASKS_MAX, ttl: float = AGENT_TASKS_TTL,
+                 prefix: str = "task"):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.prefix = prefix
+        self._tasks = OrderedDict()  # task_id -> (written_at, record), oldest write first
+        self._lock = threading.Lock()
+        self._ids = count()
+
+    def new_task_id(self) -> str:
+        """Unique task id (a counter, so ids never repeat after eviction)"""
+        return f"{self.prefix}_{int(time.time())}_{next(self._ids)}"
+
+    def _expire(self, now: float):
+        tasks = self._tasks
+        while tasks and now - next(iter(tasks.values()))[0] >= self.ttl:
+            tasks.popitem(last=False)
+
+    def __setitem__(self, task_id: str, record: dict):
+        now = time.monotonic()
+        with self._lock:
+            self._tasks[task_id] = (now, record)
+            self._tasks.move_to_end(task_id)
+            self._expire(now)
+            while len(self._tasks) > self.maxsize:
+                self._tasks.popitem(last=False)
+
+    def get(self, task_id: str):
+        """Return the task record, or None if unknown or expired"""
+        with self._lock:
+            entry = self._tasks.get(task_id)
+        if entry is None or time.monotonic() - entry[0] >= self.ttl:
+            return None
+        return entry[1]
+
+    def items(self) -> list:
+        """Snapshot of (task_id, record) pairs, oldest first"""
+        with self._lock:
+            self._expire(time.monotonic())
+            return [(task_id, record) for task_id, (_, record) in self._tasks.items()]
+
+    def transition(self, task_id: str, from_status: str, to_status: str) -> bool:
+        """Atomically change a task's status if it is currently from_status"""
+        with self._lock:
+            entry = self._tasks.get(task_id)
+            if entry is None or entry[1]["status"] != from_status:
+                return False
+            written_at, record = entry
+            self._tasks[task_id] = (written_at, {**record, "status": to_status})
+            return True
+
+
+# Agent tasks share a bounded pool; beyond the queue allowance new tasks are refused
+AGENT_CONCURRENCY = int(os.getenv('AGENT_CONCURRENCY', '4'))
+AGENT_MAX_PENDING = 16
+agent_executor = ThreadPoolExecutor(max_workers=AGENT_CONCURRENCY, thread_name_prefix='agent')
+_agent_slots = threading.BoundedSemaphore(AGENT_CONCURRENCY + AGENT_MAX_PENDING)
+agent_futures = weakref.WeakValueDictionary()  # task_id -> Future, dropped once finished
+
+
+def submit_agent_task(task_id: str, fn) -> bool:
+    """Queue fn on the agent pool; returns False if the pool is saturated"""
+    if not _agent_slots.acquire(blocking=False):
+        return False
+    future = agent_executor.submit(fn)
+    agent_futures[task_id] = future
+    future.add_done_callback(lambda _: _agent_slots.release())
+    return True
+
+
+@dataclass
+class PipelineResult:
+    """Outcome of EmbodiedAssaultronCore.process_message"""
+    success: bool
+    dialogue: str
+    timestamp: str
+    error: str = None
+    cognitive_state: dict = None
+    hardware_state: dict = None
+    body_state: dict = None
+    body_command: dict = None
+    world_state: dict = None
+    mood: dict = None
+    metadata: dict = None
+    response_time: int = None
+
+
+# ============================================================================
+# AGENT INTENT KEYWORDS
+# ============================================================================
+
+# Multilingual no-agent phrases
+NO_AGENT_PHRASES_BY_LANG = {
+    "en": [
+        "don't use agent", "dont use agent",
+        "don't call agent", "dont call agent",
+        "don't use the agent", "dont use the agent",
+        "don't call the agent", "dont call the agent",
+        "don't start agent", "dont start agent",
+        "don't start the agent", "dont start the agent",
+        "don't run agent", "dont run agent",
+        "don't run the agent", "dont run the agent",
+        "don't trigger agent", "dont trigger agent",
+        "don't trigger the agent", "dont trigger the agent",
+        "no agent", "without agent", "skip agent",
+        "not for agent", "not for the agent",
+    ],
+    "fr": [
+        "n'utilise pas l'agent", "nutilise pas lagent",
+        "n'appelle pas l'agent", "nappelle pas lagent",
+        "ne démarre pas l'agent", "ne demarre pas lagent",
+        "n'utilise pas agent", "nutilise pas agent",
+        "n'appelle pas agent", "nappelle pas agent",
+        "ne lance pas l'agent", "ne lance pas lagent",
+        "pas d'agent", "sans agent", "sans l'agent",
+        "pas pour l'agent", "pas pour lagent",
+    ],
+    "es": [
+        "no uses el agente", "no uses agente",
+        "no llames al agente", "no llames agente",
+        "no inicies el agente", "no inicies agente",
+        "no ejecutes el agente", "no ejecutes agente",
+        "no actives el agente", "no actives agente",
+        "sin agente", "sin el agente",
+        "no para el agente", "no para agente",
+    ]
+}
+
+# Multilingual action verbs
+ACTION_VERBS_BY_LANG = {
+    "en": [
+        'create', 'make', 'build', 'write', 'generate', 'develop',
+        'code', 'program', 'design', 'implement', 'construct',
+        'research', 'find', 'search', 'look up', 'investigate',
+        'analyze', 'test', 'run', 'execute', 'deploy'
+    ],
+    "fr": [
+        'crée', 'créer', 'faire', 'fais', 'construire', 'construis',
+        'écrire', 'écris', 'générer', 'génère', 'développer', 'développe',
+        'coder', 'code', 'programmer', 'programme', 'concevoir', 'conçois',
+        'implémenter', 'implémente', 'rechercher', 'recherche',
+        'trouver', 'trouve', 'chercher', 'cherche', 'investiguer', 'investigue',
+        'analyser', 'analyse', 'tester', 'teste', 'exécuter', 'exécute', 'déployer', 'déploie'
+    ],
+    "es": [
+        'crear', 'crea', 'hacer', 'haz', 'construir', 'construye',
+        'escribir', 'escribe', 'generar', 'genera', 'desarrollar', 'desarrolla',
+        'codificar', 'codifica', 'programar', 'programa', 'diseñar', 'diseña',
+        'implementar', 'implementa', 'investigar', 'investiga',
+        'buscar', 'busca', 'encontrar', 'encuentra', 'analizar', 'analiza',
+        'probar', 'prueba', 'ejecutar', 'ejecuta', 'desplegar', 'despliega'
+    ]
+}
+
+# Multilingual creation indicators
+CREATION_INDICATORS_BY_LANG = {
+    "en": [
+        'website', 'web page', 'html', 'css', 'javascript', 'php',
+        'file', 'folder', 'directory', 'script', 'program',
+        'app', 'application', 'project', 'code', 'document',
+        'poem', 'story', 'article', 'report', 'summary'
+    ],
+    "fr": [
+        'site web', 'page web', 'html', 'css', 'javascript', 'php',
+        'fichier', 'dossier', 'répertoire', 'script', 'programme',
+        'app', 'application', 'projet', 'code', 'document',
+        'poème', 'histoire', 'article', 'rapport', 'résumé'
+    ],
+    "es": [
+        'sitio web', 'página web', 'html', 'css', 'javascript', 'php',
+        'archivo', 'carpeta', 'directorio', 'script', 'programa',
+        'app', 'aplicación', 'proyecto', 'código', 'documento',
+        'poema', 'historia', 'artículo', 'reporte', 'informe', 'resumen'
+    ]
+}
+
+# Multilingual greetings
+GREETINGS_BY_LANG = {
+    "en": ['hello', 'hi', 'hey', 'greetings'],
+    "fr": ['bonjour', 'salut', 'coucou', 'salutations', 'bonsoir'],
+    "es": ['hola', 'hey', 'saludos', 'buenas']
+}
+
+# Keyword categories (bit flags)
+INTENT_NO_AGENT = 1
+INTENT_ACTION = 2
+INTENT_CREATION = 4
+# Set when an action keyword and a *different* creation keyword both matched;
+# one word listed in both tables ("code", "programme") does not count
+INTENT_ACTION_AND_CREATION = 8
+
+
+def _build_intent_scanner(language: str):
+    """
+    Compile every intent keyword for a language into one pattern.
+
+    The pattern is a zero-width lookahead tried at every word start, so a
+    single finditer() pass sees every keyword occurrence. Anchoring on word
+    starts keeps inflections ("creates", "running") but stops keywords from
+    matching inside other words ("app" in "happy", "test" in "latest").
+    Each phrase maps to the category bits of itself plus every shorter
+    phrase it starts with, since only the longest alternative is reported
+    at a given position.
+    """
+    categories = {}
+    for flag, table in ((INTENT_NO_AGENT, NO_AGENT_PHRASES_BY_LANG),
+                        (INTENT_ACTION, ACTION_VERBS_BY_LANG),
+                        (INTENT_CREATION, CREATION_INDICATORS_BY_LANG)):
+        for phrase in table.get(language, table["en"]):
+            categories[phrase] = categories.get(phrase, 0) | flag
+
+    masks = {
+        phrase: functools.reduce(
+            operator.or_, (bits for other, bits in categories.items() if phrase.startswith(other)), 0
+        )
+        for phrase in categories
+    }
+    alternation = "|".join(re.escape(p) for p in sorted(categories, key=len, reverse=True))
+    return re.compile(rf"\b(?=({alternation}))"), masks
+
+
+_INTENT_SCANNERS = {lang: _build_intent_scanner(lang) for lang in ("en", "fr", "es")}
+
+def analyze_message(message: str) -> tuple:
+    """
+    Derive the text features the pipeline needs from a user message in one place.
+
+    Returns:
+        Tuple (message_lower, is_question, words) where words is the
+        whitespace-split lowercased message
+    """
+    message_lower = message.lower()
+    return message_lower, "?" in message, message_lower.split()
+
+
+# Leading greetings (and the separators after them) stripped from task descriptions
+_GREETING_PREFIXES = {
+    lang: re.compile(
+        r"^(?:(?:" + "|".join(re.escape(g) for g in greetings) + r")\b[ ,]*)+", re.IGNORECASE
+    )
+    for lang, greetings in GREETINGS_BY_LANG.items()
+}
+
+
+@lru_cache(maxsize=512)
+def scan_intent_keywords(language: str, message_lower: str) -> int:
+    """Return the INTENT_* category bits found in a lowercased message (one pass)"""
+    pattern, masks = _INTENT_SCANNERS.get(language, _INTENT_SCANNERS["en"])
+    found = 0
+    actions, creations = set(), set()
+    for match in pattern.finditer(message_lower):
+        phrase = match.group(1)
+        bits = masks[phrase]
+        found |= bits
+        if bits & INTENT_ACTION:
+            actions.add(phrase)
+        if bits & INTENT_CREATION:
+            creations.add(phrase)
+    if actions and creations and not (len(actions) == 1 and actions == creations):
+        found |= INTENT_ACTION_AND_CREATION
+    return found
+
 
 # ============================================================================
 # EMBODIED ASSAULTRON CORE
@@ -192,7 +955,11 @@ class EmbodiedAssaultronCore:
 
     def __init__(self):
         # System state
-        self.system_logs = []
+        # Log columns (timestamp, type, message) kept as parallel bounded deques
+        self._log_ts = deque(maxlen=SYSTEM_LOG_MAXLEN)
+        self._log_type = deque(maxlen=SYSTEM_LOG_MAXLEN)
+        self._log_msg = deque(maxlen=SYSTEM_LOG_MAXLEN)
+        self._log_lock = threading.Lock()
         self.status = "Initializing..."
         self.ai_active = False
         self.start_time = datetime.now()
@@ -207,8 +974,7 @@ class EmbodiedAssaultronCore:
         self.language = settings.get("language", "en")
 
         # Update monitoring
-        if MONITORING_ENABLED:
-            monitoring.get_collector().update_system_status(ai_active=False)
+        collector.update_system_status(ai_active=False)
 
         # Initialize embodied agent layers
         self.log_event("Initializing Embodied Agent Architecture...", "SYSTEM")
@@ -227,8 +993,7 @@ class EmbodiedAssaultronCore:
         self.log_event("Cognitive Engine initialized", "SYSTEM")
 
         # Update monitoring
-        if MONITORING_ENABLED:
-            monitoring.get_collector().update_system_status(ai_active=True)
+        collector.update_system_status(ai_active=True)
 
         # Behavioral Layer (behavior selection)
         self.behavior_arbiter = BehaviorArbiter()
@@ -241,11 +1006,10 @@ class EmbodiedAssaultronCore:
         # Voice system
         self.voice_system = VoiceManager(logger=self)
         self.voice_enabled = False
-        self.voice_event_queues = []  # SSE clients listening for audio ready events
+        self.voice_events = Broadcaster()  # SSE fanout for audio ready events
 
         # Update monitoring
-        if MONITORING_ENABLED:
-            monitoring.get_collector().update_system_status(voice_enabled=False)
+        collector.update_system_status(voice_enabled=False)
 
         # Register callback for real-time audio notifications
         self.voice_system.set_audio_ready_callback(self._broadcast_audio_ready)
@@ -260,7 +1024,7 @@ class EmbodiedAssaultronCore:
         # Speech-to-Text system
         mistral_key = os.getenv("MISTRAL_KEY", "")
         self.stt_manager = None
-        self.stt_event_queues = []  # SSE clients listening for STT events
+        self.stt_event_channels = set()  # SSE clients listening for STT events
         if mistral_key:
             try:
                 sample_rate = int(os.getenv("STT_SAMPLE_RATE", "16000"))
@@ -277,10 +1041,19 @@ class EmbodiedAssaultronCore:
         else:
             self.log_event("STT Manager not initialized (MISTRAL_KEY not set)", "WARN")
 
-        # Vision system (Perception Layer)
-        self.vision_system = VisionSystem(logger=self)
-        self.vision_system.enumerate_cameras()  # Discover available cameras
-        self.log_event("Vision System initialized", "SYSTEM")
+        # Vision system and autonomous agent are created on first use (see properties below);
+        # camera enumeration alone can take seconds
+        self._lazy_init_lock = threading.RLock()
+
+        # Warm up vision from partial transcripts so the final STT message finds it ready
+        self._stt_partial_text = ""
+        self._stt_prefetch_started = False
+        self._stt_utterance = 0  # id of the utterance currently being transcribed
+        self._stt_last_transcript = (-1, "")  # (utterance id, normalized final transcript)
+        self._vision_prefetch = None  # (monotonic time, utterance id, _capture_vision_inputs result)
+        if self.stt_manager:
+            self.stt_manager.on_transcription_partial = self._prefetch_on_partial
+            self.stt_manager.on_transcription_complete = self._reset_stt_prefetch
 
         # Notification system (pass cognitive_engine for smart questions)
         self.notification_manager = NotificationManager(
@@ -298,33 +1071,85 @@ class EmbodiedAssaultronCore:
         # Background monitoring for proactive notifications
         self.background_monitoring_enabled = False
         self.background_thread = None
+        self._background_wakeup = threading.Event()  # Set to stop the loop without waiting a full interval
         
-        # Autonomous Agent System
+        # Autonomous Agent System (sandbox and agent logic are created on first use)
+        self.agent_tasks = AgentTaskRegistry()  # Track running agent tasks
+        self._intent_cache = OrderedDict()  # (language, message) -> (expires_at, (is_task, task_description))
+        self._intent_cache_lock = threading.Lock()
+
+    def _get_or_create(self, attr: str, factory):
+        """Return a lazily created subsystem, creating it once under a lock"""
+        value = self.__dict__.get(attr)
+        if value is None:
+            with self._lazy_init_lock:
+                value = self.__dict__.get(attr)
+                if value is None:
+                    value = factory()
+                    self.__dict__[attr] = value
+        return value
+
+    def _create_vision_system(self) -> VisionSystem:
+        vision_system = VisionSystem(logger=self)
+        vision_system.enumerate_cameras()  # Discover available cameras
+        self.log_event("Vision System initialized", "SYSTEM")
+        return vision_system
+
+    def _create_sandbox_manager(self) -> SandboxManager:
         sandbox_path = os.getenv("SANDBOX_PATH", "./src/sandbox")
-        self.sandbox_manager = SandboxManager(sandbox_path)
-        self.agent_logic = AgentLogic(self.cognitive_engine, self.sandbox_manager)
-        self.agent_tasks = {}  # Track running agent tasks
+        sandbox_manager = SandboxManager(sandbox_path)
         self.log_event(f"Autonomous Agent initialized with sandbox: {sandbox_path}", "SYSTEM")
+        return sandbox_manager
+
+    @property
+    def vision_system(self) -> VisionSystem:
+        """Vision system (Perception Layer), created on first use"""
+        return self._get_or_create('_vision_system', self._create_vision_system)
+
+    @property
+    def vision_active(self) -> bool:
+        """True if vision capture is enabled, without creating the vision system"""
+        vision_system = self.__dict__.get('_vision_system')
+        return vision_system is not None and vision_system.state.enabled
+
+    @property
+    def sandbox_manager(self) -> SandboxManager:
+        return self._get_or_create('_sandbox_manager', self._create_sandbox_manager)
+
+    @property
+    def agent_logic(self) -> AgentLogic:
+        return self._get_or_create(
+            '_agent_logic', lambda: AgentLogic(self.cognitive_engine, self.sandbox_manager)
+        )
 
-    def log_event(self, message, event_type="INFO"):
-        """Log system events"""
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        log_entry = {
-            "timestamp": timestamp,
-            "type": event_type,
-            "message": message
-        }
-        self.system_logs.append(log_entry)
-
-        # Limit log size
-        if len(self.system_logs) > 1000:
-            self.system_logs = self.system_logs[-1000:]
+    def log_event(self, message, event_type="INFO", _ts=None):
+        """Log system events (_ts: pre-formatted timestamp the caller already has)"""
+        timestamp = _ts or now_log_ts()
+        # Bounded deques drop the oldest entry once SYSTEM_LOG_MAXLEN are stored
+        with self._log_lock:
+            self._log_ts.append(timestamp)
+            self._log_type.append(event_type)
+            self._log_msg.append(message)
 
         # Use proper logging instead of print
-        log_level = getattr(logging, event_type, logging.INFO)
-        logger = logging.getLogger(f'assaultron.{event_type.lower()}')
+        logger, log_level = log_target(event_type)
         logger.log(log_level, message)
 
+    def iter_logs(self):
+        """Iterate over a snapshot of stored logs as (timestamp, type, message)"""
+        with self._log_lock:
+            return iter(list(zip(self._log_ts, self._log_type, self._log_msg)))
+
+    def recent_logs(self, limit: int = 50) -> list:
+        """Return the most recent log entries, oldest first, as dicts"""
+        with self._log_lock:
+            columns = [list(islice(reversed(column), limit))
+                       for column in (self._log_ts, self._log_type, self._log_msg)]
+        return [
+            {"timestamp": timestamp, "type": event_type, "message": message}
+            for timestamp, event_type, message in zip(*(reversed(column) for column in columns))
+        ]
+
     def _load_settings(self) -> dict:
         """Load system settings from disk"""
         settings_file = "ai-data/settings.json"
@@ -355,14 +1180,20 @@ class EmbodiedAssaultronCore:
         self.cognitive_engine.language = self.language
         self.voice_system.language = self.language
 
-    def _broadcast_audio_ready(self, filename):
+    def _broadcast_audio_ready(self, filename, part=None, final=True, error=None):
         """Broadcast audio ready event to all connected SSE clients"""
-        audio_url = f"/api/voice/audio/{filename}"
         message = {
             "type": "audio_ready",
-            "url": audio_url,
-            "filename": filename
+            "url": f"/api/voice/audio/{filename}" if filename else None,
+            "filename": filename,
+            "final": final
         }
+        if part is not None:
+            # Sentence chunk of a longer reply (see VoiceManager.synthesize_stream)
+            message["part"] = part
+        if error:
+            # Terminal event for a reply whose synthesis failed part way (no audio)
+            message["error"] = error
 
         # Determine message source (default to web if not set)
         source = getattr(self, 'last_message_source', 'web')
@@ -370,20 +1201,11 @@ class EmbodiedAssaultronCore:
         # Send to all connected clients
         # Note: We broadcast to all clients regardless of source
         # The Discord bot and web UI will handle playing/not playing based on their own state
-        dead_queues = []
-        for queue in self.voice_event_queues:
-            try:
-                queue.put_nowait(message)
-            except:
-                dead_queues.append(queue)
-
-        # Clean up disconnected clients
-        for queue in dead_queues:
-            if queue in self.voice_event_queues:
-                self.voice_event_queues.remove(queue)
+        self.voice_events.publish(message)
 
-        # Reset source after broadcast
-        self.last_message_source = 'web'
+        # Reset source after the last chunk of the reply
+        if final:
+            self.last_message_source = 'web'
 
     def _broadcast_voice_notification(self, text):
         """Broadcast voice activation notification to all connected SSE clients"""
@@ -392,42 +1214,22 @@ class EmbodiedAssaultronCore:
         }
 
         # Send to all connected clients
-        dead_queues = []
-        for queue in self.voice_event_queues:
-            try:
-                queue.put_nowait(message)
-            except:
-                dead_queues.append(queue)
-
-        # Clean up disconnected clients
-        for queue in dead_queues:
-            if queue in self.voice_event_queues:
-                self.voice_event_queues.remove(queue)
+        self.voice_events.publish(message)
 
     def _broadcast_agent_completion(self, message_text):
         """Broadcast agent completion message to all connected SSE clients"""
         message = {
             "type": "agent_completion",
             "message": message_text,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
 
         # Send to all connected clients
-        dead_queues = []
-        for queue in self.voice_event_queues:
-            try:
-                queue.put_nowait(message)
-            except:
-                dead_queues.append(queue)
-
-        # Clean up disconnected clients
-        for queue in dead_queues:
-            if queue in self.voice_event_queues:
-                self.voice_event_queues.remove(queue)
+        self.voice_events.publish(message)
 
         self.log_event(f"Broadcasted agent completion: {message_text[:50]}...", "AGENT")
 
-    def process_message(self, user_message: str, image_path: str = None) -> dict:
+    def process_message(self, user_message: str, image_path: str = None) -> PipelineResult:
         """
         Process user message through the embodied agent pipeline.
 
@@ -444,41 +1246,65 @@ class EmbodiedAssaultronCore:
             image_path: Optional path to an attached image file
 
         Returns:
-            Dictionary with response, hardware state, and metadata
+            PipelineResult with response, hardware state, and metadata
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
+        # Request-start timestamp for the pre-LLM logs; results stamp their completion time
+        ts_str = now_log_ts()
 
         try:
             # Step 1: Analyze user message for world cues
             world_updates = analyze_user_message_for_world_cues(user_message)
             if world_updates:
                 self.virtual_world.update_world(**world_updates)
-                self.log_event(f"World state updated: {world_updates}", "WORLD")
+                self.log_event(f"World state updated: {world_updates}", "WORLD", _ts=ts_str)
 
             # Get current states
             world_state = self.virtual_world.get_world_state()
             body_state = self.virtual_world.get_body_state()
 
             # Step 1a: Update mood based on interaction
-            is_question = "?" in user_message
+            message_lower, is_question, message_words = analyze_message(user_message)
             self.virtual_world.update_mood(
                 user_message=user_message,
                 is_question=is_question,
                 message_length=len(user_message)
             )
             mood_state = self.virtual_world.get_mood_state()
-            self.log_event(
-                f"Mood: curiosity={mood_state.curiosity:.2f}, irritation={mood_state.irritation:.2f}, "
-                f"boredom={mood_state.boredom:.2f}, attachment={mood_state.attachment:.2f}",
-                "MOOD"
-            )
+            if log_enabled("MOOD"):
+                curiosity, irritation, boredom, attachment = (
+                    mood_state.curiosity, mood_state.irritation, mood_state.boredom, mood_state.attachment
+                )
+                self.log_event(
+                    f"Mood: curiosity={curiosity:.2f}, irritation={irritation:.2f}, "
+                    f"boredom={boredom:.2f}, attachment={attachment:.2f}",
+                    "MOOD",
+                    _ts=ts_str
+                )
+
+            # Vision capture and memory summary don't depend on intent detection,
+            # so start them now and let them overlap with a possible LLM call
+            vision_future = None
+            if self.vision_active:
+                prefetched = self._take_vision_prefetch(user_message)
+                if prefetched is not None:
+                    vision_future = Future()
+                    vision_future.set_result(prefetched)
+                else:
+                    vision_future = pipeline_executor.submit(self._capture_vision_inputs)
+            memory_future = pipeline_executor.submit(self.cognitive_engine.get_memory_summary)
 
             # Step 1c: Detect if this is an actionable task for the agent
-            task_detected, task_description = self._detect_agent_task(user_message)
+            task_detected, task_description = self._detect_agent_task(
+                user_message, (message_lower, is_question, message_words)
+            )
             agent_context = ""
             
             if task_detected:
-                self.log_event(f"Task detected: {task_description}", "AGENT")
+                if vision_future is not None:
+                    vision_future.cancel()
+                memory_future.cancel()
+                self.log_event(f"Task detected: {task_description}", "AGENT", _ts=ts_str)
                 
                 # Generate immediate acknowledgment from AI
                 acknowledgment = agent_ai_helpers.generate_task_acknowledgment(
@@ -491,17 +1317,17 @@ class EmbodiedAssaultronCore:
                 enhanced_task = agent_ai_helpers.enhance_task_with_personality(task_description)
                 
                 # Start agent in background
-                task_id = f"task_{int(time.time())}_{len(self.agent_tasks)}"
+                task_id = self.agent_tasks.new_task_id()
                 
                 # Get conversation context for the agent
-                recent_history = self.cognitive_engine.conversation_history[-10:]
+                recent_history = self.cognitive_engine.recent_history(10)
                 formatted_history = []
                 for exchange in recent_history:
                     formatted_history.append(f"User: {exchange['user']}")
                     formatted_history.append(f"AI: {exchange['assistant']}")
                 history_context = "\n".join(formatted_history)
 
-                agent_ai_helpers.run_agent_in_background(
+                task_started = agent_ai_helpers.run_agent_in_background(
                     agent_logic=self.agent_logic,
                     agent_tasks=self.agent_tasks,
                     task_id=task_id,
@@ -513,8 +1339,13 @@ class EmbodiedAssaultronCore:
                     log_callback=self.log_event,
                     broadcast_callback=self._broadcast_agent_completion,
                     user_message=user_message,
-                    conversation_history=history_context
+                    conversation_history=history_context,
+                    submit=submit_agent_task
                 )
+                if not task_started:
+                    # Pool saturated: the task is recorded as "rejected", so don't promise it
+                    self.log_event(f"Agent queue full, task {task_id} rejected", "AGENT")
+                    acknowledgment = "My task queue is full right now. Give me a moment to finish what I'm on, then ask again."
                 
                 # Queue voice message for acknowledgment if enabled
                 if self.voice_enabled:
@@ -525,29 +1356,28 @@ class EmbodiedAssaultronCore:
                 except Exception as e:
                     self.log_event(f"Error updating history: {e}", "ERROR")
 
-                return {
-                    "success": True,
-                    "dialogue": acknowledgment,
-                    "timestamp": datetime.now().isoformat(),
-                    "cognitive_state": {"emotion": mood_state.dominant_emotion, "thought": "Starting autonomous task"},
-                    "hardware_state": self.get_hardware_state(),
-                    "body_state": {"posture": "alert", "gesture": "nod"},
-                    "mood": mood_state.__dict__,
-                    "metadata": {
-                        "task_started": True,
+                return PipelineResult(
+                    success=True,
+                    dialogue=acknowledgment,
+                    timestamp=now_iso(),
+                    cognitive_state={
+                        "emotion": mood_state.dominant_emotion,
+                        "thought": "Starting autonomous task" if task_started else "Agent queue is full"
+                    },
+                    hardware_state=self.get_hardware_state(),
+                    body_state={"posture": "alert", "gesture": "nod"},
+                    mood=mood_state.__dict__,
+                    metadata={
+                        "task_started": task_started,
                         "task_id": task_id
                     }
-                }
+                )
 
             # Step 1b: Integrate vision data into world state
             vision_context = ""
-            vision_image_b64 = None
-            if self.vision_system.state.enabled:
-                vision_entities = self.vision_system.get_entities_for_world_state()
-                vision_data = self.vision_system.get_scene_for_cognitive_layer()
-
-                # Get raw frame for AI vision (without detection overlay)
-                vision_image_b64 = self.vision_system.get_raw_frame_b64()
+            vision_image_bytes = None
+            if vision_future is not None:
+                vision_entities, vision_data, vision_image_bytes = vision_future.result()
 
                 # Update world state with vision data
                 if vision_entities:
@@ -568,16 +1398,19 @@ class EmbodiedAssaultronCore:
                     if entity_details:
                         vision_context += f" | Details: {', '.join(entity_details)}"
 
-                logging.getLogger('assaultron.vision').debug(f"VISION CONTEXT SENT TO AI: '{vision_context}'")
-                self.log_event(f"Vision: {vision_data['scene_description']}", "VISION")
+                vision_logger = get_logger('assaultron.vision')
+                if vision_logger.isEnabledFor(logging.DEBUG):
+                    vision_logger.debug(f"VISION CONTEXT SENT TO AI: '{vision_context}'")
+                if log_enabled("VISION"):
+                    self.log_event(f"Vision: {vision_data['scene_description']}", "VISION")
 
             # Step 2: Cognitive Layer - Generate intent
             provider_label = Config.LLM_PROVIDER.upper()
             self.log_event(f"Cognitive: Processing with {provider_label}...", "COGNITIVE")
-            memory_summary = self.cognitive_engine.get_memory_summary()
+            memory_summary = memory_future.result()
 
             # Track LLM timing
-            llm_start = time.time()
+            llm_start = time.perf_counter()
 
             cognitive_state = self.cognitive_engine.process_input(
                 user_message=user_message,
@@ -587,23 +1420,23 @@ class EmbodiedAssaultronCore:
                 memory_summary=memory_summary,
                 vision_context=vision_context,
                 agent_context=agent_context,
-                vision_image_b64=vision_image_b64,
+                vision_image_bytes=vision_image_bytes,
                 attachment_image_path=image_path
             )
 
             # Record LLM metrics
-            llm_duration = (time.time() - llm_start) * 1000
+            llm_duration = (time.perf_counter() - llm_start) * 1000
             if MONITORING_ENABLED:
                 # Rough estimate for tokens (will be more accurate with actual token count)
                 prompt_tokens = len(user_message.split()) * 2
                 response_tokens = len(cognitive_state.dialogue.split()) * 2
-                monitoring.get_collector().record_llm_request(
+                collector.record_llm_request(
                     model=provider_label,
                     prompt_tokens=prompt_tokens,
                     response_tokens=response_tokens,
                     duration_ms=llm_duration
                 )
-                monitoring.get_collector().record_system_delay('cognitive_layer', llm_duration)
+                collector.record_system_delay('cognitive_layer', llm_duration)
 
             self.log_event(
                 f"Cognitive state: goal={cognitive_state.goal}, emotion={cognitive_state.emotion}",
@@ -635,16 +1468,17 @@ class EmbodiedAssaultronCore:
             # The AI decides what to remember and reformulates it naturally (see cognitive_layer.py:223-224)
 
             # Calculate performance metrics
-            response_time = round((time.time() - start_time) * 1000)
-            self.performance_stats["total_requests"] += 1
-            self.performance_stats["last_response_time"] = response_time
-
-            if self.performance_stats["avg_response_time"] == 0:
-                self.performance_stats["avg_response_time"] = response_time
+            response_time = round((time.perf_counter() - start_time) * 1000)
+            stats = self.performance_stats
+            stats["total_requests"] += 1
+            stats["last_response_time"] = response_time
+
+            average = stats["avg_response_time"]
+            if average == 0:
+                stats["avg_response_time"] = response_time
             else:
-                self.performance_stats["avg_response_time"] = round(
-                    (self.performance_stats["avg_response_time"] + response_time) / 2
-                )
+                # int() truncates toward zero, so rises and falls move the average alike
+                stats["avg_response_time"] = average + int((response_time - average) / (1 << RESPONSE_TIME_EWMA_SHIFT))
 
             self.log_event(f"Response generated in {response_time}ms", "SYSTEM")
 
@@ -654,42 +1488,45 @@ class EmbodiedAssaultronCore:
             # Step 8: Voice synthesis (if enabled)
             # Note: Voice timing is tracked inside VoiceManager.synthesize_voice()
             if self.voice_enabled:
-                self.voice_system.synthesize_async(cognitive_state.dialogue)
+                if getattr(self, 'last_message_source', 'web') == 'web':
+                    # Web UI queues sentence chunks, so the first one plays while the rest synthesize
+                    self.voice_system.synthesize_stream(cognitive_state.dialogue)
+                else:
+                    # Other clients (Discord) expect one voice file per reply
+                    self.voice_system.synthesize_async(cognitive_state.dialogue)
 
             # Return complete response
-            return {
-                "success": True,
-                "dialogue": cognitive_state.dialogue,
-                "cognitive_state": cognitive_state.to_dict(),
-                "body_command": body_command.to_dict(),
-                "hardware_state": hardware_state,
-                "body_state": body_state.to_dict(),
-                "world_state": world_state.to_dict(),
-                "response_time": response_time,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
+            return PipelineResult(
+                success=True,
+                dialogue=cognitive_state.dialogue,
+                cognitive_state=cognitive_state.to_dict(),
+                body_command=body_command.to_dict(),
+                hardware_state=hardware_state,
+                body_state=body_state.to_dict(),
+                world_state=world_state.to_dict(),
+                response_time=response_time,
+                timestamp=now_log_ts()
+            )
 
         except Exception as e:
-            response_time = round((time.time() - start_time) * 1000)
+            response_time = round((time.perf_counter() - start_time) * 1000)
             error_msg = f"Processing failed: {str(e)}"
             self.log_event(error_msg, "ERROR")
-
-            import traceback
-            logging.getLogger('assaultron.error').exception("Exception during message processing:")
-
-            return {
-                "success": False,
-                "error": error_msg,
-                "dialogue": "System error. Give me a moment to recalibrate.",
-                "response_time": response_time,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-            }
+            get_logger('assaultron.error').exception("Exception during message processing:")
+
+            return PipelineResult(
+                success=False,
+                error=error_msg,
+                dialogue="System error. Give me a moment to recalibrate.",
+                response_time=response_time,
+                timestamp=now_log_ts()
+            )
 
     def initialize_ai(self):
         """Initialize AI connection"""
         try:
             self.log_event("Initializing AI connection...", "SYSTEM")
-            response = requests.get(f"{config.OLLAMA_URL}/api/tags", timeout=10)
+            response = http_session.get(f"{config.OLLAMA_URL}/api/tags", timeout=10)
             if response.status_code == 200:
                 self.ai_active = True
                 self.status = "AI Online - Embodied Agent Ready"
@@ -705,66 +1542,108 @@ class EmbodiedAssaultronCore:
         """Get current hardware state (backward compatible)"""
         return self.motion_controller.get_hardware_state()
     
-    def _detect_agent_task(self, message: str) -> tuple:
+    def _capture_vision_inputs(self) -> tuple:
         """
-        Detect if the user message is a task for the autonomous agent using LLM.
-        
+        Collect everything the cognitive layer needs from the vision system.
+
+        Returns:
+            Tuple (entities, scene_data, raw_frame_jpeg)
+        """
+        vision_entities = self.vision_system.get_entities_for_world_state()
+        vision_data = self.vision_system.get_scene_for_cognitive_layer()
+
+        # Get raw frame for AI vision (without detection overlay)
+        vision_image_bytes = self.vision_system.get_raw_frame_bytes()
+
+        return vision_entities, vision_data, vision_image_bytes
+
+    def _prefetch_on_partial(self, delta: str):
+        """
+        STT partial transcript callback (runs on the STT event loop).
+
+        Once the utterance reaches a few words, capture the vision snapshot
+        in the background so process_message can reuse it.
+        """
+        if self._stt_prefetch_started:
+            return
+        self._stt_partial_text += delta
+        if len(self._stt_partial_text.split()) < STT_PREFETCH_MIN_WORDS:
+            return
+        self._stt_prefetch_started = True
+        if self.vision_active:
+            pipeline_executor.submit(self._prefetch_vision, self._stt_utterance)
+
+    def _reset_stt_prefetch(self, transcript: str = ""):
+        """STT complete callback: bind the utterance's prefetch to its transcript, arm the next one"""
+        self._stt_last_transcript = (self._stt_utterance, " ".join(transcript.lower().split()))
+        self._stt_utterance += 1
+        self._stt_partial_text = ""
+        self._stt_prefetch_started = False
+
+    def _prefetch_vision(self, utterance: int):
+        """Capture vision inputs ahead of the message that will need them"""
+        try:
+            self._vision_prefetch = (time.monotonic(), utterance, self._capture_vision_inputs())
+        except Exception as e:
+            self.log_event(f"Vision prefetch failed: {e}", "ERROR")
+
+    def _take_vision_prefetch(self, message: str):
+        """
+        Return the prefetched vision inputs if they were captured for this message.
+
+        The snapshot is only used by the message whose final transcript
+        triggered it, and only while fresh. A prefetch for an utterance that
+        is still being transcribed stays in place for its own message.
+        """
+        prefetch = self._vision_prefetch
+        if prefetch is None:
+            return None
+        if time.monotonic() - prefetch[0] > STT_PREFETCH_MAX_AGE:
+            self._vision_prefetch = None
+            return None
+        utterance, transcript = self._stt_last_transcript
+        if prefetch[1] != utterance or transcript != " ".join(message.lower().split()):
+            return None
+        self._vision_prefetch = None
+        return prefetch[2]
+
+    def _detect_agent_task(self, message: str, analysis: tuple = None) -> tuple:
+        """
+        Detect if the user message is a task for the autonomous agent.
+
+        A single keyword scan skips the LLM for obvious non-tasks (explicit
+        "no agent" phrases, one-word messages); everything else goes to the
+        LLM classifier. The keywords only decide when the classifier fails.
+
         Args:
             message: User message
-            
+            analysis: analyze_message() result, if the caller already has it
+
         Returns:
             Tuple (is_task, task_description)
         """
-        # Check if user explicitly wants to bypass agent invocation (multilingual)
-        message_lower_check = message.lower()
-
-        # Multilingual no-agent phrases
-        no_agent_phrases_by_lang = {
-            "en": [
-                "don't use agent", "dont use agent",
-                "don't call agent", "dont call agent",
-                "don't use the agent", "dont use the agent",
-                "don't call the agent", "dont call the agent",
-                "don't start agent", "dont start agent",
-                "don't start the agent", "dont start the agent",
-                "don't run agent", "dont run agent",
-                "don't run the agent", "dont run the agent",
-                "don't trigger agent", "dont trigger agent",
-                "don't trigger the agent", "dont trigger the agent",
-                "no agent", "without agent", "skip agent",
-                "not for agent", "not for the agent",
-            ],
-            "fr": [
-                "n'utilise pas l'agent", "nutilise pas lagent",
-                "n'appelle pas l'agent", "nappelle pas lagent",
-                "ne démarre pas l'agent", "ne demarre pas lagent",
-                "n'utilise pas agent", "nutilise pas agent",
-                "n'appelle pas agent", "nappelle pas agent",
-                "ne lance pas l'agent", "ne lance pas lagent",
-                "pas d'agent", "sans agent", "sans l'agent",
-                "pas pour l'agent", "pas pour lagent",
-            ],
-            "es": [
-                "no uses el agente", "no uses agente",
-                "no llames al agente", "no llames agente",
-                "no inicies el agente", "no inicies agente",
-                "no ejecutes el agente", "no ejecutes agente",
-                "no actives el agente", "no actives agente",
-                "sin agente", "sin el agente",
-                "no para el agente", "no para agente",
-            ]
-        }
-
-        # Get phrases for current language, fallback to English
-        no_agent_phrases = no_agent_phrases_by_lang.get(self.language, no_agent_phrases_by_lang["en"])
+        message_lower, _, message_words = analysis or analyze_message(message)
+        found = scan_intent_keywords(self.language, message_lower)
 
-        if any(phrase in message_lower_check for phrase in no_agent_phrases):
+        # User explicitly wants to bypass agent invocation (multilingual)
+        if found & INTENT_NO_AGENT:
             return False, ""
 
         # Quick check for obvious non-tasks to save LLM calls
-        if len(message.split()) < 2:
+        if len(message_words) < 2:
             return False, ""
-            
+
+        # Repeated messages reuse the last LLM decision
+        cache_key = (self.language, " ".join(message_words))
+        now = time.monotonic()
+        with self._intent_cache_lock:
+            cached = self._intent_cache.get(cache_key)
+            if cached is not None:
+                if cached[0] > now:
+                    self._intent_cache.move_to_end(cache_key)
+                    return cached[1]
+                del self._intent_cache[cache_key]
+
         # Use LLM to classify intent (multilingual prompts)
         prompts_by_lang = {
             "en": f"""Analyze the following user message and determine if it is a request for the autonomous agent to perform a specific task (like creating files, writing code, researching, etc.) or just a conversational statement/question.
@@ -826,97 +1705,33 @@ Responde solo con JSON:
                 {"role": "system", "content": "You are an intent classifier. Respond with valid JSON only."},
                 {"role": "user", "content": prompt}
             ])
-            
-            import json
-            import re
-            
+
             # extract JSON
-            json_match = re.search(r'\{.*\}', response, re.DOTALL)
+            json_match = JSON_SPAN.search(response)
             if json_match:
                 result = json.loads(json_match.group(0))
-                return result.get("is_task", False), result.get("task_description", "")
-            
+                decision = (result.get("is_task", False), result.get("task_description", ""))
+                with self._intent_cache_lock:
+                    self._intent_cache[cache_key] = (now + INTENT_CACHE_TTL, decision)
+                    self._intent_cache.move_to_end(cache_key)
+                    if len(self._intent_cache) > INTENT_CACHE_SIZE:
+                        self._intent_cache.popitem(last=False)
+                return decision
+
         except Exception as e:
             self.log_event(f"Intent detection failed: {e}. Falling back to keyword search.", "ERROR")
-            
-        # Fallback to keyword matching if LLM fails (multilingual)
-        message_lower = message.lower()
-
-        # Multilingual action verbs
-        action_verbs_by_lang = {
-            "en": [
-                'create', 'make', 'build', 'write', 'generate', 'develop',
-                'code', 'program', 'design', 'implement', 'construct',
-                'research', 'find', 'search', 'look up', 'investigate',
-                'analyze', 'test', 'run', 'execute', 'deploy'
-            ],
-            "fr": [
-                'crée', 'créer', 'faire', 'fais', 'construire', 'construis',
-                'écrire', 'écris', 'générer', 'génère', 'développer', 'développe',
-                'coder', 'code', 'programmer', 'programme', 'concevoir', 'conçois',
-                'implémenter', 'implémente', 'rechercher', 'recherche',
-                'trouver', 'trouve', 'chercher', 'cherche', 'investiguer', 'investigue',
-                'analyser', 'analyse', 'tester', 'teste', 'exécuter', 'exécute', 'déployer', 'déploie'
-            ],
-            "es": [
-                'crear', 'crea', 'hacer', 'haz', 'construir', 'construye',
-                'escribir', 'escribe', 'generar', 'genera', 'desarrollar', 'desarrolla',
-                'codificar', 'codifica', 'programar', 'programa', 'diseñar', 'diseña',
-                'implementar', 'implementa', 'investigar', 'investiga',
-                'buscar', 'busca', 'encontrar', 'encuentra', 'analizar', 'analiza',
-                'probar', 'prueba', 'ejecutar', 'ejecuta', 'desplegar', 'despliega'
-            ]
-        }
-
-        # Multilingual creation indicators
-        creation_indicators_by_lang = {
-            "en": [
-                'website', 'web page', 'html', 'css', 'javascript', 'php',
-                'file', 'folder', 'directory', 'script', 'program',
-                'app', 'application', 'project', 'code', 'document',
-                'poem', 'story', 'article', 'report', 'summary'
-            ],
-            "fr": [
-                'site web', 'page web', 'html', 'css', 'javascript', 'php',
-                'fichier', 'dossier', 'répertoire', 'script', 'programme',
-                'app', 'application', 'projet', 'code', 'document',
-                'poème', 'histoire', 'article', 'rapport', 'résumé'
-            ],
-            "es": [
-                'sitio web', 'página web', 'html', 'css', 'javascript', 'php',
-                'archivo', 'carpeta', 'directorio', 'script', 'programa',
-                'app', 'aplicación', 'proyecto', 'código', 'documento',
-                'poema', 'historia', 'artículo', 'reporte', 'informe', 'resumen'
-            ]
-        }
-
-        # Multilingual greetings
-        greetings_by_lang = {
-            "en": ['hello', 'hi', 'hey', 'greetings'],
-            "fr": ['bonjour', 'salut', 'coucou', 'salutations', 'bonsoir'],
-            "es": ['hola', 'hey', 'saludos', 'buenas']
-        }
-
-        # Get keywords for current language
-        action_verbs = action_verbs_by_lang.get(self.language, action_verbs_by_lang["en"])
-        creation_indicators = creation_indicators_by_lang.get(self.language, creation_indicators_by_lang["en"])
-        greetings = greetings_by_lang.get(self.language, greetings_by_lang["en"])
 
-        has_action = any(verb in message_lower for verb in action_verbs)
-        has_creation = any(indicator in message_lower for indicator in creation_indicators)
+        # Fallback: an action verb plus a separate creation target
+        if found & INTENT_ACTION_AND_CREATION:
+            return True, self._strip_greeting(message)
 
-        if has_action and has_creation:
-            # Extract task description (remove greetings)
-            task = message
-            for greeting in greetings:
-                # Remove greeting at start of message
-                if task.lower().startswith(greeting):
-                    task = task[len(greeting):].strip(' ,')
-
-            return True, task
-        
         return False, ""
 
+    def _strip_greeting(self, message: str) -> str:
+        """Remove a leading greeting from a task description"""
+        pattern = _GREETING_PREFIXES.get(self.language, _GREETING_PREFIXES["en"])
+        return pattern.sub("", message, count=1).strip(' ,')
+
     def set_hardware_manual(self, led_intensity=None, hand_left=None, hand_right=None):
         """
         Manually override hardware state.
@@ -993,16 +1808,17 @@ Responde solo con JSON:
             return  # Already running
 
         self.background_monitoring_enabled = True
+        self._background_wakeup.clear()
 
         def monitoring_loop():
             while self.background_monitoring_enabled:
-                time.sleep(check_interval)
+                self._background_wakeup.wait(check_interval)
 
                 if not self.background_monitoring_enabled:
                     break
 
                 # Check if user has been inactive (not talking)
-                time_since_activity = (datetime.now() - self.notification_manager.last_user_interaction).total_seconds()
+                time_since_activity = self.notification_manager.seconds_since_user_activity()
 
                 # Only check for issues if user hasn't talked in at least 60 seconds
                 # (This means they're not actively in conversation)
@@ -1010,7 +1826,7 @@ Responde solo con JSON:
                     continue  # User is actively chatting, skip monitoring
 
                 # Check vision system for threats (only if enabled)
-                if self.vision_system.state.enabled:
+                if self.vision_active:
                     world_state = self.virtual_world.get_world_state()
                     threat_level = world_state.threat_level
 
@@ -1030,6 +1846,7 @@ Responde solo con JSON:
     def stop_background_monitoring(self):
         """Stop the background monitoring thread"""
         self.background_monitoring_enabled = False
+        self._background_wakeup.set()
         self.log_event("Background monitoring stopped", "SYSTEM")
 
 
@@ -1056,6 +1873,73 @@ def index():
 # HEALTH CHECK & METRICS ENDPOINTS
 # ============================================================================
 
+@dataclass
+class SystemSample:
+    """Host resource readings shared by /health, /api/metrics and /api/status"""
+    cpu_percent: float
+    memory_percent: float
+    memory_available: int
+    disk_percent: float
+    disk_free: int
+    process_cpu_percent: float
+    process_memory_rss: int
+    process_threads: int
+
+
+class SystemSampler:
+    """
+    Samples host CPU, memory and disk plus this process's own CPU, RSS and
+    thread count on a daemon thread.
+
+    cpu_percent(interval=...) blocks for the whole interval, so it runs here
+    instead of in request threads; readers just take the latest snapshot
+    (a single attribute load, atomic under the GIL).
+    """
+
+    def __init__(self, interval: float = 1.0):
+        self.interval = interval
+        self._process = psutil.Process()
+        self.sample = self._read(psutil.cpu_percent(interval=None))
+        self._thread = threading.Thread(target=self._loop, name='system-sampler', daemon=True)
+        self._thread.start()
+
+    def _read(self, cpu_percent: float) -> SystemSample:
+        memory = psutil.virtual_memory()
+        disk = psutil.disk_usage('.')
+        # oneshot() serves all three per-process values from a single /proc read
+        process = self._process
+        with process.oneshot():
+            process_cpu = process.cpu_percent(interval=None)
+            process_rss = process.memory_info().rss
+            process_threads = process.num_threads()
+        return SystemSample(
+            cpu_percent=cpu_percent,
+            memory_percent=memory.percent,
+            memory_available=memory.available,
+            disk_percent=disk.percent,
+            disk_free=disk.free,
+            process_cpu_percent=process_cpu,
+            process_memory_rss=process_rss,
+            process_threads=process_threads
+        )
+
+    def _loop(self):
+        while True:
+            try:
+                self.sample = self._read(psutil.cpu_percent(interval=self.interval))
+            except Exception as e:
+                logger.warning(f"System sampling failed: {e}")
+                time.sleep(self.interval)
+
+
+system_sampler = SystemSampler()
+
+
+def get_sysinfo() -> SystemSample:
+    """Return the latest host CPU/memory/disk readings (never blocks)"""
+    return system_sampler.sample
+
+
 @app.route('/health')
 @app.route('/api/health')
 def health_check():
@@ -1068,15 +1952,14 @@ def health_check():
         ai_status = "healthy" if assaultron.ai_active else "unhealthy"
 
         # Check vision system
-        vision_status = "enabled" if assaultron.vision_system.state.enabled else "disabled"
+        vision_status = "enabled" if assaultron.vision_active else "disabled"
 
         # Check voice system
         voice_status = "enabled" if assaultron.voice_enabled else "disabled"
 
         # System metrics
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('.')
+        sysinfo = get_sysinfo()
+        cpu_percent = sysinfo.cpu_percent
 
         # Uptime
         uptime_seconds = (datetime.now() - assaultron.start_time).total_seconds()
@@ -1093,17 +1976,17 @@ def health_check():
             overall_status = "degraded"
             issues.append(f"High CPU usage: {cpu_percent}%")
 
-        if memory.percent > 90:
+        if sysinfo.memory_percent > 90:
             overall_status = "degraded"
-            issues.append(f"High memory usage: {memory.percent}%")
+            issues.append(f"High memory usage: {sysinfo.memory_percent}%")
 
-        if disk.percent > 90:
+        if sysinfo.disk_percent > 90:
             overall_status = "degraded"
-            issues.append(f"Low disk space: {disk.percent}% used")
+            issues.append(f"Low disk space: {sysinfo.disk_percent}% used")
 
         return jsonify({
             "status": overall_status,
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": now_iso(),
             "uptime_seconds": int(uptime_seconds),
             "checks": {
                 "ai_engine": ai_status,
@@ -1112,10 +1995,13 @@ def health_check():
             },
             "metrics": {
                 "cpu_percent": round(cpu_percent, 2),
-                "memory_percent": round(memory.percent, 2),
-                "memory_available_mb": round(memory.available / 1024 / 1024, 2),
-                "disk_percent": round(disk.percent, 2),
-                "disk_free_gb": round(disk.free / 1024 / 1024 / 1024, 2),
+                "memory_percent": round(sysinfo.memory_percent, 2),
+                "memory_available_mb": round(sysinfo.memory_available / 1024 / 1024, 2),
+                "disk_percent": round(sysinfo.disk_percent, 2),
+                "disk_free_gb": round(sysinfo.disk_free / 1024 / 1024 / 1024, 2),
+                "process_cpu_percent": round(sysinfo.process_cpu_percent, 2),
+                "process_memory_mb": round(sysinfo.process_memory_rss / 1024 / 1024, 2),
+                "process_threads": sysinfo.process_threads,
                 "total_requests": assaultron.performance_stats["total_requests"],
                 "avg_response_time_ms": assaultron.performance_stats["avg_response_time"],
                 "last_response_time_ms": assaultron.performance_stats["last_response_time"]
@@ -1129,32 +2015,22 @@ def health_check():
         return jsonify({
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }), 500
 
 
-@app.route('/api/metrics')
-def metrics():
-    """
-    Prometheus-compatible metrics endpoint.
-    Returns metrics in plain text format.
-    """
-    try:
-        cpu_percent = psutil.cpu_percent()
-        memory = psutil.virtual_memory()
-        uptime_seconds = (datetime.now() - assaultron.start_time).total_seconds()
-
-        metrics_text = f"""# HELP assaultron_uptime_seconds Total uptime in seconds
+# Static Prometheus exposition skeleton; only the sample values change per scrape
+METRICS_TEMPLATE = """# HELP assaultron_uptime_seconds Total uptime in seconds
 # TYPE assaultron_uptime_seconds counter
-assaultron_uptime_seconds {int(uptime_seconds)}
+assaultron_uptime_seconds {uptime_seconds}
 
 # HELP assaultron_requests_total Total number of chat requests processed
 # TYPE assaultron_requests_total counter
-assaultron_requests_total {assaultron.performance_stats["total_requests"]}
+assaultron_requests_total {requests_total}
 
 # HELP assaultron_response_time_ms Average response time in milliseconds
 # TYPE assaultron_response_time_ms gauge
-assaultron_response_time_ms {assaultron.performance_stats["avg_response_time"]}
+assaultron_response_time_ms {response_time_ms}
 
 # HELP assaultron_cpu_percent CPU usage percentage
 # TYPE assaultron_cpu_percent gauge
@@ -1162,26 +2038,77 @@ assaultron_cpu_percent {cpu_percent}
 
 # HELP assaultron_memory_percent Memory usage percentage
 # TYPE assaultron_memory_percent gauge
-assaultron_memory_percent {memory.percent}
+assaultron_memory_percent {memory_percent}
 
 # HELP assaultron_ai_active AI engine status (1=active, 0=inactive)
 # TYPE assaultron_ai_active gauge
-assaultron_ai_active {1 if assaultron.ai_active else 0}
+assaultron_ai_active {ai_active}
 
 # HELP assaultron_vision_active Vision system status (1=active, 0=inactive)
 # TYPE assaultron_vision_active gauge
-assaultron_vision_active {1 if assaultron.vision_system.state.enabled else 0}
+assaultron_vision_active {vision_active}
 
 # HELP assaultron_voice_active Voice system status (1=active, 0=inactive)
 # TYPE assaultron_voice_active gauge
-assaultron_voice_active {1 if assaultron.voice_enabled else 0}
+assaultron_voice_active {voice_active}
 """
-        return metrics_text, 200, {'Content-Type': 'text/plain; charset=utf-8'}
+
+
+# Rendered /api/metrics body reused by scrapes within the max age
+METRICS_CACHE_MAX_AGE = float(os.getenv("METRICS_CACHE_MAX_AGE", "5"))
+_metrics_cache = {"expires": 0.0, "body": None}
+_metrics_cache_lock = threading.Lock()
+
+
+METRICS_CONTENT_TYPE = 'text/plain; charset=utf-8'
+
+
+def render_metrics() -> bytes:
+    """Build the UTF-8 encoded Prometheus exposition body from current state"""
+    sysinfo = get_sysinfo()
+    uptime_seconds = (datetime.now() - assaultron.start_time).total_seconds()
+
+    return METRICS_TEMPLATE.format(
+        uptime_seconds=int(uptime_seconds),
+        requests_total=assaultron.performance_stats["total_requests"],
+        response_time_ms=assaultron.performance_stats["avg_response_time"],
+        cpu_percent=sysinfo.cpu_percent,
+        memory_percent=sysinfo.memory_percent,
+        ai_active=1 if assaultron.ai_active else 0,
+        vision_active=1 if assaultron.vision_active else 0,
+        voice_active=1 if assaultron.voice_enabled else 0
+    ).encode('utf-8')
+
+
+@app.route('/api/metrics')
+def metrics():
+    """
+    Prometheus-compatible metrics endpoint.
+    Returns metrics in plain text format.
+    """
+    try:
+        # The lock single-flights the rebuild: concurrent scrapes wait for one render
+        with _metrics_cache_lock:
+            now = time.monotonic()
+            if _metrics_cache["body"] is None or now >= _metrics_cache["expires"]:
+                _metrics_cache["body"] = render_metrics()
+                _metrics_cache["expires"] = now + METRICS_CACHE_MAX_AGE
+            body = _metrics_cache["body"]
+        # Cached body is already bytes, so there is nothing left to encode per scrape
+        return Response(body, status=200, content_type=METRICS_CONTENT_TYPE)
 
     except Exception as e:
         logger.exception("Metrics generation failed")
-        return f"# ERROR: {str(e)}", 500, {'Content-Type': 'text/plain; charset=utf-8'}
+        return Response(f"# ERROR: {str(e)}", status=500, content_type=METRICS_CONTENT_TYPE)
+
 
+CHAT_IMAGES_DIR = 'ai-data/chat_images'
+CHAT_IMAGE_COPY_BUFFER = 1 << 20  # 1 MiB chunks when writing uploads to disk
+CHAT_IMAGE_MAX_AGE = 31536000  # Filenames are timestamp-unique, so images never change
+os.makedirs(CHAT_IMAGES_DIR, exist_ok=True)  # Once at startup, not per upload
+
+CHAT_IMAGE_EXTENSIONS = frozenset({'png', 'jpg', 'jpeg', 'gif', 'webp'})
+_INVALID_IMAGE_TYPE_ERROR = f"Invalid file type. Allowed: {', '.join(sorted(CHAT_IMAGE_EXTENSIONS))}"
 
 @app.route('/api/chat/upload_image', methods=['POST'])
 @limiter.limit("20 per minute")  # Rate limit for image uploads
@@ -1199,25 +2126,20 @@ def upload_chat_image():
         return jsonify({"error": "No file selected"}), 400
 
     # Validate file type
-    allowed_extensions = {'png', 'jpg', 'jpeg', 'gif', 'webp'}
     file_ext = file.filename.rsplit('.', 1)[1].lower() if '.' in file.filename else ''
 
-    if file_ext not in allowed_extensions:
-        return jsonify({"error": f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"}), 400
-
-    # Create chat_images directory if it doesn't exist
-    import os
-    os.makedirs('ai-data/chat_images', exist_ok=True)
+    if file_ext not in CHAT_IMAGE_EXTENSIONS:
+        return jsonify({"error": _INVALID_IMAGE_TYPE_ERROR}), 400
 
     # Generate unique filename
-    from datetime import datetime
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
     filename = f"chat_{timestamp}.{file_ext}"
-    filepath = os.path.join('ai-data/chat_images', filename)
+    filepath = os.path.join(CHAT_IMAGES_DIR, filename)
 
     # Save file
     try:
-        file.save(filepath)
+        with open(filepath, 'wb') as dst:
+            shutil.copyfileobj(file.stream, dst, CHAT_IMAGE_COPY_BUFFER)
         return jsonify({
             "success": True,
             "image_path": filepath,
@@ -1227,10 +2149,41 @@ def upload_chat_image():
         return jsonify({"error": f"Failed to save image: {str(e)}"}), 500
 
 
-@app.route('/chat_images/<path:filename>')
-def serve_chat_image(filename):
-    """Serve uploaded chat images"""
-    return send_from_directory('ai-data/chat_images', filename)
+@app.route('/chat_images/<path:filename>')
+def serve_chat_image(filename):
+    """Serve uploaded chat images"""
+    return send_from_directory(CHAT_IMAGES_DIR, filename, conditional=True, max_age=CHAT_IMAGE_MAX_AGE)
+
+
+CHAT_MESSAGE_MAX_CHARS = 5000
+
+@dataclass
+class ChatRequest:
+    """Validated /api/chat payload"""
+    message: str
+    image_path: str = None  # Optional image attachment
+    source: str = 'web'  # Track message source (web, discord, etc.)
+
+    @classmethod
+    def parse(cls, data):
+        """Validate a decoded JSON body; returns (ChatRequest, None) or (None, error)"""
+        if not isinstance(data, dict):
+            return None, "Invalid JSON body"
+
+        message = data.get('message', '')
+        image_path = data.get('image_path')
+        source = data.get('source', 'web')
+        if not (isinstance(message, str) and isinstance(source, str)
+                and (image_path is None or isinstance(image_path, str))):
+            return None, "Invalid field types"
+
+        message = message.strip()
+        if not message:
+            return None, "Empty message"
+        if len(message) > CHAT_MESSAGE_MAX_CHARS:
+            return None, f"Message too long (max {CHAT_MESSAGE_MAX_CHARS} characters)"
+
+        return cls(message, image_path or None, source), None
 
 
 @app.route('/api/chat', methods=['POST'])
@@ -1240,17 +2193,13 @@ def chat():
     Main chat endpoint - processes user message through embodied agent pipeline.
     Rate limited to 100 requests per minute to prevent abuse while allowing natural conversation.
     """
-    data = request.get_json()
-    message = data.get('message', '').strip()
-    image_path = data.get('image_path', None)  # Optional image attachment
-    source = data.get('source', 'web')  # Track message source (web, discord, etc.)
-
-    if not message:
-        return jsonify({"error": "Empty message"}), 400
-
-    # Input validation
-    if len(message) > 5000:
-        return jsonify({"error": "Message too long (max 5000 characters)"}), 400
+    # Malformed or non-JSON bodies are a 400, not an exception
+    chat_request, error = ChatRequest.parse(request.get_json(silent=True))
+    if error:
+        return jsonify({"error": error}), 400
+    message = chat_request.message
+    image_path = chat_request.image_path
+    source = chat_request.source
 
     # Log received input
     if image_path:
@@ -1262,8 +2211,8 @@ def chat():
     assaultron.last_message_source = source
 
     # Auto-detect Discord bot activity
-    if MONITORING_ENABLED and source == 'discord':
-        monitoring.get_collector().update_system_status(discord_bot_active=True)
+    if source == 'discord':
+        collector.update_system_status(discord_bot_active=True)
 
     # Track message pipeline start
     pipeline_start = time.time()
@@ -1275,54 +2224,54 @@ def chat():
     pipeline_duration = (time.time() - pipeline_start) * 1000
 
     # Record monitoring metrics
-    if MONITORING_ENABLED:
-        monitoring.get_collector().record_message_pipeline('full_pipeline', pipeline_duration)
+    collector.queue_message_pipeline('full_pipeline', pipeline_duration)
 
-    if result["success"]:
+    if result.success:
         # Return response in format compatible with existing web UI
         return jsonify({
-            "response": result["dialogue"],
-            "timestamp": result["timestamp"],
-            "cognitive_state": result.get("cognitive_state"),
-            "hardware_state": result.get("hardware_state"),
-            "body_state": result.get("body_state"),
+            "response": result.dialogue,
+            "timestamp": result.timestamp,
+            "cognitive_state": result.cognitive_state,
+            "hardware_state": result.hardware_state,
+            "body_state": result.body_state,
             "provider": Config.LLM_PROVIDER,
-            "model": Config.OPENROUTER_MODEL if Config.LLM_PROVIDER == "openrouter" else (Config.GEMINI_MODEL if Config.LLM_PROVIDER == "gemini" else Config.AI_MODEL),
+            "model": Config.ACTIVE_MODEL,
             "voice_enabled": assaultron.voice_enabled
         })
     else:
         # Record error
-        if MONITORING_ENABLED:
-            monitoring.get_collector().record_error('chat_error', 'api', result.get("error", "Unknown error"))
+        collector.record_error('chat_error', 'api', result.error or "Unknown error")
 
         return jsonify({
-            "response": result["dialogue"],
-            "error": result.get("error"),
-            "timestamp": result["timestamp"]
+            "response": result.dialogue,
+            "error": result.error,
+            "timestamp": result.timestamp
         }), 500
 
 
 @app.route('/api/logs')
+@limiter.exempt  # Polled by the UI - read-only, no limiter bookkeeping
 def get_logs():
     """Get system logs"""
-    return jsonify(assaultron.system_logs[-50:])
+    return jsonify(assaultron.recent_logs(API_LOGS_LIMIT))
 
 
 @app.route('/api/status')
+@limiter.exempt  # Polled by the UI every few seconds
 def get_status():
     """Get system status"""
     uptime_seconds = (datetime.now() - assaultron.start_time).total_seconds()
 
     # Get system stats
     try:
-        cpu_percent = psutil.cpu_percent()
-        memory = psutil.virtual_memory()
-        memory_percent = memory.percent
+        sysinfo = get_sysinfo()
+        cpu_percent = sysinfo.cpu_percent
+        memory_percent = sysinfo.memory_percent
     except:
         cpu_percent = 0
         memory_percent = 0
 
-    current_model = Config.OPENROUTER_MODEL if Config.LLM_PROVIDER == "openrouter" else (Config.GEMINI_MODEL if Config.LLM_PROVIDER == "gemini" else Config.AI_MODEL)
+    current_model = Config.ACTIVE_MODEL
 
     return jsonify({
         "status": assaultron.status,
@@ -1356,22 +2305,24 @@ def get_history():
 
 
 @app.route('/api/hardware')
+@limiter.exempt
 def get_hardware():
     """Get current hardware state (backward compatible)"""
     return jsonify(assaultron.get_hardware_state())
 
 
 @app.route('/api/memory')
+@limiter.exempt
 def get_memory():
     """Get AI memory context (short-term)"""
-    memories = assaultron.cognitive_engine.memory_context[-20:]
+    memories = assaultron.cognitive_engine.recent_memories(20)
     return jsonify(memories)
 
 
 @app.route('/api/embodied/long_term_memories')
 def get_long_term_memories():
     """Get AI core memories"""
-    return jsonify(assaultron.cognitive_engine.memory_context)
+    return jsonify(list(assaultron.cognitive_engine.memory_context))
 
 
 @app.route('/api/embodied/long_term_memories/delete', methods=['POST'])
@@ -1380,8 +2331,10 @@ def delete_long_term_memory():
     data = request.get_json()
     index = data.get('index')
     
-    if index is not None and 0 <= index < len(assaultron.cognitive_engine.memory_context):
-        content = assaultron.cognitive_engine.memory_context.pop(index)["content"]
+    memories = assaultron.cognitive_engine.memory_context
+    if index is not None and 0 <= index < len(memories):
+        content = memories[index]["content"]
+        del memories[index]
         assaultron.cognitive_engine._save_memories()
         assaultron.log_event(f"Core memory deleted: {content}", "MEMORY")
         return jsonify({"success": True})
@@ -1398,10 +2351,11 @@ def add_long_term_memory():
     if not content:
         return jsonify({"error": "Content required"}), 400
         
-    if len(assaultron.cognitive_engine.memory_context) >= 50:
-        return jsonify({"error": "Memory limit reached (max 50)"}), 400
+    memories = assaultron.cognitive_engine.memory_context
+    if len(memories) >= memories.maxlen:
+        return jsonify({"error": f"Memory limit reached (max {memories.maxlen})"}), 400
         
-    assaultron.cognitive_engine.memory_context.append({
+    memories.append({
         "content": content,
         "timestamp": datetime.now().isoformat()
     })
@@ -1500,14 +2454,24 @@ def get_behavior_history():
     return jsonify(history)
 
 
+# The behavior library is static, so its responses are serialized once
+_BEHAVIOR_LIBRARY = describe_behavior_library()
+_BEHAVIORS_BODY = PrebuiltJSON({
+    "behaviors": _BEHAVIOR_LIBRARY,
+    "count": len(_BEHAVIOR_LIBRARY)
+})
+_LEGACY_TOOLS_BODY = PrebuiltJSON({
+    "deprecated": True,
+    "message": "Tool system replaced with embodied agent architecture",
+    "behaviors": _BEHAVIOR_LIBRARY,
+    "info": "The AI now reasons about goals and emotions instead of using tools"
+})
+
+
 @app.route('/api/embodied/behaviors')
 def get_available_behaviors():
     """Get list of available behaviors"""
-    behaviors = describe_behavior_library()
-    return jsonify({
-        "behaviors": behaviors,
-        "count": len(behaviors)
-    })
+    return _BEHAVIORS_BODY.response()
 
 
 @app.route('/api/embodied/state_history')
@@ -1745,8 +2709,7 @@ def start_voice_server():
             assaultron.log_event("Assaultron voice system online", "VOICE")
 
             # Update monitoring
-            if MONITORING_ENABLED:
-                monitoring.get_collector().update_system_status(voice_enabled=True)
+            collector.update_system_status(voice_enabled=True)
             # Send notification that voice is activated
             assaultron._broadcast_voice_notification("Voice system activated")
             return jsonify({
@@ -1777,8 +2740,7 @@ def stop_voice_server():
         assaultron.log_event("Voice system stopped", "VOICE")
 
         # Update monitoring
-        if MONITORING_ENABLED:
-            monitoring.get_collector().update_system_status(voice_enabled=False)
+        collector.update_system_status(voice_enabled=False)
 
         return jsonify({"success": True, "voice_enabled": False})
     except Exception as e:
@@ -1810,12 +2772,15 @@ def voice_status():
     return jsonify(status)
 
 
+VOICE_AUDIO_MAX_AGE = 86400  # Synthesized files are timestamp-named and never rewritten
+
 @app.route('/api/voice/audio/<filename>')
 def serve_audio(filename):
-    """Serve generated audio files to the frontend"""
+    """Serve generated audio files to the frontend (cacheable, 304 on revalidation)"""
     try:
         audio_dir = assaultron.voice_system.audio_output_dir
-        return send_from_directory(audio_dir, filename, mimetype='audio/wav')
+        return send_from_directory(audio_dir, filename, mimetype='audio/wav',
+                                   conditional=True, max_age=VOICE_AUDIO_MAX_AGE)
     except Exception as e:
         return jsonify({"error": str(e)}), 404
 
@@ -1825,42 +2790,40 @@ def serve_audio(filename):
 def voice_events():
     """Server-Sent Events stream for real-time voice notifications"""
     def event_stream():
-        # Create a queue for this client
-        client_queue = Queue()
+        broadcaster = assaultron.voice_events
+        # Only events published after the client connects are delivered
+        seq = broadcaster.seq
 
-        # Add queue to broadcast list
-        if not hasattr(assaultron, 'voice_event_queues'):
-            assaultron.voice_event_queues = []
-        assaultron.voice_event_queues.append(client_queue)
+        # Send initial connection message
+        yield SSE_CONNECTED_FRAME
 
-        try:
-            # Send initial connection message
-            yield f"data: {json.dumps({'type': 'connected'})}\n\n"
-
-            # Listen for events
-            while True:
-                try:
-                    # Wait for events with timeout to send keepalive
-                    message = client_queue.get(timeout=30)
-                    yield f"data: {json.dumps(message)}\n\n"
-                except:
-                    # Send keepalive comment every 30 seconds
-                    yield ": keepalive\n\n"
-        except GeneratorExit:
-            # Client disconnected
-            if client_queue in assaultron.voice_event_queues:
-                assaultron.voice_event_queues.remove(client_queue)
+        # Listen for events (shared pre-serialized SSE frames); nothing to
+        # unregister when the client disconnects
+        while True:
+            seq, frames = broadcaster.wait(seq, SSE_KEEPALIVE_INTERVAL)
+            # Send keepalive comment when nothing happened for a while
+            yield b''.join(frames) if frames else SSE_KEEPALIVE_FRAME
 
-    return Response(event_stream(), mimetype='text/event-stream')
+    headers, body = sse_stream(request.environ, event_stream())
+    return Response(body, headers=headers)
 
 
 # ============================================================================
 # SPEECH-TO-TEXT ENDPOINTS
 # ============================================================================
 
-@app.route('/api/stt/start', methods=['POST'])
-def start_stt():
-    """Start speech-to-text transcription"""
+# STT control actions: action -> (log message, resulting status)
+STT_ACTIONS = {
+    "start": ("STT started listening", "listening"),
+    "stop": ("STT stopped listening", "stopped"),
+    "pause": ("STT paused", "paused"),  # e.g. during AI speech
+    "resume": ("STT resumed", "listening"),
+}
+
+
+@app.route('/api/stt/<any(start, stop, pause, resume):action>', methods=['POST'])
+def stt_action(action):
+    """Start, stop, pause or resume speech-to-text transcription"""
     try:
         if not assaultron.stt_manager:
             return jsonify({
@@ -1868,101 +2831,27 @@ def start_stt():
                 "error": "STT not available (MISTRAL_KEY not configured or dependencies missing)"
             }), 503
 
-        success = assaultron.stt_manager.start_listening()
+        success = getattr(assaultron.stt_manager, f"{action}_listening")()
 
         if success:
-            assaultron.log_event("STT started listening", "STT")
+            log_message, status = STT_ACTIONS[action]
+            assaultron.log_event(log_message, "STT")
             return jsonify({
                 "success": True,
-                "status": "listening"
+                "status": status
             })
         else:
             return jsonify({
                 "success": False,
-                "error": "Failed to start STT"
+                "error": f"Failed to {action} STT"
             }), 500
 
     except Exception as e:
-        error_msg = f"STT startup exception: {str(e)}"
+        error_msg = f"STT {action} exception: {str(e)}"
         assaultron.log_event(error_msg, "ERROR")
         return jsonify({"success": False, "error": error_msg}), 500
 
 
-@app.route('/api/stt/stop', methods=['POST'])
-def stop_stt():
-    """Stop speech-to-text transcription"""
-    try:
-        if not assaultron.stt_manager:
-            return jsonify({"success": False, "error": "STT not available"}), 503
-
-        success = assaultron.stt_manager.stop_listening()
-
-        if success:
-            assaultron.log_event("STT stopped listening", "STT")
-            return jsonify({
-                "success": True,
-                "status": "stopped"
-            })
-        else:
-            return jsonify({
-                "success": False,
-                "error": "Failed to stop STT"
-            }), 500
-
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
-@app.route('/api/stt/pause', methods=['POST'])
-def pause_stt():
-    """Temporarily pause STT (e.g., during AI speech)"""
-    try:
-        if not assaultron.stt_manager:
-            return jsonify({"success": False, "error": "STT not available"}), 503
-
-        success = assaultron.stt_manager.pause_listening()
-
-        if success:
-            assaultron.log_event("STT paused", "STT")
-            return jsonify({
-                "success": True,
-                "status": "paused"
-            })
-        else:
-            return jsonify({
-                "success": False,
-                "error": "Failed to pause STT"
-            }), 500
-
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
-@app.route('/api/stt/resume', methods=['POST'])
-def resume_stt():
-    """Resume STT after pause"""
-    try:
-        if not assaultron.stt_manager:
-            return jsonify({"success": False, "error": "STT not available"}), 503
-
-        success = assaultron.stt_manager.resume_listening()
-
-        if success:
-            assaultron.log_event("STT resumed", "STT")
-            return jsonify({
-                "success": True,
-                "status": "listening"
-            })
-        else:
-            return jsonify({
-                "success": False,
-                "error": "Failed to resume STT"
-            }), 500
-
-    except Exception as e:
-        return jsonify({"success": False, "error": str(e)}), 500
-
-
 @app.route('/api/stt/status')
 @limiter.exempt  # Exempt from rate limiting
 def stt_status():
@@ -1982,40 +2871,55 @@ def stt_status():
         return jsonify({"available": False, "error": str(e)})
 
 
-@app.route('/api/stt/events')
-@limiter.exempt
-def stt_events():
+def stt_event_stream():
     """Server-Sent Events stream for real-time transcription"""
-    def event_stream():
-        # Create a queue for this client
-        client_queue = Queue()
+    # Bounded buffer for this client: a stalled tab drops old frames
+    # instead of growing without limit or slowing the STT loop
+    channel = ClientChannel()
+
+    # Add channel to STT manager and broadcast list
+    if assaultron.stt_manager:
+        assaultron.stt_manager.add_event_channel(channel)
+    assaultron.stt_event_channels.add(channel)
 
-        # Add queue to STT manager and broadcast list
+    try:
+        # Send initial connection message
+        yield SSE_CONNECTED_FRAME
+
+        # Listen for events (pre-serialized SSE frames, encoded once by the
+        # producer); everything pending goes out in a single write
+        while not channel.closed:
+            # Send keepalive comment when nothing happened for a while
+            yield channel.drain(SSE_KEEPALIVE_INTERVAL) or SSE_KEEPALIVE_FRAME
+    finally:
+        # Client disconnected
         if assaultron.stt_manager:
-            assaultron.stt_manager.add_event_queue(client_queue)
-        assaultron.stt_event_queues.append(client_queue)
+            assaultron.stt_manager.remove_event_channel(channel)
+        assaultron.stt_event_channels.discard(channel)
 
-        try:
-            # Send initial connection message
-            yield f"data: {json.dumps({'type': 'connected'})}\n\n"
 
-            # Listen for events
-            while True:
-                try:
-                    # Wait for events with timeout to send keepalive
-                    message = client_queue.get(timeout=30)
-                    yield f"data: {json.dumps(message)}\n\n"
-                except:
-                    # Send keepalive comment every 30 seconds
-                    yield ": keepalive\n\n"
-        except GeneratorExit:
-            # Client disconnected
-            if assaultron.stt_manager:
-                assaultron.stt_manager.remove_event_queue(client_queue)
-            if client_queue in assaultron.stt_event_queues:
-                assaultron.stt_event_queues.remove(client_queue)
-
-    return Response(event_stream(), mimetype='text/event-stream')
+def stt_events_wsgi(environ, start_response):
+    """
+    /api/stt/events as a bare WSGI app.
+
+    Mounted in front of Flask, so the long-lived stream skips the request
+    context, before/after hooks and limiter wrapping entirely.
+    """
+    if environ.get('REQUEST_METHOD') not in ('GET', 'HEAD'):
+        start_response('405 METHOD NOT ALLOWED', [('Allow', 'GET, HEAD'), ('Content-Length', '0')])
+        return [b'']
+    headers, body = sse_stream(environ, stt_event_stream())
+    start_response('200 OK', headers)
+    return body
+
+
+app.wsgi_app = DispatcherMiddleware(app.wsgi_app, {'/api/stt/events': stt_events_wsgi})
+
+
+@ttl_memoize(DEVICE_LIST_TTL)
+def cached_audio_devices():
+    """MistralSTTManager.list_audio_devices, re-enumerated at most every DEVICE_LIST_TTL seconds"""
+    return MistralSTTManager.list_audio_devices()
 
 
 @app.route('/api/stt/devices')
@@ -2026,8 +2930,7 @@ def list_stt_devices():
         if not assaultron.stt_manager:
             return jsonify({"devices": [], "error": "STT not available"}), 503
 
-        from stt_manager import MistralSTTManager
-        devices = MistralSTTManager.list_audio_devices()
+        devices = cached_audio_devices()
 
         return jsonify({"devices": devices})
 
@@ -2035,6 +2938,26 @@ def list_stt_devices():
         return jsonify({"devices": [], "error": str(e)}), 500
 
 
+@dataclass
+class SetDeviceRequest:
+    """Validated /api/stt/set_device payload"""
+    device_index: Optional[int] = None  # None selects the system default
+
+    @classmethod
+    def parse(cls, data):
+        """Validate a decoded JSON body; returns (SetDeviceRequest, None) or (None, error)"""
+        if not isinstance(data, dict):
+            return None, "Invalid JSON body"
+
+        device_index = data.get('device_index')
+        if device_index is None or device_index == "":
+            return cls(None), None
+        try:
+            return cls(int(device_index)), None
+        except (ValueError, TypeError):
+            return None, f"Invalid device index: {device_index!r}"
+
+
 @app.route('/api/stt/set_device', methods=['POST'])
 def set_stt_device():
     """Change the microphone device"""
@@ -2042,15 +2965,12 @@ def set_stt_device():
         if not assaultron.stt_manager:
             return jsonify({"success": False, "error": "STT not available"}), 503
 
-        data = request.get_json()
-        device_index = data.get('device_index')
-
-        # Convert to int or None
-        if device_index is not None and device_index != "":
-            device_index = int(device_index)
-        else:
-            device_index = None
+        device_request, error = SetDeviceRequest.parse(request.get_json(silent=True))
+        if error:
+            return jsonify({"success": False, "error": error}), 400
+        device_index = device_request.device_index
 
+        cached_audio_devices.cache_clear()
         success = assaultron.stt_manager.set_device(device_index)
 
         if success:
@@ -2103,7 +3023,7 @@ def update_discord_status():
         active = data.get('active', False)
 
         if MONITORING_ENABLED:
-            monitoring.get_collector().update_system_status(discord_bot_active=active)
+            collector.update_system_status(discord_bot_active=active)
             return jsonify({"success": True, "discord_bot_active": active}), 200
         else:
             return jsonify({"success": False, "error": "Monitoring not enabled"}), 503
@@ -2135,12 +3055,7 @@ def get_available_tools():
     Legacy endpoint - tools are deprecated in embodied architecture.
     Returns behavior library instead.
     """
-    return jsonify({
-        "deprecated": True,
-        "message": "Tool system replaced with embodied agent architecture",
-        "behaviors": describe_behavior_library(),
-        "info": "The AI now reasons about goals and emotions instead of using tools"
-    })
+    return _LEGACY_TOOLS_BODY.response()
 
 
 # ============================================================================
@@ -2154,31 +3069,52 @@ def get_vision_status():
     return jsonify(state.to_dict())
 
 
+@ttl_memoize(DEVICE_LIST_TTL)
+def cached_cameras():
+    """vision_system.enumerate_cameras, re-probed at most every DEVICE_LIST_TTL seconds"""
+    return assaultron.vision_system.enumerate_cameras()
+
+
 @app.route('/api/vision/cameras')
 def get_available_cameras():
     """List available cameras"""
-    cameras = assaultron.vision_system.enumerate_cameras()
+    cameras = cached_cameras()
     return jsonify({
         "cameras": cameras,
         "current_camera": assaultron.vision_system.state.camera_id
     })
 
 
+@dataclass
+class SelectCameraRequest:
+    """Validated /api/vision/select_camera payload"""
+    camera_id: int = 0
+
+    @classmethod
+    def parse(cls, data):
+        """Validate a decoded JSON body; returns (SelectCameraRequest, None) or (None, error)"""
+        if not isinstance(data, dict):
+            return None, "Invalid JSON body"
+
+        camera_id = data.get('camera_id', 0)
+        try:
+            return cls(int(camera_id)), None
+        except (ValueError, TypeError) as e:
+            return None, f"Invalid camera ID: {e}"
+
+
 @app.route('/api/vision/select_camera', methods=['POST'])
 def select_camera():
     """Select a camera by ID"""
-    data = request.get_json()
-    camera_id = data.get('camera_id', 0)
-    
-    try:
-        camera_id = int(camera_id)
-        success = assaultron.vision_system.select_camera(camera_id)
-        return jsonify({
-            "success": success,
-            "camera_id": camera_id
-        })
-    except (ValueError, TypeError) as e:
-        return jsonify({"error": f"Invalid camera ID: {e}"}), 400
+    camera_request, error = SelectCameraRequest.parse(request.get_json(silent=True))
+    if error:
+        return jsonify({"error": error}), 400
+
+    success = assaultron.vision_system.select_camera(camera_request.camera_id)
+    return jsonify({
+        "success": success,
+        "camera_id": camera_request.camera_id
+    })
 
 
 @app.route('/api/vision/start', methods=['POST'])
@@ -2257,7 +3193,7 @@ def get_vision_frame():
         return jsonify({
             "success": True,
             "frame": frame_b64,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         })
     else:
         return jsonify({
@@ -2266,17 +3202,86 @@ def get_vision_frame():
         }), 404
 
 
-@app.route('/api/vision/entities')
-def get_vision_entities():
-    """Get currently detected entities"""
+@app.route('/api/vision/frame.jpg')
+@limiter.exempt  # Polled at 10 FPS by the vision panel
+def get_vision_frame_jpeg():
+    """Get current frame as raw JPEG bytes (no base64, no JSON)"""
+    frame_jpeg = assaultron.vision_system.get_frame_jpeg_bytes()
+    if frame_jpeg is None:
+        return jsonify({
+            "success": False,
+            "error": "No frame available"
+        }), 404
+    # One bytes body goes out in a single write; wsgi.file_wrapper/sendfile
+    # only pays off for real file descriptors, not an in-memory frame
+    response = Response(frame_jpeg, mimetype='image/jpeg')
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+MJPEG_MAX_FPS = 15  # Per-viewer cap; the capture loop runs at up to 30 FPS
+MJPEG_IDLE_TIMEOUT = 5.0  # Re-send the last frame after this long without a new one
+MJPEG_BOUNDARY = b'frame'
+
+
+@app.route('/api/vision/stream.mjpg')
+@limiter.exempt  # One long-lived connection per viewer
+def vision_stream_mjpeg():
+    """Push annotated frames over one connection (multipart/x-mixed-replace)"""
+    if not assaultron.vision_active:
+        return jsonify({
+            "success": False,
+            "error": "Vision system not active"
+        }), 404
+    vision_system = assaultron.vision_system
+
+    def generate():
+        seq = 0
+        min_interval = 1.0 / MJPEG_MAX_FPS
+        part_header = b'--' + MJPEG_BOUNDARY + b'\r\nContent-Type: image/jpeg\r\nContent-Length: '
+        # Woken by the capture loop for each new frame; ends when capture stops
+        while vision_system.is_capturing:
+            seq, jpeg = vision_system.wait_for_frame(seq, MJPEG_IDLE_TIMEOUT)
+            if jpeg is None:
+                continue
+            sent_at = time.monotonic()
+            yield b''.join((part_header, str(len(jpeg)).encode('ascii'), b'\r\n\r\n', jpeg, b'\r\n'))
+            remaining = min_interval - (time.monotonic() - sent_at)
+            if remaining > 0:
+                time.sleep(remaining)
+
+    return Response(generate(), mimetype='multipart/x-mixed-replace; boundary=' + MJPEG_BOUNDARY.decode('ascii'))
+
+
+CBOR_MIMETYPE = 'application/cbor'
+
+
+def vision_entities_payload() -> dict:
+    """Detected entities summary shared by the JSON and CBOR routes"""
     state = assaultron.vision_system.get_state()
-    return jsonify({
+    return {
         "entities": [e.to_dict() for e in state.entities],
         "person_count": state.person_count,
         "object_count": state.object_count,
         "scene_description": state.scene_description,
         "threat_assessment": state.threat_assessment
-    })
+    }
+
+
+@app.route('/api/vision/entities')
+def get_vision_entities():
+    """Get currently detected entities (CBOR when the client prefers it via Accept)"""
+    if CBOR_AVAILABLE and request.accept_mimetypes.best_match(('application/json', CBOR_MIMETYPE)) == CBOR_MIMETYPE:
+        return Response(cbor2.dumps(vision_entities_payload()), mimetype=CBOR_MIMETYPE)
+    return jsonify(vision_entities_payload())
+
+
+@app.route('/api/vision/entities.cbor')
+def get_vision_entities_cbor():
+    """Get currently detected entities as CBOR (compact binary JSON superset)"""
+    if not CBOR_AVAILABLE:
+        return jsonify({"error": "CBOR encoding not available (install cbor2)"}), 501
+    return Response(cbor2.dumps(vision_entities_payload()), mimetype=CBOR_MIMETYPE)
 
 
 @app.route('/api/vision/scene')
@@ -2286,21 +3291,40 @@ def get_vision_scene():
     return jsonify(data)
 
 
+@dataclass
+class ConfidenceRequest:
+    """Validated /api/vision/confidence payload"""
+    confidence: float = 0.5
+
+    @classmethod
+    def parse(cls, data):
+        """Validate a decoded JSON body; returns (ConfidenceRequest, None) or (None, error)"""
+        if not isinstance(data, dict):
+            return None, "Invalid JSON body"
+
+        confidence = data.get('confidence', 0.5)
+        try:
+            return cls(float(confidence)), None
+        except (ValueError, TypeError) as e:
+            return None, f"Invalid confidence value: {e}"
+
+
 @app.route('/api/vision/confidence', methods=['POST'])
 def set_detection_confidence():
     """Set detection confidence threshold"""
-    data = request.get_json()
-    confidence = data.get('confidence', 0.5)
-    
-    try:
-        confidence = float(confidence)
-        assaultron.vision_system.set_detection_confidence(confidence)
-        return jsonify({
-            "success": True,
-            "confidence": confidence
-        })
-    except (ValueError, TypeError) as e:
-        return jsonify({"error": f"Invalid confidence value: {e}"}), 400
+    confidence_request, error = ConfidenceRequest.parse(request.get_json(silent=True))
+    if error:
+        return jsonify({"error": error}), 400
+
+    assaultron.vision_system.set_detection_confidence(confidence_request.confidence)
+    return jsonify({
+        "success": True,
+        "confidence": confidence_request.confidence
+    })
+
+
+# Serialized GET /api/settings/provider body, keyed on (provider, model)
+_provider_body_cache = (None, b"")
 
 
 @app.route('/api/settings/provider', methods=['GET', 'POST'])
@@ -2321,12 +3345,14 @@ def handle_provider_settings():
         except ValueError as e:
             return jsonify({"error": str(e)}), 400
 
-    # GET request
-    current_model = Config.OPENROUTER_MODEL if Config.LLM_PROVIDER == "openrouter" else (Config.GEMINI_MODEL if Config.LLM_PROVIDER == "gemini" else Config.AI_MODEL)
-    return jsonify({
-        "provider": Config.LLM_PROVIDER,
-        "model": current_model
-    })
+    # GET request: the body only changes when the provider or model does
+    global _provider_body_cache
+    key = (Config.LLM_PROVIDER, Config.ACTIVE_MODEL)
+    cached = _provider_body_cache
+    if cached[0] != key:
+        cached = (key, dumps_bytes({"provider": key[0], "model": key[1]}))
+        _provider_body_cache = cached  # Single tuple swap, safe without a lock
+    return Response(cached[1], mimetype='application/json')
 
 
 @app.route('/api/settings/language', methods=['GET', 'POST'])
@@ -2398,7 +3424,7 @@ def get_available_models():
     if provider == 'ollama' or provider == 'all':
         # Get installed Ollama models
         try:
-            response = requests.get(f"{Config.OLLAMA_URL}/api/tags", timeout=5)
+            response = http_session.get(f"{Config.OLLAMA_URL}/api/tags", timeout=5)
             if response.status_code == 200:
                 data = response.json()
                 ollama_models = [model['name'] for model in data.get('models', [])]
@@ -2482,10 +3508,10 @@ def agent_task():
         return jsonify({"error": "Empty task"}), 400
     
     # Generate task ID
-    task_id = f"task_{int(time.time())}_{len(assaultron.agent_tasks)}"
+    task_id = assaultron.agent_tasks.new_task_id()
     
-    # Progress callback for updates
-    progress_updates = []
+    # Progress callback for updates (bounded; appends from the agent thread are atomic)
+    progress_updates = deque(maxlen=agent_ai_helpers.AGENT_PROGRESS_MAX)
     
     def progress_callback(update):
         progress_updates.append(update)
@@ -2503,7 +3529,7 @@ def agent_task():
                 "status": "completed" if result.get("success") else "failed",
                 "result": result,
                 "progress": progress_updates,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                "timestamp": now_log_ts()
             }
             
             # Send final message to user
@@ -2525,20 +3551,27 @@ def agent_task():
                 "status": "error",
                 "error": str(e),
                 "progress": progress_updates,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                "timestamp": now_log_ts()
             }
     
-    # Start background thread
-    thread = threading.Thread(target=run_agent_task, daemon=True)
-    thread.start()
-    
-    # Initialize task tracking
+    # Initialize task tracking before the thread can write its final record
     assaultron.agent_tasks[task_id] = {
         "task": task,
         "status": "running",
         "progress": progress_updates,
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        "timestamp": now_log_ts()
     }
+
+    # Queue on the shared agent pool
+    if not submit_agent_task(task_id, run_agent_task):
+        assaultron.agent_tasks[task_id] = {
+            "task": task,
+            "status": "rejected",
+            "error": "Agent queue is full",
+            "progress": progress_updates,
+            "timestamp": now_log_ts()
+        }
+        return jsonify({"error": "Agent queue is full, try again later"}), 429
     
     return jsonify({
         "success": True,
@@ -2550,16 +3583,16 @@ def agent_task():
 @app.route('/api/agent/status/<task_id>')
 def agent_status(task_id):
     """Get the status of an agent task."""
-    if task_id not in assaultron.agent_tasks:
+    task_info = assaultron.agent_tasks.get(task_id)
+    if task_info is None:
         return jsonify({"error": "Task not found"}), 404
     
-    task_info = assaultron.agent_tasks[task_id]
-    
     return jsonify({
         "task_id": task_id,
         "task": task_info["task"],
         "status": task_info["status"],
-        "progress": task_info.get("progress", []),
+        # list() of a deque runs entirely under the GIL, so this is a consistent snapshot
+        "progress": list(task_info.get("progress", ())),
         "result": task_info.get("result"),
         "error": task_info.get("error"),
         "timestamp": task_info["timestamp"]
@@ -2570,6 +3603,7 @@ def agent_status(task_id):
 def agent_tasks():
     """List all agent tasks."""
     tasks = []
+    # Snapshot taken under the registry lock; serialized after it is released
     for task_id, task_info in assaultron.agent_tasks.items():
         tasks.append({
             "task_id": task_id,
@@ -2584,17 +3618,20 @@ def agent_tasks():
 @app.route('/api/agent/stop/<task_id>', methods=['POST'])
 def agent_stop(task_id):
     """Stop a running agent task."""
-    if task_id not in assaultron.agent_tasks:
+    if assaultron.agent_tasks.get(task_id) is None:
         return jsonify({"error": "Task not found"}), 404
     
-    task_info = assaultron.agent_tasks[task_id]
-    
-    if task_info["status"] != "running":
+    # Check-and-set in one step so two stop requests cannot both succeed
+    if not assaultron.agent_tasks.transition(task_id, "running", "stopped"):
         return jsonify({"error": "Task is not running"}), 400
     
+    # A task still waiting for a worker is simply dropped from the queue
+    future = agent_futures.get(task_id)
+    if future is not None and future.cancel():
+        return jsonify({"success": True, "message": "Agent task cancelled before it started"})
+    
     # Stop the agent
     assaultron.agent_logic.stop()
-    task_info["status"] = "stopped"
     
     return jsonify({"success": True, "message": "Agent task stopped"})
 
@@ -2603,12 +3640,76 @@ def agent_stop(task_id):
 # EMAIL & GIT MANAGEMENT ENDPOINTS
 # ============================================================================
 
+# Manager singletons, shared with the agent tools and bound once for every route
+email_manager = get_email_manager()
+git_manager = get_git_manager()
+GIT_SANDBOX = Path(git_manager.sandbox_base)
+
+# SMTP/IMAP calls run here instead of on the request thread
+email_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='email')
+email_jobs = AgentTaskRegistry(prefix="email")
+
+# Short-lived read_emails results so repeated dashboard polls hit IMAP once
+EMAIL_READ_CACHE_SIZE = 32
+EMAIL_READ_CACHE_TTL = 10  # seconds
+_email_read_cache = OrderedDict()  # (folder, limit, unread_only) -> (fetched_at, emails)
+_email_read_cache_lock = threading.Lock()
+
+
+def _submit_email_job(action: str, call, details: dict):
+    """
+    Run an email_manager call on the email executor and track it in email_jobs.
+
+    call returns (success, error); the finished record carries details plus
+    the outcome. Returns the job id for /api/email/job/<job_id>.
+    """
+    job_id = email_jobs.new_task_id()
+    email_jobs[job_id] = {"action": action, "status": "running", **details}
+
+    def run():
+        try:
+            success, error = call()
+        except Exception as e:
+            success, error = False, str(e)
+        # Log before publishing, so a poller that sees "failed" also finds the log entry
+        if not success:
+            assaultron.log_event(f"Email {action} job {job_id} failed: {error}", "ERROR")
+        email_jobs[job_id] = {
+            "action": action,
+            "status": "completed" if success else "failed",
+            "success": success,
+            "error": error,
+            **details
+        }
+
+    email_executor.submit(run)
+    return job_id
+
+
+def _read_emails_cached(email_manager, folder: str, limit: int, unread_only: bool):
+    """email_manager.read_emails with a TTL cache; errors are never cached"""
+    key = (folder, limit, unread_only)
+    now = time.monotonic()
+    with _email_read_cache_lock:
+        entry = _email_read_cache.get(key)
+        if entry is not None and now - entry[0] < EMAIL_READ_CACHE_TTL:
+            _email_read_cache.move_to_end(key)
+            return entry[1], None
+
+    emails, error = email_manager.read_emails(folder, limit, unread_only)
+    if not error:
+        with _email_read_cache_lock:
+            _email_read_cache[key] = (now, emails)
+            _email_read_cache.move_to_end(key)
+            while len(_email_read_cache) > EMAIL_READ_CACHE_SIZE:
+                _email_read_cache.popitem(last=False)
+    return emails, error
+
+
 @app.route('/api/email/send', methods=['POST'])
 @auth.login_required
 def send_email():
     """Send an email"""
-    from email_manager import get_email_manager
-
     data = request.get_json()
     to = data.get('to')
     subject = data.get('subject')
@@ -2621,40 +3722,34 @@ def send_email():
     if not to or not subject or not body:
         return jsonify({"error": "Missing required fields: to, subject, body"}), 400
 
-    email_manager = get_email_manager()
-    success, error = email_manager.send_email(to, subject, body, body_html, cc, bcc, add_signature)
+    details = {"to": to, "subject": subject}
+    if cc:
+        details["cc"] = cc
+    if bcc:
+        details["bcc"] = f"{len(bcc)} recipient(s)" if isinstance(bcc, list) else bcc
+    job_id = _submit_email_job(
+        "send",
+        lambda: email_manager.send_email(to, subject, body, body_html, cc, bcc, add_signature),
+        details
+    )
 
-    if success:
-        result = {
-            "success": True,
-            "message": "Email sent successfully",
-            "to": to,
-            "subject": subject
-        }
-        if cc:
-            result["cc"] = cc
-        if bcc:
-            result["bcc"] = f"{len(bcc)} recipient(s)" if isinstance(bcc, list) else bcc
-        return jsonify(result)
-    else:
-        return jsonify({
-            "success": False,
-            "error": error
-        }), 400
+    return jsonify({
+        "success": True,
+        "message": "Email queued for sending",
+        "job_id": job_id,
+        **details
+    }), 202
 
 
 @app.route('/api/email/read', methods=['GET'])
 @auth.login_required
 def read_emails():
     """Read emails from inbox"""
-    from email_manager import get_email_manager
-
     folder = request.args.get('folder', 'INBOX')
     limit = int(request.args.get('limit', 5))
     unread_only = request.args.get('unread_only', 'true').lower() == 'true'
 
-    email_manager = get_email_manager()
-    emails, error = email_manager.read_emails(folder, limit, unread_only)
+    emails, error = _read_emails_cached(email_manager, folder, limit, unread_only)
 
     if error:
         return jsonify({
@@ -2674,9 +3769,6 @@ def read_emails():
 @auth.login_required
 def get_email_status():
     """Get email manager status"""
-    from email_manager import get_email_manager
-
-    email_manager = get_email_manager()
     status = email_manager.get_status()
 
     return jsonify(status)
@@ -2686,8 +3778,6 @@ def get_email_status():
 @auth.login_required
 def reply_email():
     """Reply to an email"""
-    from email_manager import get_email_manager
-
     data = request.get_json()
     email_id = data.get('email_id')
     reply_body = data.get('reply_body')
@@ -2698,28 +3788,24 @@ def reply_email():
     if not email_id or not reply_body:
         return jsonify({"error": "Missing required fields: email_id, reply_body"}), 400
 
-    email_manager = get_email_manager()
-    success, error = email_manager.reply_to_email(email_id, reply_body, reply_body_html, cc, folder)
+    job_id = _submit_email_job(
+        "reply",
+        lambda: email_manager.reply_to_email(email_id, reply_body, reply_body_html, cc, folder),
+        {"email_id": email_id}
+    )
 
-    if success:
-        return jsonify({
-            "success": True,
-            "message": "Reply sent successfully",
-            "email_id": email_id
-        })
-    else:
-        return jsonify({
-            "success": False,
-            "error": error
-        }), 400
+    return jsonify({
+        "success": True,
+        "message": "Reply queued for sending",
+        "job_id": job_id,
+        "email_id": email_id
+    }), 202
 
 
 @app.route('/api/email/forward', methods=['POST'])
 @auth.login_required
 def forward_email():
     """Forward an email"""
-    from email_manager import get_email_manager
-
     data = request.get_json()
     email_id = data.get('email_id')
     to = data.get('to')
@@ -2730,30 +3816,36 @@ def forward_email():
     if not email_id or not to:
         return jsonify({"error": "Missing required fields: email_id, to"}), 400
 
-    email_manager = get_email_manager()
-    success, error = email_manager.forward_email(email_id, to, forward_message, cc, folder)
+    job_id = _submit_email_job(
+        "forward",
+        lambda: email_manager.forward_email(email_id, to, forward_message, cc, folder),
+        {"email_id": email_id, "to": to}
+    )
 
-    if success:
-        return jsonify({
-            "success": True,
-            "message": "Email forwarded successfully",
-            "email_id": email_id,
-            "to": to
-        })
-    else:
-        return jsonify({
-            "success": False,
-            "error": error
-        }), 400
+    return jsonify({
+        "success": True,
+        "message": "Forward queued for sending",
+        "job_id": job_id,
+        "email_id": email_id,
+        "to": to
+    }), 202
+
+
+@app.route('/api/email/job/<job_id>', methods=['GET'])
+@auth.login_required
+def get_email_job(job_id):
+    """Get the status of a queued send/reply/forward"""
+    job = email_jobs.get(job_id)
+    if job is None:
+        return jsonify({"error": "Job not found"}), 404
+
+    return jsonify({"job_id": job_id, **job})
 
 
 @app.route('/api/git/repositories', methods=['GET'])
 @auth.login_required
 def list_git_repositories():
     """List all git repositories in sandbox"""
-    from git_manager import get_git_manager
-
-    git_manager = get_git_manager()
     repos = git_manager.list_repositories()
 
     return jsonify({
@@ -2767,18 +3859,13 @@ def list_git_repositories():
 @auth.login_required
 def get_git_status():
     """Get git repository status"""
-    from git_manager import get_git_manager
-    from pathlib import Path
-
     # Get repo_path from query parameter
     repo_path = request.args.get('repo_path')
     if not repo_path:
         return jsonify({"error": "Missing repo_path parameter"}), 400
 
-    git_manager = get_git_manager()
-
     # Construct full path
-    full_path = str(Path(git_manager.sandbox_base) / repo_path)
+    full_path = str(GIT_SANDBOX / repo_path)
     status, error = git_manager.get_status(full_path)
 
     if error:
@@ -2794,9 +3881,6 @@ def get_git_status():
 @auth.login_required
 def git_commit():
     """Create a git commit"""
-    from git_manager import get_git_manager
-    from pathlib import Path
-
     data = request.get_json()
     repo_path = data.get('repo_path')
     message = data.get('message')
@@ -2807,10 +3891,8 @@ def git_commit():
     if not message:
         return jsonify({"error": "Missing commit message"}), 400
 
-    git_manager = get_git_manager()
-
     # Construct full path
-    full_path = str(Path(git_manager.sandbox_base) / repo_path)
+    full_path = str(GIT_SANDBOX / repo_path)
     success, error = git_manager.commit(full_path, message, files)
 
     if success:
@@ -2830,9 +3912,6 @@ def git_commit():
 @auth.login_required
 def git_push():
     """Push commits to remote repository"""
-    from git_manager import get_git_manager
-    from pathlib import Path
-
     data = request.get_json() or {}
     repo_path = data.get('repo_path')
     branch = data.get('branch', 'main')
@@ -2840,10 +3919,8 @@ def git_push():
     if not repo_path:
         return jsonify({"error": "Missing repo_path"}), 400
 
-    git_manager = get_git_manager()
-
     # Construct full path
-    full_path = str(Path(git_manager.sandbox_base) / repo_path)
+    full_path = str(GIT_SANDBOX / repo_path)
     success, error = git_manager.push(full_path, branch)
 
     if success:
@@ -2864,9 +3941,6 @@ def git_push():
 @auth.login_required
 def git_pull():
     """Pull latest changes from remote repository"""
-    from git_manager import get_git_manager
-    from pathlib import Path
-
     data = request.get_json() or {}
     repo_path = data.get('repo_path')
     branch = data.get('branch', 'main')
@@ -2874,10 +3948,8 @@ def git_pull():
     if not repo_path:
         return jsonify({"error": "Missing repo_path"}), 400
 
-    git_manager = get_git_manager()
-
     # Construct full path
-    full_path = str(Path(git_manager.sandbox_base) / repo_path)
+    full_path = str(GIT_SANDBOX / repo_path)
     success, error = git_manager.pull(full_path, branch)
 
     if success:
@@ -2898,9 +3970,6 @@ def git_pull():
 @auth.login_required
 def git_clone():
     """Clone a repository into sandbox"""
-    from git_manager import get_git_manager
-    from pathlib import Path
-
     data = request.get_json() or {}
     repo_url = data.get('repo_url')
     repo_path = data.get('repo_path')
@@ -2911,10 +3980,8 @@ def git_clone():
     if not repo_path:
         return jsonify({"error": "Missing repo_path"}), 400
 
-    git_manager = get_git_manager()
-
     # Construct full path
-    full_path = str(Path(git_manager.sandbox_base) / repo_path)
+    full_path = str(GIT_SANDBOX / repo_path)
     success, error = git_manager.clone_repo(repo_url, full_path, use_ssh)
 
     if success:
@@ -2935,9 +4002,6 @@ def git_clone():
 @auth.login_required
 def get_git_config():
     """Get git manager configuration"""
-    from git_manager import get_git_manager
-
-    git_manager = get_git_manager()
     config = git_manager.get_config_status()
 
     return jsonify(config)
@@ -48,7 +48,20 @@ def start_asr():
 
     from main import app
     try:
-        app.run(debug=True, host='127.0.0.1', port=8080, use_reloader=False)
+        # Multi-threaded production server when available; long LLM calls
+        # block only their own thread while the socket wait releases the GIL.
+        # Waitress has a fixed thread pool and every open event stream
+        # (/api/voice/events, /api/stt/events, /api/vision/stream.mjpg) holds
+        # a thread for as long as the page is open - up to 3 per browser tab -
+        # so the pool is sized for the streams plus regular requests.
+        try:
+            from waitress import serve
+        except ImportError:
+            app.run(debug=True, host='127.0.0.1', port=8080, use_reloader=False, threaded=True)
+        else:
+            threads = int(os.getenv("SERVER_THREADS", "48"))
+            print(f"Serving with waitress ({threads} threads)")
+            serve(app, host='127.0.0.1', port=8080, threads=threads, connection_limit=200)
     except KeyboardInterrupt:
         print("\nASR-7 interface stopped")
 
@@ -4,9 +4,13 @@ Provides helper functions for seamless agent-AI conversation flow
 """
 
 import threading
-from datetime import datetime
+from collections import deque
 from typing import Tuple
 from .virtual_body import WorldState, BodyState, MoodState
+from .time_awareness import now_log_ts
+
+# Progress updates kept per agent task; older ones drop off
+AGENT_PROGRESS_MAX = 512
 
 
 def generate_task_acknowledgment(cognitive_engine, task_description: str, mood_state: MoodState) -> str:
@@ -112,7 +116,7 @@ Before starting, think: "What is this task asking me to do, and what's the best
 
 def run_agent_in_background(
     agent_logic,
-    agent_tasks: dict,
+    agent_tasks,
     task_id: str,
     enhanced_task: str,
     original_task: str,
@@ -122,14 +126,15 @@ def run_agent_in_background(
     log_callback=None,
     broadcast_callback=None,
     user_message: str = "",
-    conversation_history: str = ""
-):
+    conversation_history: str = "",
+    submit=None
+) -> bool:
     """
     Run the agent in a background thread and notify when complete.
 
     Args:
         agent_logic: The agent logic instance
-        agent_tasks: Dictionary to store task status
+        agent_tasks: Task registry (task_id -> record) to store task status
         task_id: Unique task identifier
         enhanced_task: Task with creative instructions
         original_task: Original task description
@@ -140,8 +145,14 @@ def run_agent_in_background(
         broadcast_callback: Function to broadcast completion to clients (web UI, Discord)
         user_message: Original user message
         conversation_history: Formatted conversation history
+        submit: submit(task_id, fn) -> bool that queues fn on a worker pool;
+            a fresh daemon thread is started when omitted
+
+    Returns:
+        False if submit refused the task (pool saturated), True otherwise
     """
-    progress_updates = []
+    # Bounded; deque.append is atomic, so the agent thread never takes a lock
+    progress_updates = deque(maxlen=AGENT_PROGRESS_MAX)
     
     def log(message, level="INFO"):
         if log_callback:
@@ -169,7 +180,7 @@ def run_agent_in_background(
                 "status": "completed" if result.get("success") else "failed",
                 "result": result,
                 "progress": progress_updates,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                "timestamp": now_log_ts()
             }
             
             # Generate completion message
@@ -205,24 +216,36 @@ def run_agent_in_background(
                 "status": "error",
                 "error": str(e),
                 "progress": progress_updates,
-                "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                "timestamp": now_log_ts()
             }
             
             if voice_enabled and voice_system:
                 voice_system.synthesize_async(f"Task encountered an error: {str(e)}")
     
-    # Start background thread
-    thread = threading.Thread(target=run_agent_task, daemon=True)
-    thread.start()
-    
-    # Initialize task tracking
+    # Initialize task tracking before the thread can write its final record
     agent_tasks[task_id] = {
         "task": original_task,
         "status": "running",
         "progress": progress_updates,
-        "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        "timestamp": now_log_ts()
     }
 
+    if submit is None:
+        threading.Thread(target=run_agent_task, daemon=True).start()
+        return True
+
+    if not submit(task_id, run_agent_task):
+        agent_tasks[task_id] = {
+            "task": original_task,
+            "status": "rejected",
+            "error": "Agent queue is full",
+            "progress": progress_updates,
+            "timestamp": now_log_ts()
+        }
+        log(f"Agent task rejected, queue full: {task_id}", "WARN")
+        return False
+    return True
+
 
 def generate_completion_message(cognitive_engine, task: str, result: dict) -> str:
     """
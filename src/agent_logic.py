@@ -10,6 +10,7 @@ This module implements the core autonomous agent loop:
 
 import json
 import logging
+import re
 from typing import Dict, Any, List, Optional, Callable
 from datetime import datetime
 import requests
@@ -20,6 +21,9 @@ from .agent_tools import get_tool_functions
 
 logger = logging.getLogger('assaultron.agent')
 
+# Fenced ```json block holding the step object
+JSON_BLOCK = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+
 
 class AgentLogic:
     """
@@ -532,11 +536,8 @@ INTERNAL AGENT HISTORY (Your thoughts/actions so far in this task):
         Returns:
             Parsed step dictionary
         """
-        # Try to extract JSON
-        import re
-        
         # Look for JSON block
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response, re.DOTALL)
+        json_match = JSON_BLOCK.search(response)
         if json_match:
             json_str = json_match.group(1)
         else:
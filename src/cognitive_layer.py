@@ -11,15 +11,23 @@ The LLM outputs CognitiveState objects that are then interpreted by the
 behavioral layer to select appropriate behaviors.
 """
 
+import base64
 import json
+import os
 import re
-from typing import Dict, List, Any, Optional
+import threading
+from collections import deque
+from itertools import islice
+from typing import Deque, Dict, List, Any, Optional
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime
+from functools import lru_cache
 
 from .virtual_body import CognitiveState, WorldState, BodyState, MoodState
 from .config import Config
-from .time_awareness import get_time_context, format_time_context_for_prompt
+from .json_provider import dumps_bytes
+from .time_awareness import get_time_context, format_time_context_for_prompt, now_iso
 from .settings_manager import SettingsManager
 
 # Optional import for Gemini
@@ -29,6 +37,94 @@ try:
 except ImportError:
     GEMINI_AVAILABLE = False
 
+# Shared HTTP session: LLM calls reuse pooled keep-alive (and TLS) connections
+# to Ollama/OpenRouter instead of reconnecting per request
+http_session = requests.Session()
+_http_adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+http_session.mount("http://", _http_adapter)
+http_session.mount("https://", _http_adapter)
+
+# Request bodies are encoded with dumps_bytes (orjson when installed) and sent
+# as data=, instead of letting requests run the stdlib encoder for json=
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Dialogue cleanup (see _sanitize_dialogue): markup that must not be spoken
+BRACKETED = re.compile(r'\[.*?\]')
+STAGE_DIRECTION = re.compile(r'\*[^*]*\*')
+ACTION_PARENTHETICAL = re.compile(
+    r'\(\s*(smiles|laughs|chuckles|grins|sighs|nods|shrugs|winks|frowns|scoffs|pauses|gestures|leans|looks|glances|turns|walks|steps).*?\)',
+    re.IGNORECASE
+)
+WHITESPACE_RUN = re.compile(r'\s+')
+
+# JSON extraction from LLM replies
+JSON_BLOCK = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+JSON_OBJECT = re.compile(r'(\{.*?\})', re.DOTALL)
+LINE_COMMENT = re.compile(r'//.*')
+
+# Fallback intent cues (see CognitiveEngine._fallback_parse):
+# field -> (value, words) in priority order (first match wins)
+FALLBACK_CUES = {
+    "goal": (
+        ("protect", ("threat", "attack", "defend", "protect")),
+        ("provide_illumination", ("light", "bright", "dark")),
+        ("greet", ("hello", "hi", "greet", "welcome")),
+        ("investigate", ("investigate", "check", "look")),
+    ),
+    "emotion": (
+        ("hostile", ("angry", "hostile", "threat")),
+        ("friendly", ("friend", "kind", "help")),
+        ("curious", ("curious", "interesting", "wonder")),
+    ),
+}
+
+
+def _build_fallback_cue_scanner():
+    """
+    One regex over every fallback cue word plus a word -> [(field, rank, value)] table.
+
+    Same construction as the world cue scanner in virtual_body: the lookahead
+    keeps substring semantics and longer words carry the cues of any shorter
+    word they start with.
+    """
+    cues = {}
+    for field_name, levels in FALLBACK_CUES.items():
+        for rank, (value, words) in enumerate(levels):
+            for word in words:
+                cues.setdefault(word, []).append((field_name, rank, value))
+
+    table = {
+        word: [cue for other, other_cues in cues.items() if word.startswith(other) for cue in other_cues]
+        for word in cues
+    }
+    alternation = "|".join(re.escape(w) for w in sorted(cues, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))"), table
+
+
+FALLBACK_CUE_PATTERN, FALLBACK_CUE_TABLE = _build_fallback_cue_scanner()
+
+@lru_cache(maxsize=8)
+def load_history_image_b64(image_path: str) -> str:
+    """
+    Base64 of an image attached to a past exchange, cached across turns.
+
+    Chat image filenames are timestamp-unique and never rewritten, so the
+    same path always has the same bytes. A missing file raises (and is not
+    cached).
+    """
+    with open(image_path, 'rb') as img_file:
+        return base64.b64encode(img_file.read()).decode('utf-8')
+
+
+# Memory triggers (see extract_memory_from_message), matched case-insensitively
+# Name phrasings in priority order: "my name is" wins wherever it appears
+NAME_TRIGGERS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (r"my name is (\w+)", r"i'm (\w+)", r"call me (\w+)")
+)
+INSTRUCTION_TRIGGER = re.compile(r"remember that|don't forget", re.IGNORECASE)
+LIKE_TRIGGER = re.compile(r"i like|i love", re.IGNORECASE)
+DISLIKE_TRIGGER = re.compile(r"i hate|i don't like", re.IGNORECASE)
 
 
 # ============================================================================
@@ -46,6 +142,9 @@ class CognitiveEngine:
     - Ensure LLM never references hardware directly
     """
 
+    MAX_MEMORIES = 50  # Oldest memories drop off once the store is full
+    MAX_HISTORY = 100  # Exchanges kept in memory and on disk
+
     def __init__(self, ollama_url: str, model: str, system_prompt: str):
         """
         Initialize cognitive engine.
@@ -62,8 +161,11 @@ class CognitiveEngine:
         # Settings manager for persistent configuration
         self.settings_manager = SettingsManager()
 
-        # Load models from settings (overrides hardcoded defaults)
+        # Load models from settings (overrides hardcoded defaults); the
+        # quantized tag, if any, is resolved later by the warmup thread
         self._load_models_from_settings()
+        self.model = Config.AI_MODEL
+        Config.set_ai_model_in_use(self.model)
 
         # Language setting (default: English, will be set by main interface from settings.json)
         self.language = self.settings_manager.get("language", "en")
@@ -71,17 +173,24 @@ class CognitiveEngine:
         # Verbosity setting (1-5: 1=very brief, 3=balanced, 5=detailed, will be set by main interface from settings.json)
         self.verbosity = self.settings_manager.get("verbosity", 2)
 
+        # Prebuilt system message, keyed on what _enhance_system_prompt reads
+        self._system_message_cache = (None, None)
+
         # Conversation state
         self.history_file = "ai-data/conversation_history.json"
-        self.conversation_history: List[Dict[str, str]] = self._load_history()
+        self.conversation_history: Deque[Dict[str, str]] = deque(
+            self._load_history(), maxlen=self.MAX_HISTORY
+        )
 
         # Long-term memories
         self.memory_file = "ai-data/memories.json"
 
-        # Load memories into context from disk
-        self.memory_context: List[Dict[str, Any]] = self._load_long_term_memories()
+        # Load memories into context from disk (bounded: appends evict the oldest)
+        self.memory_context: Deque[Dict[str, Any]] = deque(
+            self._load_long_term_memories(), maxlen=self.MAX_MEMORIES
+        )
 
-        # Alias for compatibility - both names point to the same list
+        # Alias for compatibility - both names point to the same deque
         self.long_term_memories = self.memory_context
 
         # Configure Gemini if selected
@@ -94,22 +203,23 @@ class CognitiveEngine:
             else:
                 print("[COGNITIVE WARNING] Gemini API Key not set! Update config.py")
 
-        # Warmup: preload model to avoid timeout on first request
-        self._warmup_model()
+        # Warmup: resolve the quantized tag and preload the model in the
+        # background, so neither delays startup or the first request
+        threading.Thread(target=self._warmup_model, name='ollama-warmup', daemon=True).start()
 
     def _load_models_from_settings(self):
         """Load model selections from settings and apply to Config"""
         ollama_model = self.settings_manager.get_llm_model("ollama")
         if ollama_model:
-            Config.AI_MODEL = ollama_model
+            Config.update_ai_model(ollama_model)
 
         gemini_model = self.settings_manager.get_llm_model("gemini")
         if gemini_model:
-            Config.GEMINI_MODEL = gemini_model
+            Config.update_gemini_model(gemini_model)
 
         openrouter_model = self.settings_manager.get_llm_model("openrouter")
         if openrouter_model:
-            Config.OPENROUTER_MODEL = openrouter_model
+            Config.update_openrouter_model(openrouter_model)
 
         print(f"[COGNITIVE] Loaded models from settings: Ollama={Config.AI_MODEL}, Gemini={Config.GEMINI_MODEL}, OpenRouter={Config.OPENROUTER_MODEL}")
 
@@ -118,7 +228,7 @@ class CognitiveEngine:
         if provider not in ["ollama", "gemini", "openrouter"]:
             raise ValueError("Invalid provider. Use 'ollama', 'gemini', or 'openrouter'")
 
-        Config.LLM_PROVIDER = provider
+        Config.set_llm_provider(provider)
 
         # Configure Gemini if switching to it
         if provider == "gemini":
@@ -139,7 +249,7 @@ class CognitiveEngine:
                 print("[COGNITIVE WARNING] OpenRouter API Key missing/invalid!")
                 return False
         else:
-            print(f"[COGNITIVE] Switched to Local Ollama ({Config.AI_MODEL})")
+            print(f"[COGNITIVE] Switched to Local Ollama ({Config.AI_MODEL_IN_USE or Config.AI_MODEL})")
 
         return True
 
@@ -161,6 +271,7 @@ class CognitiveEngine:
         if provider == "ollama":
             Config.update_ai_model(model)
             self.model = model
+            Config.set_ai_model_in_use(model)
         elif provider == "gemini":
             Config.update_gemini_model(model)
         elif provider == "openrouter":
@@ -206,7 +317,8 @@ class CognitiveEngine:
         agent_context: str = "",
         record_history: bool = True,
         vision_image_b64: str = None,
-        attachment_image_path: str = None
+        attachment_image_path: str = None,
+        vision_image_bytes: bytes = None
     ) -> CognitiveState:
         """
         Process user input and generate cognitive state.
@@ -222,6 +334,7 @@ class CognitiveEngine:
             record_history: Whether to save this interaction to conversation history (default: True)
             vision_image_b64: Base64 encoded raw webcam image for multimodal vision
             attachment_image_path: Path to user-attached image file (e.g., "chat_images/lego.jpg")
+            vision_image_bytes: Raw JPEG webcam image, base64-encoded here only for the LLM request
 
         Returns:
             CognitiveState with goal, emotion, confidence, urgency, focus, dialogue
@@ -230,11 +343,14 @@ class CognitiveEngine:
         cognitive_state = None
         last_generated_state = None  # Track the last attempt in case all fail
 
+        # Encode the webcam frame once for all attempts (LLM APIs take base64 images)
+        if vision_image_bytes and not vision_image_b64:
+            vision_image_b64 = base64.b64encode(vision_image_bytes).decode('utf-8')
+
         # Load attachment image if provided
         attachment_image_b64 = None
         if attachment_image_path:
             try:
-                import base64
                 with open(attachment_image_path, 'rb') as img_file:
                     attachment_image_b64 = base64.b64encode(img_file.read()).decode('utf-8')
             except Exception as e:
@@ -343,27 +459,57 @@ class CognitiveEngine:
         """
         Build the message list for LLM.
 
-        Includes:
+        Ordered from most to least stable so consecutive requests share a
+        byte-identical prefix, which lets Ollama reuse its KV cache instead
+        of re-running prefill on it:
         - System prompt (personality + instructions)
+        - Memory summary
+        - Conversation history
         - World state context
         - Body state context
         - Mood state context (internal feelings)
-        - Vision context (what you currently see)
         - Time awareness context (current time, patterns, gaps)
-        - Memory summary
-        - Conversation history
+        - Vision context (what you currently see)
         - Current user message
         """
-        messages = []
-
         # 1. Base system prompt (personality + reasoning instructions)
-        enhanced_prompt = self._enhance_system_prompt()
-        messages.append({
-            "role": "system",
-            "content": enhanced_prompt
-        })
+        messages = [self._system_message()]
 
-        # 2. World state context
+        # 2. Long-term Memories (Persistent across sessions, max 15)
+        if self.memory_context:
+            memory_list = "\n".join([f"- {m['content']}" for m in self.recent_memories(15)])
+            messages.append({
+                "role": "system",
+                "content": f"CORE MEMORIES ABOUT THE OPERATOR (EVAN):\n{memory_list}\n\nThese are important facts you must never forget."
+            })
+
+        # 3. Recent conversation history (last 8 exchanges)
+        for exchange in self.recent_history(8):
+            # If the exchange has an attached image, load it
+            if "image_path" in exchange:
+                try:
+                    if os.path.exists(exchange["image_path"]):
+                        history_image_b64 = load_history_image_b64(exchange["image_path"])
+                        messages.append({
+                            "role": "user",
+                            "content": [
+                                {"type": "text", "text": exchange["user"]},
+                                {"type": "image", "image": history_image_b64}
+                            ]
+                        })
+                    else:
+                        # Image file missing, just show text
+                        messages.append({"role": "user", "content": exchange["user"]})
+                except Exception as e:
+                    print(f"[COGNITIVE] Failed to load history image {exchange.get('image_path')}: {e}")
+                    messages.append({"role": "user", "content": exchange["user"]})
+            else:
+                messages.append({"role": "user", "content": exchange["user"]})
+
+            messages.append({"role": "assistant", "content": exchange["assistant"]})
+
+        # 4. Per-turn state, after the history so it never breaks the shared prefix
+        # 4.1. World state context
         world_context = self._format_world_context(world_state)
         if world_context:
             messages.append({
@@ -371,7 +517,7 @@ class CognitiveEngine:
                 "content": f"WORLD STATE:\n{world_context}"
             })
 
-        # 3. Body state context
+        # 4.2. Body state context
         body_context = self._format_body_context(body_state)
         if body_context:
             messages.append({
@@ -379,7 +525,7 @@ class CognitiveEngine:
                 "content": f"CURRENT BODY STATE:\n{body_context}"
             })
 
-        # 3.5. Mood state context (internal, emergent feelings)
+        # 4.3. Mood state context (internal, emergent feelings)
         if mood_state:
             mood_context = self._format_mood_context(mood_state)
             messages.append({
@@ -387,7 +533,7 @@ class CognitiveEngine:
                 "content": f"INTERNAL MOOD STATE (affects your tone and behavior):\n{mood_context}"
             })
 
-        # 3.7. Time awareness context (current time, patterns, gaps between messages)
+        # 4.4. Time awareness context (current time, patterns, gaps between messages)
         time_context = get_time_context(self.conversation_history, mood_state.__dict__ if mood_state else None)
         time_context_str = format_time_context_for_prompt(time_context)
         messages.append({
@@ -395,65 +541,28 @@ class CognitiveEngine:
             "content": f"TIME AWARENESS:\n{time_context_str}\n\nYou may casually reference timing if relevant (e.g., late nights, long gaps, patterns). Keep it natural and in-character."
         })
 
-        # 4. Vision context (what you currently see)
+        # 4.5. Vision context (what you currently see)
         if vision_context:
             messages.append({
                 "role": "system",
                 "content": f"CURRENT VISUAL PERCEPTION (what you see through your camera):\n{vision_context}\n\nYou can describe what you see when asked. This is your real-time vision."
             })
         
-        # 4.5. Agent context (what autonomous tasks you just completed)
+        # 4.6. Agent context (what autonomous tasks you just completed)
         if agent_context:
             messages.append({
                 "role": "system",
                 "content": agent_context
             })
 
-        # 5. Long-term Memories (Persistent across sessions, max 10)
-        # 5. Long-term Memories (Persistent across sessions, max 10)
-        if self.memory_context:
-            memory_list = "\n".join([f"- {m['content']}" for m in self.memory_context[-15:]])
-            messages.append({
-                "role": "system",
-                "content": f"CORE MEMORIES ABOUT THE OPERATOR (EVAN):\n{memory_list}\n\nThese are important facts you must never forget."
-            })
-
-        # 6. Recent conversation history (last 8 exchanges)
-        for exchange in self.conversation_history[-8:]:
-            # If the exchange has an attached image, load it
-            if "image_path" in exchange:
-                try:
-                    import base64
-                    import os
-                    if os.path.exists(exchange["image_path"]):
-                        with open(exchange["image_path"], 'rb') as img_file:
-                            history_image_b64 = base64.b64encode(img_file.read()).decode('utf-8')
-                        messages.append({
-                            "role": "user",
-                            "content": [
-                                {"type": "text", "text": exchange["user"]},
-                                {"type": "image", "image": history_image_b64}
-                            ]
-                        })
-                    else:
-                        # Image file missing, just show text
-                        messages.append({"role": "user", "content": exchange["user"]})
-                except Exception as e:
-                    print(f"[COGNITIVE] Failed to load history image {exchange.get('image_path')}: {e}")
-                    messages.append({"role": "user", "content": exchange["user"]})
-            else:
-                messages.append({"role": "user", "content": exchange["user"]})
-
-            messages.append({"role": "assistant", "content": exchange["assistant"]})
-
-        # 6.5. Explicit separator to prevent response repetition
+        # 5. Explicit separator to prevent response repetition
         if self.conversation_history:
             messages.append({
                 "role": "system",
                 "content": "The conversation above is HISTORY. The next user message is NEW and requires a UNIQUE response. DO NOT repeat any previous responses."
             })
 
-        # 7. Current user message (Enhanced with vision context for better attention)
+        # 6. Current user message (Enhanced with vision context for better attention)
         final_user_content = user_message
 
         # If we have multimodal image, skip the text vision context (AI can see the image directly)
@@ -489,6 +598,18 @@ class CognitiveEngine:
 
         return messages
 
+    def _system_message(self) -> Dict[str, str]:
+        """
+        The system prompt message, rebuilt only when the base prompt, language
+        or verbosity changes. The returned dict is shared; do not mutate it.
+        """
+        key = (self.base_system_prompt, self.language, self.verbosity)
+        cached = self._system_message_cache
+        if cached[0] != key:
+            cached = (key, {"role": "system", "content": self._enhance_system_prompt()})
+            self._system_message_cache = cached  # Single tuple swap, safe without a lock
+        return cached[1]
+
     def _enhance_system_prompt(self) -> str:
         """
         Enhance base prompt with cognitive reasoning instructions.
@@ -773,19 +894,23 @@ NOW, RESPOND TO THE USER'S MESSAGE WITH THE JSON FORMAT ABOVE.
 
     def _call_ollama(self, messages: List[Dict[str, Any]]) -> str:
         """Call standard Ollama endpoint (multimodal support varies by model)"""
+        payload = {
+            "model": self.model,
+            "messages": messages,
+            "stream": False,
+            "options": {
+                "temperature": 0.85,
+                "num_ctx": Config.OLLAMA_NUM_CTX,
+                "num_batch": Config.OLLAMA_NUM_BATCH,
+            },
+            "keep_alive": Config.OLLAMA_KEEP_ALIVE
+        }
+
         try:
-            response = requests.post(
+            response = http_session.post(
                 f"{self.ollama_url}/api/chat",
-                json={
-                    "model": self.model,
-                    "messages": messages,
-                    "stream": False,
-                    "options": {
-                        "temperature": 0.85,
-                        "num_ctx": 8192, 
-                    },
-                    "keep_alive": "5m"
-                },
+                data=dumps_bytes(payload),
+                headers=JSON_HEADERS,
                 timeout=120
             )
 
@@ -899,10 +1024,10 @@ NOW, RESPOND TO THE USER'S MESSAGE WITH THE JSON FORMAT ABOVE.
                 "max_tokens": 8192  # Lowered to preventing 402 errors on low credit accounts
             }
             
-            response = requests.post(
+            response = http_session.post(
                 url="https://openrouter.ai/api/v1/chat/completions",
                 headers=headers,
-                data=json.dumps(payload),
+                data=dumps_bytes(payload),
                 timeout=120
             )
 
@@ -938,17 +1063,17 @@ NOW, RESPOND TO THE USER'S MESSAGE WITH THE JSON FORMAT ABOVE.
             Sanitized dialogue suitable for speech synthesis
         """
         # Remove square brackets and contents
-        text = re.sub(r'\[.*?\]', '', text)
+        text = BRACKETED.sub('', text)
 
         # Remove asterisks and contents (stage directions)
-        text = re.sub(r'\*[^*]*\*', '', text)
+        text = STAGE_DIRECTION.sub('', text)
 
         # Only remove parentheses that look like stage directions/actions
         # Pattern matches common action verbs in present tense
-        text = re.sub(r'\(\s*(smiles|laughs|chuckles|grins|sighs|nods|shrugs|winks|frowns|scoffs|pauses|gestures|leans|looks|glances|turns|walks|steps).*?\)', '', text, flags=re.IGNORECASE)
+        text = ACTION_PARENTHETICAL.sub('', text)
 
         # Clean up multiple spaces and strip
-        text = re.sub(r'\s+', ' ', text).strip()
+        text = WHITESPACE_RUN.sub(' ', text).strip()
 
         return text
 
@@ -973,7 +1098,7 @@ NOW, RESPOND TO THE USER'S MESSAGE WITH THE JSON FORMAT ABOVE.
         json_str = None
 
         # Strategy 1: Look for ```json ... ``` blocks (single object only)
-        json_match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response_text, re.DOTALL)
+        json_match = JSON_BLOCK.search(response_text)
         if json_match:
             json_str = json_match.group(1)
 
@@ -1015,7 +1140,7 @@ NOW, RESPOND TO THE USER'S MESSAGE WITH THE JSON FORMAT ABOVE.
         # Parse JSON
         try:
             # Clean up potential comments or trailing commas if needed (basic cleanup)
-            json_str = re.sub(r'//.*', '', json_str) # Remove JS style comments
+            json_str = LINE_COMMENT.sub('', json_str) # Remove JS style comments
 
             data = json.loads(json_str)
 
@@ -1050,27 +1175,15 @@ NOW, RESPOND TO THE USER'S MESSAGE WITH THE JSON FORMAT ABOVE.
 
         Uses heuristics to infer intent from natural language.
         """
-        text_lower = response_text.lower()
-
-        # Infer goal from keywords
-        goal = "idle"
-        if any(word in text_lower for word in ["threat", "attack", "defend", "protect"]):
-            goal = "protect"
-        elif any(word in text_lower for word in ["light", "bright", "dark"]):
-            goal = "provide_illumination"
-        elif any(word in text_lower for word in ["hello", "hi", "greet", "welcome"]):
-            goal = "greet"
-        elif any(word in text_lower for word in ["investigate", "check", "look"]):
-            goal = "investigate"
-
-        # Infer emotion from keywords
-        emotion = "neutral"
-        if any(word in text_lower for word in ["angry", "hostile", "threat"]):
-            emotion = "hostile"
-        elif any(word in text_lower for word in ["friend", "kind", "help"]):
-            emotion = "friendly"
-        elif any(word in text_lower for word in ["curious", "interesting", "wonder"]):
-            emotion = "curious"
+        # Infer goal and emotion from keywords in a single pass
+        best = {}  # field -> (rank, value)
+        for word in set(FALLBACK_CUE_PATTERN.findall(response_text.lower())):
+            for field_name, rank, value in FALLBACK_CUE_TABLE[word]:
+                if field_name not in best or rank < best[field_name][0]:
+                    best[field_name] = (rank, value)
+
+        goal = best.get("goal", (None, "idle"))[1]
+        emotion = best.get("emotion", (None, "neutral"))[1]
 
         # Clean dialogue: don't return JSON structures as dialogue
         dialogue = response_text.strip()
@@ -1106,7 +1219,7 @@ NOW, RESPOND TO THE USER'S MESSAGE WITH THE JSON FORMAT ABOVE.
         # Get last N assistant responses
         recent_responses = [
             exchange["assistant"]
-            for exchange in self.conversation_history[-check_last_n:]
+            for exchange in self.recent_history(check_last_n)
         ]
 
         # Check for exact match
@@ -1122,24 +1235,21 @@ NOW, RESPOND TO THE USER'S MESSAGE WITH THE JSON FORMAT ABOVE.
         entry = {
             "user": user_message,
             "assistant": assistant_response,
-            "timestamp": datetime.now().isoformat()
+            "timestamp": now_iso()
         }
         if image_path:
             entry["image_path"] = image_path
 
+        # The deque keeps only the last MAX_HISTORY exchanges
         self.conversation_history.append(entry)
 
-        # Keep last 100 exchanges
-        if len(self.conversation_history) > 100:
-            self.conversation_history = self.conversation_history[-100:]
-
         self._save_history()
 
     def _save_history(self) -> None:
         """Save conversation history to disk"""
         try:
             with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(self.conversation_history, f, indent=2)
+                json.dump(list(self.conversation_history), f, indent=2)
         except Exception as e:
             print(f"[COGNITIVE ERROR] Failed to save history: {e}")
 
@@ -1156,7 +1266,7 @@ NOW, RESPOND TO THE USER'S MESSAGE WITH THE JSON FORMAT ABOVE.
 
     def clear_history(self) -> None:
         """Clear conversation history both in memory and on disk"""
-        self.conversation_history = []
+        self.conversation_history.clear()
         self._save_history()
 
     def _load_long_term_memories(self) -> List[Dict[str, Any]]:
@@ -1174,7 +1284,7 @@ NOW, RESPOND TO THE USER'S MESSAGE WITH THE JSON FORMAT ABOVE.
         """Save long-term memories to disk"""
         try:
             with open(self.memory_file, 'w', encoding='utf-8') as f:
-                json.dump(self.long_term_memories, f, indent=2)
+                json.dump(list(self.long_term_memories), f, indent=2)
         except Exception as e:
             print(f"[COGNITIVE ERROR] Failed to save long-term memories: {e}")
 
@@ -1228,7 +1338,7 @@ RESPOND ONLY WITH THIS JSON:
             response_text = self._call_llm(messages)
             
             # Extract JSON
-            json_match = re.search(r'(\{.*?\})', response_text, re.DOTALL)
+            json_match = JSON_OBJECT.search(response_text)
             if json_match:
                 data = json.loads(json_match.group(1))
                 if data.get("important"):
@@ -1257,12 +1367,9 @@ RESPOND ONLY WITH THIS JSON:
         Args:
             memory: Memory entry with keys like 'type', 'content', 'timestamp'
         """
+        # The deque keeps only the last MAX_MEMORIES entries
         self.memory_context.append(memory)
 
-        # Keep last 50 memories
-        if len(self.memory_context) > 50:
-            self.memory_context = self.memory_context[-50:]
-            
         # Persist memory to disk
         self._save_memories()
 
@@ -1270,10 +1377,20 @@ RESPOND ONLY WITH THIS JSON:
         """Save memories to JSON file."""
         try:
             with open(self.memory_file, 'w', encoding='utf-8') as f:
-                json.dump(self.memory_context, f, indent=2)
+                json.dump(list(self.memory_context), f, indent=2)
         except Exception as e:
             print(f"[COGNITIVE ERROR] Failed to save memories: {e}")
 
+    def recent_history(self, limit: int) -> List[Dict[str, str]]:
+        """Return the newest `limit` exchanges, oldest first, without copying the rest"""
+        history = self.conversation_history
+        return list(islice(history, max(0, len(history) - limit), None))
+
+    def recent_memories(self, limit: int) -> List[Dict[str, Any]]:
+        """Return the newest `limit` memories, oldest first, without copying the rest"""
+        memories = self.memory_context
+        return list(islice(memories, max(0, len(memories) - limit), None))
+
     def get_memory_summary(self, limit: int = 10) -> str:
         """
         Get formatted memory summary for LLM context.
@@ -1287,7 +1404,7 @@ RESPOND ONLY WITH THIS JSON:
         if not self.memory_context:
             return ""
 
-        recent_memories = self.memory_context[-limit:]
+        recent_memories = self.recent_memories(limit)
         summary_lines = []
 
         for mem in recent_memories:
@@ -1299,22 +1416,68 @@ RESPOND ONLY WITH THIS JSON:
 
     def get_conversation_history(self, limit: int = 10) -> List[Dict[str, str]]:
         """Get recent conversation history"""
-        return self.conversation_history[-limit:]
+        return self.recent_history(limit)
+
+    def _select_quantized_model(self, model: str) -> str:
+        """
+        Prefer an installed quantized variant of the configured Ollama model.
+
+        Args:
+            model: Configured model name (e.g., "gemma3:4b")
+
+        Returns:
+            Name of the matching quantized tag, or the model unchanged
+        """
+        quant = (Config.AI_MODEL_QUANT or "").lower()
+        if not quant or model.lower().endswith(quant):
+            return model
+
+        try:
+            response = http_session.get(f"{self.ollama_url}/api/tags", timeout=2)
+            installed = [m.get("name", "") for m in response.json().get("models", [])]
+        except Exception:
+            return model
+
+        base = model.split(":", 1)[0]
+        wanted = {f"{model}-{quant}".lower(), f"{base}:{quant}".lower()}
+        for name in installed:
+            if name.lower() in wanted:
+                print(f"[COGNITIVE] Using quantized model {name} for {model}")
+                return name
+        return model
 
     def _warmup_model(self) -> None:
         """
-        Preload the model into memory with a dummy request.
+        Preload the model into memory with an empty request.
         This prevents timeout on the first real user interaction.
+
+        The options must match _call_ollama: Ollama reloads the model when
+        num_ctx changes, which would throw the warmup away.
+
+        When Ollama is the active provider, an installed quantized tag of the
+        configured model is looked up first and used from then on.
         """
+        if Config.LLM_PROVIDER == "ollama":
+            configured = self.model
+            resolved = self._select_quantized_model(configured)
+            # set_model may have switched models while the lookup ran
+            if resolved != configured and self.model == configured:
+                self.model = resolved
+                Config.set_ai_model_in_use(resolved)
+
         try:
             print(f"[COGNITIVE] Preloading model {self.model}...")
-            response = requests.post(
+            response = http_session.post(
                 f"{self.ollama_url}/api/generate",
                 json={
                     "model": self.model,
-                    "prompt": "Hello",
+                    "prompt": "",
                     "stream": False,
-                    "keep_alive": "5m"
+                    "keep_alive": Config.OLLAMA_KEEP_ALIVE,
+                    "options": {
+                        "num_ctx": Config.OLLAMA_NUM_CTX,
+                        "num_batch": Config.OLLAMA_NUM_BATCH,
+                    }
                 },
                 timeout=120
             )
@@ -1347,17 +1510,9 @@ def extract_memory_from_message(user_message: str, assistant_response: str) -> O
     Returns:
         Memory dict or None if nothing memorable
     """
-    user_lower = user_message.lower()
-
     # Name extraction
-    name_patterns = [
-        r"my name is (\w+)",
-        r"i'm (\w+)",
-        r"call me (\w+)"
-    ]
-
-    for pattern in name_patterns:
-        match = re.search(pattern, user_lower)
+    for pattern in NAME_TRIGGERS:
+        match = pattern.search(user_message)
         if match:
             name = match.group(1).capitalize()
             return {
@@ -1367,7 +1522,7 @@ def extract_memory_from_message(user_message: str, assistant_response: str) -> O
             }
 
     # Preference extraction
-    if "remember that" in user_lower or "don't forget" in user_lower:
+    if INSTRUCTION_TRIGGER.search(user_message):
         return {
             "type": "user_instruction",
             "content": user_message,
@@ -1375,14 +1530,14 @@ def extract_memory_from_message(user_message: str, assistant_response: str) -> O
         }
 
     # Likes/dislikes
-    if "i like" in user_lower or "i love" in user_lower:
+    if LIKE_TRIGGER.search(user_message):
         return {
             "type": "user_preference",
             "content": f"User likes: {user_message}",
             "timestamp": datetime.now().isoformat()
         }
 
-    if "i hate" in user_lower or "i don't like" in user_lower:
+    if DISLIKE_TRIGGER.search(user_message):
         return {
             "type": "user_preference",
             "content": f"User dislikes: {user_message}",
@@ -42,6 +42,15 @@ class Config:
     OLLAMA_URL = os.getenv("OLLAMA_URL", "http://localhost:11434")
     # Hardcoded default, can be changed via settings
     AI_MODEL = "gemma3:4b"
+    # Preferred quantization: an installed "<model>-q4_K_M" / "<name>:q4_K_M" tag is used instead once the warmup thread finds it (Ollama provider only)
+    AI_MODEL_QUANT = os.getenv("AI_MODEL_QUANT", "q4_K_M")
+    # Ollama tag the cognitive engine actually sends (AI_MODEL or its quantized variant)
+    AI_MODEL_IN_USE = None
+    # Context window (KV cache size) shared by warmup and chat so the model is loaded only once
+    OLLAMA_NUM_CTX = 8192
+    # Prompt tokens evaluated per forward pass during prefill (long vision-context prompts)
+    OLLAMA_NUM_BATCH = 512
+    OLLAMA_KEEP_ALIVE = os.getenv("OLLAMA_KEEP_ALIVE", "24h")
 
     # Voice Configuration - From .env
     XVASYNTH_PATH = os.getenv("XVASYNTH_PATH", "./Content/xVAsynth")
@@ -228,22 +237,50 @@ Just be yourself.
     OLLAMA_DIR = "./Content/Ollama"
     XVASYNTH_DIR = "./Content/xVAsynth"
     
+    @classmethod
+    def _refresh_active_model(cls):
+        """Recompute ACTIVE_MODEL after the provider or one of its models changes"""
+        cls.ACTIVE_MODEL = {
+            "openrouter": cls.OPENROUTER_MODEL,
+            "gemini": cls.GEMINI_MODEL,
+        }.get(cls.LLM_PROVIDER, cls.AI_MODEL_IN_USE or cls.AI_MODEL)
+
+    @classmethod
+    def set_llm_provider(cls, provider):
+        """Switch the active LLM provider"""
+        cls.LLM_PROVIDER = provider
+        cls._refresh_active_model()
+
     @classmethod
     def update_ai_model(cls, model_name):
         """Update the AI model being used (Ollama)"""
         cls.AI_MODEL = model_name
+        cls.AI_MODEL_IN_USE = None
+        cls._refresh_active_model()
+
+    @classmethod
+    def set_ai_model_in_use(cls, model_name):
+        """Record the Ollama tag actually serving requests, so ACTIVE_MODEL reports it"""
+        cls.AI_MODEL_IN_USE = model_name
+        cls._refresh_active_model()
 
     @classmethod
     def update_gemini_model(cls, model_name):
         """Update the Gemini model being used"""
         cls.GEMINI_MODEL = model_name
+        cls._refresh_active_model()
 
     @classmethod
     def update_openrouter_model(cls, model_name):
         """Update the OpenRouter model being used"""
         cls.OPENROUTER_MODEL = model_name
+        cls._refresh_active_model()
 
     @classmethod
     def update_ollama_url(cls, url):
         """Update Ollama server URL"""
         cls.OLLAMA_URL = url
+
+
+# Model of the current provider, kept in sync by the setters above
+Config._refresh_active_model()
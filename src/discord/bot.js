@@ -229,7 +229,10 @@ function setupVoiceListener(channel) {
             if (data.type === 'audio_ready') {
                 console.log('Audio ready event detected:', data);
 
-                if (voiceEnabled && data.url && voiceChannel) {
+                if (data.part !== undefined) {
+                    // Sentence-chunked replies are only produced for the web UI
+                    console.log('Skipping chunked web UI audio part', data.part);
+                } else if (voiceEnabled && data.url && voiceChannel) {
                     console.log('Sending voice file to Discord...');
                     await sendVoiceFile(voiceChannel, data.url);
                 } else {
@@ -0,0 +1,63 @@
+"""
+Shared JSON encoding for the Flask apps (main server and monitoring dashboard)
+
+orjson is optional: when it is installed, ORJSONProvider replaces Flask's
+default provider and dumps_bytes encodes hand-built bodies (SSE frames,
+prebuilt responses) straight to bytes; otherwise both fall back to the
+stdlib json module.
+"""
+
+import functools
+import json
+
+from flask.json.provider import DefaultJSONProvider
+
+# Optional fast JSON encoder for jsonify()/request.get_json()
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, same output contract as the default"""
+
+    def dumps_bytes(self, obj, **kwargs) -> bytes:
+        """Serialize straight to UTF-8 bytes (orjson's native output)"""
+        # Datetimes go through self.default so they keep Flask's HTTP-date format
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            # Exotic payloads (e.g. ints beyond 64 bits) - defer to the stdlib path
+            return super().dumps(obj, **kwargs).encode('utf-8')
+
+    def dumps(self, obj, **kwargs):
+        return self.dumps_bytes(obj, **kwargs).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        """jsonify(): build the body from bytes, skipping the str round trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            dump_args = {"indent": 2}
+        else:
+            dump_args = {"separators": (",", ":")}
+        return self._app.response_class(
+            self.dumps_bytes(obj, **dump_args) + b"\n", mimetype=self.mimetype
+        )
+
+
+# JSON -> UTF-8 bytes for hand-built bodies such as SSE frames
+if ORJSON_AVAILABLE:
+    dumps_bytes = functools.partial(orjson.dumps, option=orjson.OPT_NON_STR_KEYS)
+else:
+    def dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
@@ -4,15 +4,77 @@ Live web interface on port 8081 for monitoring system performance
 """
 
 from flask import Flask, render_template, jsonify, Response, request
-import json
+import threading
 import time
 from datetime import datetime
 import logging
+from .json_provider import ORJSON_AVAILABLE, ORJSONProvider, dumps_bytes
 from .monitoring_service import get_monitoring_service
 
 logger = logging.getLogger('assaultron.monitoring_dashboard')
 
 app = Flask(__name__, template_folder='templates')
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
+
+STATS_INTERVAL = 1.0  # Seconds between stats snapshots
+STATS_HEARTBEAT = 5.0  # Re-send an unchanged snapshot after this long
+
+
+class StatsBroadcaster:
+    """
+    Shares one stats snapshot per tick with every /api/stream client.
+
+    A single producer thread (started by the first subscriber) computes and
+    serializes the stats, and publishes the SSE frame only when it changed
+    or the heartbeat is due. Clients wait on a condition for a newer
+    sequence number, so the cost no longer scales with open dashboard tabs.
+    """
+
+    def __init__(self, interval: float = STATS_INTERVAL, heartbeat: float = STATS_HEARTBEAT):
+        self.interval = interval
+        self.heartbeat = heartbeat
+        self._cond = threading.Condition()
+        self._frame = b""
+        self._seq = 0
+        self._thread = None
+
+    def _ensure_started(self):
+        with self._cond:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name='dashboard-stats', daemon=True)
+                self._thread.start()
+
+    def _loop(self):
+        collector = get_monitoring_service().get_collector()
+        last_payload = None
+        last_sent = 0.0
+        while True:
+            try:
+                payload = dumps_bytes(collector.get_stats())
+            except Exception as e:
+                logger.error(f"Failed to build dashboard stats: {e}")
+            else:
+                now = time.monotonic()
+                if payload != last_payload or now - last_sent >= self.heartbeat:
+                    frame = b"data: " + payload + b"\n\n"
+                    with self._cond:
+                        self._frame = frame
+                        self._seq += 1
+                        self._cond.notify_all()
+                    last_payload, last_sent = payload, now
+            time.sleep(self.interval)
+
+    def wait(self, last_seq: int, timeout: float):
+        """Block until a snapshot newer than last_seq exists; returns (seq, frame or b'')"""
+        self._ensure_started()
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._seq != last_seq, timeout):
+                return last_seq, b""
+            return self._seq, self._frame
+
+
+stats_broadcaster = StatsBroadcaster()
 
 
 @app.route('/')
@@ -42,11 +104,11 @@ def get_metric_data(metric_name):
 def stream():
     """Server-Sent Events stream for real-time updates"""
     def event_stream():
-        monitoring = get_monitoring_service()
+        seq = 0
         while True:
-            stats = monitoring.get_collector().get_stats()
-            yield f"data: {json.dumps(stats)}\n\n"
-            time.sleep(1)  # Update every second
+            seq, frame = stats_broadcaster.wait(seq, STATS_HEARTBEAT * 2)
+            # Keepalive comment if the producer stalled
+            yield frame or b": keepalive\n\n"
 
     return Response(event_stream(), mimetype='text/event-stream')
 
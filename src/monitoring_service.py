@@ -22,6 +22,11 @@ MONITORING_ENABLED = True
 class MetricsCollector:
     """Collects and stores performance metrics"""
 
+    # API responses and pipeline timings are buffered and folded into the
+    # metrics once per interval
+    API_FLUSH_INTERVAL = 1.0
+    API_BUFFER_SIZE = 4096
+
     def __init__(self, max_history: int = 1000):
         self.max_history = max_history
         self.start_time = datetime.now()
@@ -53,6 +58,16 @@ class MetricsCollector:
 
         self._lock = threading.Lock()
 
+        # Ring buffer of (endpoint, duration_ms, status_code) awaiting the flusher;
+        # deque append/popleft are atomic, so producers never take self._lock
+        self._pending_api_responses = deque(maxlen=self.API_BUFFER_SIZE)
+        # Same for (stage, duration_ms) pipeline timings from /api/chat
+        self._pending_pipeline = deque(maxlen=self.API_BUFFER_SIZE)
+        self._api_flush_thread = threading.Thread(
+            target=self._api_flush_loop, name='metrics-api-flush', daemon=True
+        )
+        self._api_flush_thread.start()
+
     def record_api_response(self, endpoint: str, duration_ms: float, status_code: int):
         """Record API response time"""
         with self._lock:
@@ -64,6 +79,44 @@ class MetricsCollector:
             })
             self.counters['total_api_calls'] += 1
 
+    def queue_api_response(self, endpoint: str, duration_ms: float, status_code: int):
+        """Buffer an API response for the background flusher (hot path, no lock)"""
+        self._pending_api_responses.append((endpoint, duration_ms, status_code))
+
+    def record_api_response_batch(self, items: List[tuple]):
+        """Record many (endpoint, duration_ms, status_code) responses under one lock"""
+        if not items:
+            return
+        timestamp = datetime.now().isoformat()
+        with self._lock:
+            append = self.metrics['api_responses'].append
+            for endpoint, duration_ms, status_code in items:
+                append({
+                    'timestamp': timestamp,
+                    'endpoint': endpoint,
+                    'duration_ms': duration_ms,
+                    'status_code': status_code
+                })
+            self.counters['total_api_calls'] += len(items)
+
+    @staticmethod
+    def _drain(pending: deque) -> List[tuple]:
+        """Pop everything currently buffered in a pending deque"""
+        items = []
+        try:
+            while True:
+                items.append(pending.popleft())
+        except IndexError:
+            pass
+        return items
+
+    def _api_flush_loop(self):
+        """Drain buffered API responses and pipeline timings once per interval"""
+        while True:
+            time.sleep(self.API_FLUSH_INTERVAL)
+            self.record_api_response_batch(self._drain(self._pending_api_responses))
+            self.record_message_pipeline_batch(self._drain(self._pending_pipeline))
+
     def record_voice_processing(self, text_length: int, duration_ms: float, success: bool):
         """Record voice synthesis time"""
         with self._lock:
@@ -109,6 +162,25 @@ class MetricsCollector:
             })
             self.counters['total_messages'] += 1
 
+    def queue_message_pipeline(self, stage: str, duration_ms: float):
+        """Buffer a pipeline timing for the background flusher (hot path, no lock)"""
+        self._pending_pipeline.append((stage, duration_ms))
+
+    def record_message_pipeline_batch(self, items: List[tuple]):
+        """Record many (stage, duration_ms) pipeline timings under one lock"""
+        if not items:
+            return
+        timestamp = datetime.now().isoformat()
+        with self._lock:
+            append = self.metrics['message_pipeline'].append
+            for stage, duration_ms in items:
+                append({
+                    'timestamp': timestamp,
+                    'stage': stage,
+                    'duration_ms': duration_ms
+                })
+            self.counters['total_messages'] += len(items)
+
     def record_error(self, error_type: str, component: str, message: str):
         """Record errors"""
         with self._lock:
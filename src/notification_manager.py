@@ -24,6 +24,7 @@ class NotificationManager:
         self.inactivity_threshold_min = 300  # 5 minutes minimum
         self.inactivity_threshold_max = 1800  # 30 minutes maximum
         self.last_user_interaction = datetime.now()
+        self._last_interaction_monotonic = time.monotonic()  # For elapsed-time checks
         self.check_in_thread = None
         self.cognitive_engine = cognitive_engine  # Reference to AI for generating questions
         self.next_checkin_time = None
@@ -140,11 +141,16 @@ class NotificationManager:
     def update_user_activity(self):
         """Call this when user interacts with the system"""
         self.last_user_interaction = datetime.now()
+        self._last_interaction_monotonic = time.monotonic()
         # Clear waiting flag when user responds
         if self.waiting_for_response:
             self.waiting_for_response = False
             self.logger.info("User responded, will resume check-ins after next inactivity period")
 
+    def seconds_since_user_activity(self) -> float:
+        """Seconds since the last user interaction (monotonic, unaffected by clock changes)"""
+        return time.monotonic() - self._last_interaction_monotonic
+
     def _generate_ai_question(self) -> str:
         """
         Use the AI to generate a personalized check-in question based on context.
@@ -256,7 +262,7 @@ Just return the question, nothing else. Don't use asterisks or formatting."""
                 if not self.inactivity_check_enabled:
                     break
 
-                time_since_interaction = (datetime.now() - self.last_user_interaction).total_seconds()
+                time_since_interaction = self.seconds_since_user_activity()
 
                 # Pick random check-in interval (5-30 minutes)
                 check_in_threshold = random.randint(self.inactivity_threshold_min, self.inactivity_threshold_max)
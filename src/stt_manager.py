@@ -7,9 +7,10 @@ real-time transcription.
 """
 
 import asyncio
+import json
 import threading
 import logging
-from queue import Queue
+from collections import deque
 from typing import AsyncIterator, Optional, Callable
 import os
 import struct
@@ -31,6 +32,12 @@ except ImportError:
     MISTRAL_AVAILABLE = False
     logging.warning("mistralai package not available. STT features will be disabled.")
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 try:
     import pyaudio
     PYAUDIO_AVAILABLE = True
@@ -42,6 +49,72 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
+# Event dict -> JSON bytes for SSE frames
+if ORJSON_AVAILABLE:
+    _dumps_bytes = orjson.dumps
+else:
+    def _dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode('utf-8')
+
+
+class ClientChannel:
+    """
+    Bounded per-client buffer of pre-encoded SSE frames (shared bytes objects).
+
+    The producer never blocks: once maxlen frames are pending the oldest is
+    dropped, so a stalled browser tab costs bounded memory and cannot hold
+    up the transcription loop. Consecutive live-only updates (partials and
+    volume levels) replace each other instead of queueing, and are held for
+    a short window so bursts go out in one write; any other event (final
+    transcripts, status changes) flushes immediately.
+    """
+
+    # Events whose newest value supersedes the previous one
+    COALESCE_TYPES = frozenset({"transcription_partial", "audio_level"})
+
+    def __init__(self, maxlen: int = 256, max_wait: float = 0.02, batch_size: int = 8):
+        self._cond = threading.Condition()
+        self._frames = deque(maxlen=maxlen)  # (event type, SSE frame bytes)
+        self.max_wait = max_wait  # seconds live-only frames may wait for company
+        self.batch_size = batch_size
+        self._flush_now = False
+        self.closed = False
+
+    def push(self, event_type: str, frame: bytes):
+        """Queue a frame for this client (drops the oldest when full)"""
+        with self._cond:
+            frames = self._frames
+            live_only = event_type in self.COALESCE_TYPES
+            if live_only and frames and frames[-1][0] == event_type:
+                frames[-1] = (event_type, frame)
+            else:
+                frames.append((event_type, frame))
+            if not live_only:
+                self._flush_now = True
+            self._cond.notify()
+
+    def _ready(self) -> bool:
+        return self.closed or self._flush_now or len(self._frames) >= self.batch_size
+
+    def drain(self, timeout: float) -> bytes:
+        """Wait up to timeout for frames and return all pending ones joined (b'' if none)"""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._frames or self.closed, timeout):
+                return b""
+            # Hold live-only frames briefly so a burst shares one write
+            self._cond.wait_for(self._ready, self.max_wait)
+            batch = b"".join(frame for _, frame in self._frames)
+            self._frames.clear()
+            self._flush_now = False
+            return batch
+
+    def close(self):
+        """Wake the consumer for good (manager shutdown)"""
+        with self._cond:
+            self.closed = True
+            self._cond.notify_all()
+
+
 class MistralSTTManager:
     """
     Manages speech-to-text transcription using Mistral Voxtral.
@@ -93,8 +166,8 @@ class MistralSTTManager:
         self._retry_count = 0
         self._last_error_time = 0
 
-        # Event queues for broadcasting transcription events
-        self.event_queues = []
+        # Per-client SSE channels for broadcasting transcription events
+        self.event_channels = set()
 
         # Callback for transcription events
         self.on_transcription_partial: Optional[Callable[[str], None]] = None
@@ -280,15 +353,17 @@ class MistralSTTManager:
                         # Transcription complete
                         logger.info(f"Transcription complete: {self._current_transcript}")
 
+                        # Callback first: clients send the transcript as a chat
+                        # message as soon as the broadcast reaches them
+                        if self.on_transcription_complete:
+                            self.on_transcription_complete(self._current_transcript)
+
                         # Broadcast complete transcription
                         self._broadcast_event({
                             "type": "transcription_complete",
                             "text": self._current_transcript
                         })
 
-                        if self.on_transcription_complete:
-                            self.on_transcription_complete(self._current_transcript)
-
                         # Reset for next phrase
                         self._current_transcript = ""
 
@@ -511,46 +586,37 @@ class MistralSTTManager:
 
     def _broadcast_event(self, event: dict):
         """
-        Broadcast an event to all connected clients via SSE queues.
+        Broadcast an event to all connected clients via their SSE channels.
+
+        The event is serialized and encoded once; every client channel gets
+        the same ready-to-send SSE frame bytes.
 
         Args:
             event: Event data to broadcast
         """
-        dead_queues = []
-        for queue in self.event_queues:
-            try:
-                queue.put_nowait(event)
-            except Exception as e:
-                logger.warning(f"Failed to broadcast to queue: {e}")
-                dead_queues.append(queue)
+        frame = b"data: " + _dumps_bytes(event) + b"\n\n"
+        event_type = event.get("type")
+        # Iterate over a snapshot: clients may connect or disconnect meanwhile
+        for channel in tuple(self.event_channels):
+            channel.push(event_type, frame)
 
-        # Clean up dead queues
-        for dead_queue in dead_queues:
-            try:
-                self.event_queues.remove(dead_queue)
-            except ValueError:
-                pass
-
-    def add_event_queue(self, queue: Queue):
+    def add_event_channel(self, channel: ClientChannel):
         """
-        Add a queue for broadcasting transcription events.
+        Add a client channel for broadcasting transcription events.
 
         Args:
-            queue: Queue to add
+            channel: ClientChannel to add
         """
-        self.event_queues.append(queue)
+        self.event_channels.add(channel)
 
-    def remove_event_queue(self, queue: Queue):
+    def remove_event_channel(self, channel: ClientChannel):
         """
-        Remove a queue from broadcasting.
+        Remove a client channel from broadcasting.
 
         Args:
-            queue: Queue to remove
+            channel: ClientChannel to remove
         """
-        try:
-            self.event_queues.remove(queue)
-        except ValueError:
-            pass
+        self.event_channels.discard(channel)
 
     def set_device(self, device_index: Optional[int]) -> bool:
         """
@@ -602,4 +668,6 @@ class MistralSTTManager:
         logger.info("Shutting down STT manager")
         if self.is_listening:
             self.stop_listening()
-        self.event_queues.clear()
+        for channel in tuple(self.event_channels):
+            channel.close()
+        self.event_channels.clear()
@@ -6,10 +6,37 @@ calculating time gaps, and generating contextual observations about timing.
 """
 
 from datetime import datetime, time, timedelta
+from itertools import islice
+from time import time as epoch_seconds
 from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 
+# Wall-clock strings at one-second resolution, formatted once per second
+_clock_cache = (0, "", "")  # (epoch second, ISO 8601, log timestamp)
+
+
+def _clock_strings() -> tuple:
+    global _clock_cache
+    second = int(epoch_seconds())
+    cached = _clock_cache
+    if cached[0] != second:
+        moment = datetime.fromtimestamp(second)
+        cached = (second, moment.isoformat(), moment.strftime("%Y-%m-%d %H:%M:%S"))
+        _clock_cache = cached  # Single tuple swap, safe without a lock
+    return cached
+
+
+def now_iso() -> str:
+    """Current local time as ISO 8601, to the second"""
+    return _clock_strings()[1]
+
+
+def now_log_ts() -> str:
+    """Current local time in the system log format"""
+    return _clock_strings()[2]
+
+
 @dataclass
 class TimeContext:
     """Contextual information about the current time and recent interaction patterns."""
@@ -220,7 +247,8 @@ def generate_time_observation(
 
     # Pattern analysis
     message_times = []
-    for msg in conversation_history[-10:]:  # Last 10 messages
+    # Last 10 messages (history may be a bounded deque, which cannot be sliced)
+    for msg in islice(conversation_history, max(0, len(conversation_history) - 10), None):
         if "timestamp" in msg:
             try:
                 msg_time = datetime.fromisoformat(msg["timestamp"])
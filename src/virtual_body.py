@@ -6,6 +6,7 @@ It provides symbolic representations of body state and world perception,
 completely decoupled from hardware primitives.
 """
 
+import re
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List, Dict, Any
@@ -588,6 +589,46 @@ class VirtualWorld:
 # UTILITY FUNCTIONS
 # ============================================================================
 
+# World cue phrases: field -> (value, phrases) in priority order (first match wins)
+WORLD_CUES = {
+    "environment": (
+        ("dark", ("dark", "dim", "can't see")),
+        ("bright", ("bright", "too much light", "blinding")),
+    ),
+    "threat_level": (
+        ("high", ("intruder", "threat", "danger", "help", "attack")),
+        ("medium", ("suspicious", "watch out", "careful")),
+        ("none", ("safe", "all clear", "relax")),
+    ),
+}
+
+
+def _build_world_cue_scanner():
+    """
+    One regex over every cue phrase plus a phrase -> [(field, rank, value)] table.
+
+    The lookahead reports a match at every position (substring semantics,
+    like `phrase in message`); only the longest phrase starting at a given
+    position is reported, so each phrase also carries the cues of any
+    shorter phrase it starts with.
+    """
+    cues = {}
+    for field_name, levels in WORLD_CUES.items():
+        for rank, (value, phrases) in enumerate(levels):
+            for phrase in phrases:
+                cues.setdefault(phrase, []).append((field_name, rank, value))
+
+    table = {
+        phrase: [cue for other, other_cues in cues.items() if phrase.startswith(other) for cue in other_cues]
+        for phrase in cues
+    }
+    alternation = "|".join(re.escape(p) for p in sorted(cues, key=len, reverse=True))
+    return re.compile(f"(?=({alternation}))"), table
+
+
+_WORLD_CUE_PATTERN, _WORLD_CUE_TABLE = _build_world_cue_scanner()
+
+
 def analyze_user_message_for_world_cues(message: str) -> Dict[str, Any]:
     """
     Analyze user message for environmental cues that should update world state.
@@ -601,22 +642,14 @@ def analyze_user_message_for_world_cues(message: str) -> Dict[str, Any]:
     Returns:
         Dictionary of world state updates
     """
-    message_lower = message.lower()
-    updates = {}
-
-    # Detect lighting conditions
-    if any(word in message_lower for word in ["dark", "dim", "can't see"]):
-        updates["environment"] = "dark"
-    elif any(word in message_lower for word in ["bright", "too much light", "blinding"]):
-        updates["environment"] = "bright"
-
-    # Detect threat cues
-    if any(word in message_lower for word in ["intruder", "threat", "danger", "help", "attack"]):
-        updates["threat_level"] = "high"
-    elif any(word in message_lower for word in ["suspicious", "watch out", "careful"]):
-        updates["threat_level"] = "medium"
-    elif any(word in message_lower for word in ["safe", "all clear", "relax"]):
-        updates["threat_level"] = "none"
+    # Single pass over the message for lighting and threat cues
+    best = {}  # field -> (rank, value)
+    for phrase in set(_WORLD_CUE_PATTERN.findall(message.lower())):
+        for field_name, rank, value in _WORLD_CUE_TABLE[phrase]:
+            if field_name not in best or rank < best[field_name][0]:
+                best[field_name] = (rank, value)
+
+    updates = {field_name: value for field_name, (_, value) in best.items()}
 
     # Future: time of day, entity detection, etc.
 
@@ -73,8 +73,6 @@ class VisionState:
     fps: float = 0.0
     processing_time_ms: float = 0.0
     
-    current_frame_b64: str = ""
-    raw_frame_b64: str = ""  # Raw frame without detection overlay
     frame_width: int = 640
     frame_height: int = 480
     
@@ -136,6 +134,19 @@ class VisionSystem:
         self.detection_interval = 0.1  # Limit to 10 detections/sec to save CPU
         self._last_detection_time = 0.0
         self._frame_times: List[float] = []
+
+        # Latest raw frame (without detection overlay) for AI vision; JPEG-encoded
+        # only when a message asks for it, then cached until the next frame
+        self._raw_frame: Optional[np.ndarray] = None
+        self._raw_frame_jpeg: Optional[bytes] = None
+
+        # Latest annotated frame for the UI as JPEG bytes; base64 only for the
+        # legacy JSON endpoint, built on first request and cached per frame
+        self._frame_jpeg: Optional[bytes] = None
+        self._frame_b64: Optional[str] = None
+        # Bumped per encoded frame; streams wait on the condition (shares _lock)
+        self._frame_seq = 0
+        self._frame_ready = threading.Condition(self._lock)
         
         # Ensure model exists
         self._ensure_model_downloaded()
@@ -315,16 +326,16 @@ class VisionSystem:
             fps = len(self._frame_times) / (self._frame_times[-1] - self._frame_times[0]) if len(self._frame_times) > 1 else 0
 
             # Encode annotated frame
-            _, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 60])
-            b64_frame = base64.b64encode(buffer).decode('utf-8')
-
-            # Encode raw frame (without detection overlay)
-            _, raw_buffer = cv2.imencode('.jpg', raw_frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
-            b64_raw_frame = base64.b64encode(raw_buffer).decode('utf-8')
+            ok, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 60])
+            frame_jpeg = buffer.tobytes() if ok else None
 
             with self._lock:
-                self.state.current_frame_b64 = b64_frame
-                self.state.raw_frame_b64 = b64_raw_frame
+                self._frame_jpeg = frame_jpeg
+                self._frame_b64 = None
+                self._frame_seq += 1
+                self._frame_ready.notify_all()
+                self._raw_frame = raw_frame
+                self._raw_frame_jpeg = None
                 self.state.fps = fps
                 
             # Cap FPS to 30
@@ -438,17 +449,67 @@ class VisionSystem:
                 threat_assessment=self.state.threat_assessment,
                 fps=self.state.fps,
                 processing_time_ms=self.state.processing_time_ms,
-                current_frame_b64=self.state.current_frame_b64,
                 frame_width=self.state.frame_width,
                 frame_height=self.state.frame_height
             )
 
+    def get_frame_jpeg_bytes(self) -> Optional[bytes]:
+        """
+        Latest annotated frame as JPEG bytes (as encoded by the capture loop).
+
+        The capture thread encodes each frame and swaps in a new immutable
+        bytes object, so callers never encode and can hold the returned
+        frame while newer ones are published.
+        """
+        with self._lock: return self._frame_jpeg
+
+    @property
+    def is_capturing(self) -> bool:
+        return self._running
+
+    def wait_for_frame(self, last_seq: int, timeout: float):
+        """
+        Block until a frame newer than last_seq is encoded.
+
+        Returns (seq, jpeg); on timeout the current frame is returned with
+        the old seq so streaming callers can re-send it as a keepalive.
+        """
+        with self._frame_ready:
+            self._frame_ready.wait_for(lambda: self._frame_seq != last_seq, timeout)
+            return self._frame_seq, self._frame_jpeg
+
     def get_frame_b64(self) -> str:
-        with self._lock: return self.state.current_frame_b64
+        with self._lock:
+            jpeg, b64 = self._frame_jpeg, self._frame_b64
+        if b64 is not None or jpeg is None:
+            return b64 or ""
+        b64 = base64.b64encode(jpeg).decode('ascii')
+        with self._lock:
+            if self._frame_jpeg is jpeg:
+                self._frame_b64 = b64
+        return b64
+
+    def get_raw_frame_bytes(self) -> Optional[bytes]:
+        """Get raw webcam frame without detection overlay as JPEG bytes for AI vision"""
+        with self._lock:
+            frame, jpeg = self._raw_frame, self._raw_frame_jpeg
+        if jpeg is not None or frame is None:
+            return jpeg
+
+        # Encode outside the lock so the capture loop is never blocked on it
+        ok, buffer = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, 85])
+        if not ok:
+            return None
+        jpeg = buffer.tobytes()
+        with self._lock:
+            if self._raw_frame is frame:
+                self._raw_frame_jpeg = jpeg
+        return jpeg
 
     def get_raw_frame_b64(self) -> str:
         """Get raw webcam frame without detection overlay for AI vision"""
-        with self._lock: return self.state.raw_frame_b64
+        jpeg = self.get_raw_frame_bytes()
+        return base64.b64encode(jpeg).decode('utf-8') if jpeg else ""
 
     def get_entities_for_world_state(self) -> List[str]:
         with self._lock: return [e.entity_id for e in self.state.entities]
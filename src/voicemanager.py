@@ -4,6 +4,7 @@ Handles xVAsynth server startup, model loading, and voice synthesis
 """
 
 import subprocess
+import re
 import time
 import json
 import requests
@@ -11,10 +12,25 @@ import threading
 import os
 from pathlib import Path
 from datetime import datetime
-from queue import Queue
+from queue import Queue, Empty, Full
 import logging
 
 
+# Sentence boundary used to split replies into synthesis chunks
+SENTENCE_BOUNDARY = re.compile(r'(?<=[.!?])\s+')
+
+# Non-spoken markup stripped by VoiceManager._clean_text
+BRACKETED = re.compile(r'\[.*?\]')
+PARENTHESIZED = re.compile(r'\([^)]*\)')
+STAGE_DIRECTION = re.compile(r'\*[^*]*\*')
+WHITESPACE_RUN = re.compile(r'\s+')
+
+# Synthesis queue bounds: hard capacity, and the backlog past which the oldest
+# pending utterance is dropped so speech does not lag behind a burst of replies
+VOICE_QUEUE_SIZE = 32
+VOICE_QUEUE_BACKLOG = 4
+
+
 class VoiceManager:
     def __init__(self, logger=None):
         """Initialize VoiceManager with xVAsynth configuration"""
@@ -46,10 +62,11 @@ class VoiceManager:
         # Event callback for notifying when audio is ready
         self.on_audio_ready_callback = None
         
-        # Message queue for sequential synthesis
-        self.message_queue = Queue()
+        # Message queue for sequential synthesis (one long-lived worker thread)
+        self.message_queue = Queue(maxsize=VOICE_QUEUE_SIZE)
         self.queue_thread = None
         self.queue_running = False
+        self._queue_lock = threading.Lock()
         
         self.log("VoiceManager initialized")
     
@@ -705,13 +722,33 @@ class VoiceManager:
             self.log(f"System verification error: {e}", "ERROR")
             return False
     
-    def synthesize_voice(self, text, filename=None):
+    @staticmethod
+    def _clean_text(text):
+        """Strip stage directions and meta-commentary that must not be spoken"""
+        # Remove square brackets and their contents
+        clean_text = BRACKETED.sub('', text)
+
+        # SECURITY: Remove parentheses and their contents
+        # This prevents the AI from adding stage directions or meta-commentary
+        # that would be synthesized to speech
+        # Example: "hello (pause for a bit) how are you?" → "hello how are you?"
+        clean_text = PARENTHESIZED.sub('', clean_text)
+
+        # Remove asterisks and stage directions (e.g., *looks around*)
+        clean_text = STAGE_DIRECTION.sub('', clean_text)
+
+        # Clean up multiple spaces and strip
+        return WHITESPACE_RUN.sub(' ', clean_text).strip()
+
+    def synthesize_voice(self, text, filename=None, part=None, final=True):
         """
         Synthesize text to speech using loaded Assaultron model
 
         Args:
             text (str): Text to synthesize
             filename (str): Optional custom filename (without extension)
+            part (int): Chunk index when the reply is synthesized in several parts
+            final (bool): False for a chunk that is followed by more audio of the same reply
 
         Returns:
             str: Path to generated audio file, or None if failed
@@ -725,22 +762,7 @@ class VoiceManager:
 
         try:
             # Clean text for synthesis
-            import re
-
-            # Remove square brackets and their contents
-            clean_text = re.sub(r'\[.*?\]', '', text)
-
-            # SECURITY: Remove parentheses and their contents
-            # This prevents the AI from adding stage directions or meta-commentary
-            # that would be synthesized to speech
-            # Example: "hello (pause for a bit) how are you?" → "hello how are you?"
-            clean_text = re.sub(r'\([^)]*\)', '', clean_text)
-
-            # Remove asterisks and stage directions (e.g., *looks around*)
-            clean_text = re.sub(r'\*[^*]*\*', '', clean_text)
-
-            # Clean up multiple spaces and strip
-            clean_text = re.sub(r'\s+', ' ', clean_text).strip()
+            clean_text = self._clean_text(text)
 
             if not clean_text:
                 self.log("No text to synthesize after cleaning", "WARN")
@@ -837,7 +859,7 @@ class VoiceManager:
                 # Trigger callback to notify frontend
                 if self.on_audio_ready_callback:
                     try:
-                        self.on_audio_ready_callback(expected_file.name)
+                        self.on_audio_ready_callback(expected_file.name, part=part, final=final)
                     except Exception as e:
                         self.log(f"Audio ready callback error: {e}", "ERROR")
 
@@ -878,7 +900,28 @@ class VoiceManager:
         Args:
             text: Text to synthesize
         """
-        self.message_queue.put(text)
+        self._enqueue_job(lambda: self.synthesize_voice(text), text)
+
+    def _enqueue_job(self, job, text):
+        """
+        Queue a synthesis job for the worker thread, starting it if needed.
+
+        When more than VOICE_QUEUE_BACKLOG jobs are already waiting, the oldest
+        ones are dropped so the newest reply is not spoken long after the fact.
+        """
+        while self.message_queue.qsize() >= VOICE_QUEUE_BACKLOG:
+            try:
+                self.message_queue.get_nowait()
+                self.message_queue.task_done()
+                self.log("Synthesis backlog full, dropped oldest queued message", "WARN")
+            except Empty:
+                break
+
+        try:
+            self.message_queue.put_nowait(job)
+        except Full:
+            self.log(f"Synthesis queue full, dropped message: '{text[:50]}...'", "WARN")
+            return
         self.log(f"Message queued: '{text[:50]}...' (queue size: {self.message_queue.qsize()})")
 
         # Start queue processor if not running
@@ -887,28 +930,26 @@ class VoiceManager:
     
     def start_queue_processor(self):
         """Start the queue processor thread."""
-        if self.queue_running:
-            return
-        
-        self.queue_running = True
+        with self._queue_lock:
+            if self.queue_running:
+                return
+            self.queue_running = True
         
         def process_queue():
-            """Process messages from the queue sequentially."""
+            """Process synthesis jobs from the queue sequentially."""
             while self.queue_running:
                 try:
-                    # Get message from queue (blocks until available)
-                    text = self.message_queue.get(timeout=1)
-
-                    # Synthesize
-                    self.log(f"Processing queued message: '{text[:50]}...'")
-                    self.synthesize_voice(text)
-
-                    # Mark task as done
-                    self.message_queue.task_done()
+                    # Get job from queue (blocks until available)
+                    job = self.message_queue.get(timeout=1)
+                except Empty:
+                    continue
 
+                try:
+                    job()
                 except Exception as e:
-                    if "Empty" not in str(e):  # Ignore timeout exceptions
-                        self.log(f"Queue processor error: {e}", "ERROR")
+                    self.log(f"Queue processor error: {e}", "ERROR")
+                finally:
+                    self.message_queue.task_done()
         
         self.queue_thread = threading.Thread(target=process_queue, daemon=True)
         self.queue_thread.start()
@@ -922,14 +963,57 @@ class VoiceManager:
         self.log("Queue processor stopped")
     
     def synthesize_async(self, text):
-        """Synthesize voice asynchronously"""
+        """Synthesize voice in the background on the synthesis queue"""
+        self.enqueue_message(text)
+    
+    def synthesize_stream(self, text, min_chunk_chars=60):
+        """
+        Synthesize a reply sentence by sentence in the background.
+
+        The first sentence is synthesized on its own so playback can start
+        while the rest is still being generated; later sentences are merged
+        into chunks of at least min_chunk_chars to limit per-request overhead.
+        Each chunk fires the audio ready callback with its part index, and
+        final=True on the last one. If a chunk fails, the remaining chunks are
+        dropped and the callback fires once with no filename, final=True and
+        an error message. The chunks are synthesized as one job on
+        the synthesis queue, so they play in order and never interleave with
+        another reply.
+
+        Args:
+            text (str): Text to synthesize
+            min_chunk_chars (int): Minimum size of chunks after the first
+        """
+        # Clean before splitting so stage directions spanning sentences are removed whole
+        sentences = [s for s in SENTENCE_BOUNDARY.split(self._clean_text(text)) if s]
+
+        chunks = sentences[:1]
+        for sentence in sentences[1:]:
+            if len(chunks) > 1 and len(chunks[-1]) < min_chunk_chars:
+                chunks[-1] = f"{chunks[-1]} {sentence}"
+            else:
+                chunks.append(sentence)
+
         def synthesize():
-            self.synthesize_voice(text)
+            if len(chunks) <= 1:
+                self.synthesize_voice(text)
+                return
+            base = f"assaultron_voice_{datetime.now().strftime('%Y%m%d_%H%M%S_%f')}"
+            last = len(chunks) - 1
+            for index, chunk in enumerate(chunks):
+                if self.synthesize_voice(chunk, filename=f"{base}_part{index}", part=index, final=index == last):
+                    continue
+                # Close the reply so clients waiting for final=True don't hang
+                self.log(f"Voice chunk {index} failed, dropping the rest of the reply", "ERROR")
+                if self.on_audio_ready_callback:
+                    try:
+                        self.on_audio_ready_callback(None, part=index, final=True, error="Voice synthesis failed")
+                    except Exception as e:
+                        self.log(f"Audio ready callback error: {e}", "ERROR")
+                return
+
+        self._enqueue_job(synthesize, text)
 
-        thread = threading.Thread(target=synthesize, daemon=True)
-        thread.start()
-        return thread
-    
     def get_status(self):
         """Get comprehensive voice system status"""
         audio_url = None
@@ -0,0 +1,77 @@
+"""
+Background email jobs (main._submit_email_job)
+
+Importing main builds the full Assaultron core; the vision system is
+replaced with a stub so the tests need neither OpenCV nor a camera.
+"""
+
+import sys
+import time
+import types
+
+import pytest
+
+
+class StubVisionSystem:
+    """Inert VisionSystem: every method is a no-op returning None"""
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+_vision_stub = types.ModuleType("src.vision_system")
+_vision_stub.VisionSystem = StubVisionSystem
+sys.modules["src.vision_system"] = _vision_stub
+
+import main  # noqa: E402  (needs the vision stub in place)
+
+
+class RecordingCore:
+    """Stands in for main.assaultron and records log_event calls"""
+
+    def __init__(self):
+        self.events = []
+
+    def log_event(self, message, event_type="INFO", _ts=None):
+        self.events.append((event_type, message))
+
+
+def wait_for_job(job_id, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        record = main.email_jobs.get(job_id)
+        if record and record["status"] != "running":
+            return record
+        time.sleep(0.01)
+    pytest.fail(f"email job {job_id} did not finish")
+
+
+def test_failing_email_job_is_recorded_and_logged(monkeypatch):
+    core = RecordingCore()
+    monkeypatch.setattr(main, "assaultron", core)
+
+    job_id = main._submit_email_job("send", lambda: (False, "SMTP refused"), {"to": "evan@example.com"})
+    record = wait_for_job(job_id)
+
+    assert record["status"] == "failed"
+    assert record["error"] == "SMTP refused"
+    assert record["to"] == "evan@example.com"
+    assert core.events == [("ERROR", f"Email send job {job_id} failed: SMTP refused")]
+
+
+def test_raising_email_job_is_recorded_and_logged(monkeypatch):
+    core = RecordingCore()
+    monkeypatch.setattr(main, "assaultron", core)
+
+    def call():
+        raise ConnectionError("IMAP down")
+
+    job_id = main._submit_email_job("reply", call, {})
+    record = wait_for_job(job_id)
+
+    assert record["status"] == "failed"
+    assert record["error"] == "IMAP down"
+    assert core.events and core.events[0][0] == "ERROR"